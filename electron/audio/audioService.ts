@@ -7,7 +7,7 @@
 import { BrowserWindow } from 'electron';
 import naudiodon from 'naudiodon2';
 import { AudioProcessor } from './audioProcessor';
-import { AudioStreamClient, AudioStreamResponse } from './audioStreamClient';
+import { AudioStreamClient, AudioStreamEncoding, AudioStreamResponse } from './audioStreamClient';
 import { IPC_CHANNELS } from '../ipc/channels';
 import { AppVolumeController } from './appVolumeController';
 
@@ -26,7 +26,12 @@ export class AudioService {
     // AudioProcessor는 startMonitoring에서 실제 디바이스 샘플 레이트로 초기화됨
     // 임시로 48000으로 초기화 (실제로는 startMonitoring에서 재설정됨)
     this.processor = new AudioProcessor(48000, 16000);
-    this.streamClient = new AudioStreamClient('ws://127.0.0.1:8000/ws/audio');
+    // 결과만 바이너리 프레임으로 수신 (프레임마다 오던 buffering JSON 응답 생략)
+    // 서버가 다른 호스트에 있으면 AUDIO_STREAM_ENCODING=mulaw 로 업로드 대역폭을 절반으로 줄일 수 있음
+    this.streamClient = new AudioStreamClient('ws://127.0.0.1:8000/ws/audio', {
+      protocol: 'binary',
+      encoding: (process.env.AUDIO_STREAM_ENCODING as AudioStreamEncoding | undefined) ?? 'pcm16',
+    });
     this.volumeController = new AppVolumeController();
     
     if (initialWindow) {
@@ -2,11 +2,29 @@
  * Phase 2: WebSocket 오디오 스트리밍 클라이언트
  * 
  * FastAPI 서버로 오디오 데이터를 전송하고 응답을 수신합니다.
+ * protocol: 'binary'로 생성하면 서버가 buffering 응답 없이 결과만 바이너리 프레임으로 보냅니다.
+ * (형식: server/audio/result_protocol.py)
+ * encoding: 'mulaw' | 'alaw'로 생성하면 PCM 16-bit 대신 G.711 8-bit 코드로 보내 대역폭을 절반으로 줄입니다.
+ * (형식: server/audio/codecs.py)
  */
 
 import WebSocket from 'ws';
 import { EventEmitter } from 'events';
 
+export type AudioStreamProtocol = 'json' | 'binary';
+export type AudioStreamEncoding = 'pcm16' | 'mulaw' | 'alaw';
+
+export interface AudioStreamClientOptions {
+  protocol?: AudioStreamProtocol;
+  encoding?: AudioStreamEncoding;
+}
+
+// 바이너리 결과 프레임 헤더 (server/audio/result_protocol.py 와 동일해야 함)
+const RESULT_FRAME_VERSION = 1;
+const RESULT_HEADER_SIZE = 48;
+const FLAG_HARMFUL = 0x01;
+const FLAG_INTERIM = 0x02;
+
 export interface AudioStreamResponse {
   status?: string;
   text?: string;
@@ -18,6 +36,124 @@ export interface AudioStreamResponse {
   processing_time_ms?: number;
   detail?: string; // 에러 메시지
   message?: string; // 연결 확인 메시지
+  protocol?: AudioStreamProtocol; // 연결 확인 메시지: 협상된 결과 전송 형식
+  encoding?: AudioStreamEncoding; // 연결 확인 메시지: 수신 오디오 형식
+  sample_rate?: number; // 연결 확인 메시지: 서버 오디오 샘플 레이트
+  seq?: number; // 결과 순번
+  is_final?: boolean; // false면 live STT의 확정 전 중간 결과 (?interim=1 일 때만 전송)
+  start_sample?: number; // 결과가 다룬 오디오 구간 (절대 샘플 위치)
+  end_sample?: number;
+  first_frame?: number; // 결과 구간을 담고 있던 오디오 메시지 순번 (0부터)
+  last_frame?: number;
+  lag_sec?: number; // 서버 처리 지연 (초)
+}
+
+/**
+ * 바이너리 결과 프레임을 JSON 응답과 같은 형태로 변환한다.
+ */
+export function decodeResultFrame(data: Buffer, sampleRate = 16000): AudioStreamResponse {
+  if (data.length < RESULT_HEADER_SIZE) {
+    throw new Error(`Result frame too short: ${data.length} bytes`);
+  }
+  const version = data.readUInt8(0);
+  if (version !== RESULT_FRAME_VERSION) {
+    throw new Error(`Unsupported result frame version: ${version}`);
+  }
+
+  const flags = data.readUInt8(1);
+  const textLength = data.readUInt16LE(2);
+  const startSample = Number(data.readBigUInt64LE(16));
+  const endSample = Number(data.readBigUInt64LE(24));
+  const text = data.toString('utf8', RESULT_HEADER_SIZE, RESULT_HEADER_SIZE + textLength);
+
+  return {
+    status: 'ok',
+    text,
+    raw_text: text,
+    is_harmful: (flags & FLAG_HARMFUL) !== 0 ? 1 : 0,
+    confidence: data.readFloatLE(32),
+    processing_time_ms: data.readFloatLE(36),
+    lag_sec: data.readFloatLE(40),
+    seq: data.readUInt32LE(4),
+    is_final: (flags & FLAG_INTERIM) === 0,
+    first_frame: data.readUInt32LE(8),
+    last_frame: data.readUInt32LE(12),
+    start_sample: startSample,
+    end_sample: endSample,
+    audio_duration_sec: (endSample - startSample) / sampleRate,
+    timestamp: Date.now() / 1000, // JSON 응답과 같은 초 단위
+  };
+}
+
+// G.711 세그먼트 경계 (server/audio/codecs.py 와 동일)
+const MULAW_SEG_END = [0x3f, 0x7f, 0xff, 0x1ff, 0x3ff, 0x7ff, 0xfff, 0x1fff];
+const ALAW_SEG_END = [0x1f, 0x3f, 0x7f, 0xff, 0x1ff, 0x3ff, 0x7ff, 0xfff];
+
+function segmentOf(value: number, segEnd: number[]): number {
+  const seg = segEnd.findIndex((end) => value <= end);
+  return seg === -1 ? segEnd.length : seg;
+}
+
+function mulawCode(sample: number): number {
+  let pcm = sample >> 2;
+  const mask = pcm < 0 ? 0x7f : 0xff;
+  pcm = Math.min(Math.abs(pcm), 8159) + (0x84 >> 2);
+  const seg = segmentOf(pcm, MULAW_SEG_END);
+  const code = seg >= 8 ? 0x7f : (seg << 4) | ((pcm >> (seg + 1)) & 0x0f);
+  return code ^ mask;
+}
+
+function alawCode(sample: number): number {
+  let pcm = sample >> 3;
+  let mask = 0xd5;
+  if (pcm < 0) {
+    mask = 0x55;
+    pcm = -pcm - 1;
+  }
+  const seg = segmentOf(pcm, ALAW_SEG_END);
+  const code = seg >= 8 ? 0x7f : (seg << 4) | ((pcm >> (seg < 2 ? 1 : seg)) & 0x0f);
+  return code ^ mask;
+}
+
+// int16 샘플(uint16로 본 값) → 8-bit 코드 조회 테이블 (처음 사용할 때 생성)
+const encodeTables: Partial<Record<AudioStreamEncoding, Uint8Array>> = {};
+
+function encodeTable(encoding: 'mulaw' | 'alaw'): Uint8Array {
+  let table = encodeTables[encoding];
+  if (!table) {
+    const codeOf = encoding === 'mulaw' ? mulawCode : alawCode;
+    table = new Uint8Array(65536);
+    for (let value = 0; value < 65536; value++) {
+      table[value] = codeOf(value >= 32768 ? value - 65536 : value);
+    }
+    encodeTables[encoding] = table;
+  }
+  return table;
+}
+
+/**
+ * 리틀엔디언 PCM 16-bit 버퍼를 서버와 협상한 형식으로 인코딩한다.
+ */
+export function encodeAudio(pcm: Buffer, encoding: AudioStreamEncoding): Buffer {
+  if (encoding === 'pcm16') {
+    return pcm;
+  }
+  const table = encodeTable(encoding);
+  const encoded = Buffer.allocUnsafe(pcm.length >> 1);
+  for (let i = 0; i < encoded.length; i++) {
+    encoded[i] = table[pcm.readUInt16LE(i * 2)];
+  }
+  return encoded;
+}
+
+function toBuffer(data: WebSocket.RawData): Buffer {
+  if (Buffer.isBuffer(data)) {
+    return data;
+  }
+  if (Array.isArray(data)) {
+    return Buffer.concat(data);
+  }
+  return Buffer.from(data);
 }
 
 export class AudioStreamClient extends EventEmitter {
@@ -27,10 +163,33 @@ export class AudioStreamClient extends EventEmitter {
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000; // 1초
+  private protocol: AudioStreamProtocol;
+  private encoding: AudioStreamEncoding;
+  private sampleRate = 16000;
   
-  constructor(serverUrl = 'ws://127.0.0.1:8000/ws/audio') {
+  constructor(serverUrl = 'ws://127.0.0.1:8000/ws/audio', options: AudioStreamClientOptions = {}) {
     super();
-    this.serverUrl = serverUrl;
+    this.protocol = options.protocol ?? 'json';
+    this.encoding = options.encoding ?? 'pcm16';
+    this.serverUrl = AudioStreamClient.withOptions(serverUrl, this.protocol, this.encoding);
+  }
+
+  private static withOptions(
+    serverUrl: string,
+    protocol: AudioStreamProtocol,
+    encoding: AudioStreamEncoding,
+  ): string {
+    if (protocol === 'json' && encoding === 'pcm16') {
+      return serverUrl; // 서버 기본값
+    }
+    const url = new URL(serverUrl);
+    if (protocol !== 'json') {
+      url.searchParams.set('protocol', protocol);
+    }
+    if (encoding !== 'pcm16') {
+      url.searchParams.set('encoding', encoding);
+    }
+    return url.toString();
   }
   
   async connect(): Promise<void> {
@@ -45,7 +204,17 @@ export class AudioStreamClient extends EventEmitter {
           resolve();
         });
         
-        this.ws.on('message', (data: Buffer) => {
+        this.ws.on('message', (data: WebSocket.RawData, isBinary: boolean) => {
+          if (isBinary) {
+            // 바이너리 결과 프레임 (protocol=binary)
+            try {
+              this.emit('response', decodeResultFrame(toBuffer(data), this.sampleRate));
+            } catch (err) {
+              console.error('[AudioStreamClient] Failed to decode result frame:', err);
+            }
+            return;
+          }
+
           try {
             const text = data.toString();
             const response: AudioStreamResponse = JSON.parse(text);
@@ -53,6 +222,17 @@ export class AudioStreamClient extends EventEmitter {
             // 연결 확인 메시지 처리
             if (response.status === 'connected') {
               console.log('[AudioStreamClient] Server connection confirmed:', response.message || 'Connected');
+              if (response.sample_rate) {
+                this.sampleRate = response.sample_rate;
+              }
+              if (response.protocol && response.protocol !== this.protocol) {
+                // 서버가 요청한 형식을 지원하지 않으면 JSON으로 계속 수신
+                console.warn(`[AudioStreamClient] Server uses '${response.protocol}' protocol (requested '${this.protocol}')`);
+              }
+              if ((response.encoding ?? 'pcm16') !== this.encoding) {
+                // encoding을 모르는 이전 버전 서버는 PCM 16-bit로 해석하므로 알린다.
+                console.warn(`[AudioStreamClient] Server did not accept '${this.encoding}' audio encoding`);
+              }
               return;
             }
             
@@ -104,6 +284,9 @@ export class AudioStreamClient extends EventEmitter {
     });
   }
   
+  /**
+   * 16kHz PCM 16-bit 모노 버퍼를 전송한다. (encoding 옵션에 따라 전송 전에 인코딩)
+   */
   sendAudioChunk(audioBuffer: Buffer): void {
     if (this.ws && this.isConnected && this.ws.readyState === WebSocket.OPEN) {
       try {
@@ -113,7 +296,7 @@ export class AudioStreamClient extends EventEmitter {
           return;
         }
         
-        this.ws.send(audioBuffer);
+        this.ws.send(encodeAudio(audioBuffer, this.encoding));
       } catch (err) {
         console.error('[AudioStreamClient] Error sending audio chunk:', err);
         // 연결이 끊어진 경우 상태 업데이트
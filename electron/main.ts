@@ -1,4 +1,4 @@
-import { app, BrowserWindow, Menu, ipcMain, globalShortcut, desktopCapturer, screen } from 'electron';
+import { app, BrowserWindow, Menu, ipcMain, globalShortcut, desktopCapturer, screen, type NativeImage } from 'electron';
 import { createOverlayWindow, setExitEditModeAndHideHandler } from './windows/createOverlayWindow';
 import { createMainWindow } from './windows/createMainWindow';
 import { createTray } from './tray';
@@ -10,11 +10,16 @@ import { getROI, getMode, setMode } from './store';
 import * as fs from 'fs';
 import * as path from 'path';
 import * as dotenv from 'dotenv';
+import { randomUUID } from 'crypto';
 import { registerServerHandlers, checkServerConnection } from './ipc/serverHandlers';
 import { registerAudioHandlers, getAudioService } from './ipc/audioHandlers';
 import { setTrayAudioUpdateCallback } from './tray';
 
 const CAPTURE_INTERVAL_MS = 2000; // 2초 간격 (서버 OCR 처리 시간 고려)
+// 서버가 직전 OCR 프레임과 비교해 변화 없는 캡처의 OCR을 생략하도록 보내는 클라이언트 식별자
+const OCR_CLIENT_ID = `roi-${randomUUID()}`;
+// 무압축 픽셀(BGRA) 업로드 사용 여부. 서버가 거부하면(구버전 서버 등) PNG로 전환하고 유지한다.
+let rawUploadEnabled: boolean | null = null;
 
 let mainWindow: BrowserWindow | null = null;
 let overlayWindow: BrowserWindow | null = null;
@@ -121,15 +126,38 @@ app.whenReady().then(async () => {
     console.log('[Main] Sent STOP_MONITORING to renderer');
   };
 
+  /**
+   * 업로드 형식 결정: OCR_UPLOAD_FORMAT=raw|png, 지정하지 않으면 같은 PC의 서버(loopback)에만 raw.
+   * raw는 PNG 인코딩(클라이언트)과 디코딩(서버)을 생략하지만 업로드 크기가 커서 원격 서버에는 PNG가 낫다.
+   */
+  const shouldUploadRaw = (serverUrl: string): boolean => {
+    if (rawUploadEnabled === null) {
+      const format = (process.env.OCR_UPLOAD_FORMAT || '').toLowerCase();
+      if (format === 'raw' || format === 'png') {
+        rawUploadEnabled = format === 'raw';
+      } else {
+        try {
+          const { hostname } = new URL(serverUrl);
+          rawUploadEnabled = ['127.0.0.1', 'localhost', '::1', '[::1]'].includes(hostname);
+        } catch {
+          rawUploadEnabled = false;
+        }
+      }
+      console.log(`[OCR] 업로드 형식: ${rawUploadEnabled ? 'raw (BGRA)' : 'png'}`);
+    }
+    return rawUploadEnabled;
+  };
+
   /**
    * 이미지를 서버로 전송하여 OCR + 분석 수행
    */
-  const sendImageToServer = async (imageBuffer: Buffer): Promise<{
+  const sendImageToServer = async (image: NativeImage): Promise<{
     success: boolean;
     data?: {
       texts: string[];
       is_harmful: boolean;
       harmful_words: string[];
+      unchanged?: boolean;
       processing_time: { ocr: number; analysis: number; total: number };
     };
     error?: string;
@@ -139,17 +167,58 @@ app.whenReady().then(async () => {
     const SERVER_URL = process.env.SERVER_URL || 'http://127.0.0.1:8000';
     const REQUEST_TIMEOUT = 5000;
 
-    try {
+    const post = (raw: boolean) => {
       const formData = new FormData();
-      formData.append('file', imageBuffer, {
-        filename: 'screenshot.png',
-        contentType: 'image/png',
-      });
+      let headers: Record<string, string | number> = {};
+      if (raw) {
+        // toBitmap()은 행 사이 여백 없는 BGRA 픽셀 (리틀 엔디언 플랫폼 기본 형식)
+        const { width, height } = image.getSize();
+        const bitmap = image.toBitmap();
+        formData.append('file', bitmap, {
+          filename: 'screenshot.bgra',
+          contentType: 'image/x-raw-bgra',
+        });
+        headers = {
+          'X-Image-Width': width,
+          'X-Image-Height': height,
+          'X-Image-Stride': width * 4,
+        };
+        console.log(`[OCR] 서버로 이미지 전송 중... (raw ${width}x${height}, ${bitmap.length} bytes)`);
+      } else {
+        const png = image.toPNG();
+        formData.append('file', png, {
+          filename: 'screenshot.png',
+          contentType: 'image/png',
+        });
+        console.log(`[OCR] 서버로 이미지 전송 중... (크기: ${png.length} bytes)`);
+      }
 
-      const response = await axios.post(`${SERVER_URL}/api/ocr-and-analyze`, formData, {
-        headers: formData.getHeaders(),
+      return axios.post(`${SERVER_URL}/api/ocr-and-analyze`, formData, {
+        params: { client_id: OCR_CLIENT_ID },
+        headers: { ...formData.getHeaders(), ...headers },
         timeout: REQUEST_TIMEOUT,
       });
+    };
+
+    try {
+      let response;
+      if (shouldUploadRaw(SERVER_URL)) {
+        try {
+          response = await post(true);
+        } catch (error: any) {
+          // 서버가 무압축 형식을 지원하지 않는다고 응답한 경우에만 PNG로 전환한다.
+          // (일시적인 OCR 오류 500, 과부하 503, 타임아웃, 연결 실패는 그대로 실패 처리)
+          const status = error?.response?.status;
+          if (![400, 415, 422].includes(status)) {
+            throw error;
+          }
+          console.warn(`[OCR] 서버가 무압축 업로드를 거부함 (HTTP ${status}), PNG로 전환합니다.`);
+          rawUploadEnabled = false;
+          response = await post(false);
+        }
+      } else {
+        response = await post(false);
+      }
 
       return {
         success: true,
@@ -228,20 +297,20 @@ app.whenReady().then(async () => {
         height: cropHeight,
       });
 
-      // 3. PNG Buffer로 변환
-      const imageBuffer = croppedImage.toPNG();
-
-      // 4. 서버로 OCR + 분석 요청
-      console.log(`[OCR] 서버로 이미지 전송 중... (크기: ${imageBuffer.length} bytes)`);
-      const result = await sendImageToServer(imageBuffer);
+      // 3. 서버로 OCR + 분석 요청 (무압축 BGRA 또는 PNG, sendImageToServer에서 결정)
+      const result = await sendImageToServer(croppedImage);
 
       if (result.success && result.data) {
-        const { texts, is_harmful, harmful_words, processing_time } = result.data;
+        const { texts, is_harmful, harmful_words, processing_time, unchanged } = result.data;
         
-        console.log(`[OCR] 추출 완료: ${texts.length}개 텍스트, 총 ${processing_time.total.toFixed(3)}초 (OCR: ${processing_time.ocr.toFixed(3)}초, 분석: ${processing_time.analysis.toFixed(3)}초)`);
+        if (unchanged) {
+          console.log(`[OCR] 화면 변화 없음: 직전 텍스트 재분석 (${texts.length}개, 총 ${processing_time.total.toFixed(3)}초)`);
+        } else {
+          console.log(`[OCR] 추출 완료: ${texts.length}개 텍스트, 총 ${processing_time.total.toFixed(3)}초 (OCR: ${processing_time.ocr.toFixed(3)}초, 분석: ${processing_time.analysis.toFixed(3)}초)`);
+        }
         console.log(`[OCR] 텍스트: ${texts.join(' ')}`);
         
-        // 5. 유해성 감지 시 알림 (harmful=true/false 모두 전송)
+        // 4. 유해성 감지 시 알림 (harmful=true/false 모두 전송)
         if (overlayWindow && !overlayWindow.isDestroyed()) {
           if (is_harmful) {
             console.warn(`[OCR] 🚨 유해 표현 감지: ${harmful_words.join(', ')}`);
@@ -1,12 +1,29 @@
 """
 Phase 1: 오디오 버퍼 관리 클래스 구현.
+
+수신한 PCM 16-bit 샘플을 미리 할당한 고정 크기 int16 링 버퍼에 벡터 연산으로 복사하고,
+청크를 꺼낼 때는 재사용하는 float32 출력 버퍼에 바로 변환한다.
+세션당 메모리는 링 버퍼 용량(max_buffer_sec)으로 상한이 정해진다.
+
+hop_duration_sec를 청크 길이보다 짧게 주면 겹치는 슬라이딩 윈도우 모드로 동작한다.
+이 모드에서는 샘플을 기록할 때 한 번만 float32로 변환해 두 벌(미러)로 저장하므로,
+겹치는 윈도우는 복사 없이 링 버퍼의 연속된 뷰로 반환된다.
+
+encoding이 μ-law/A-law이면 수신한 1바이트 코드를 조회 테이블로 링 버퍼에 바로 디코딩한다.
 """
 
-from collections import deque
-from typing import Deque, Optional
+from typing import Dict, Optional
 
 import numpy as np
 
+from .codecs import ENCODING_PCM16, get_encoding
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_REJECT = "reject"
+_OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_REJECT)
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
 
 class AudioBufferManager:
     """
@@ -14,56 +31,301 @@ class AudioBufferManager:
     STT 엔진이 필요로 하는 float32(-1.0 ~ 1.0) 배열로 변환하는 관리 클래스.
     """
 
-    def __init__(self, sample_rate: int = 16_000, chunk_duration_sec: float = 1.0) -> None:
+    def __init__(
+        self,
+        sample_rate: int = 16_000,
+        chunk_duration_sec: float = 1.0,
+        *,
+        hop_duration_sec: Optional[float] = None,
+        max_buffer_sec: Optional[float] = None,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        encoding: str = ENCODING_PCM16,
+    ) -> None:
         """
         Args:
             sample_rate: 오디오 샘플링 레이트 (Hz)
-            chunk_duration_sec: 처리할 청크 길이 (초)
+            chunk_duration_sec: 처리할 청크(윈도우) 길이 (초)
+            hop_duration_sec: 다음 윈도우까지 이동할 길이 (초).
+                None이면 청크 길이와 같아 겹치지 않는 블록으로 자른다.
+            max_buffer_sec: 링 버퍼 최대 길이 (초). None이면 청크 길이의 4배 (최소 10초)
+            overflow_policy: 버퍼가 가득 찼을 때의 동작
+                - "drop_oldest": 가장 오래된 샘플을 버리고 새 샘플을 쓴다.
+                - "reject": 새로 들어온 데이터를 통째로 버린다.
+            encoding: add_chunk로 받는 바이너리 형식 ("pcm16" | "mulaw" | "alaw")
         """
 
         if sample_rate <= 0:
             raise ValueError("sample_rate must be positive.")
         if chunk_duration_sec <= 0:
             raise ValueError("chunk_duration_sec must be positive.")
+        if overflow_policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {_OVERFLOW_POLICIES}.")
 
         self.sample_rate = sample_rate
         self.chunk_size = int(sample_rate * chunk_duration_sec)
-        self.buffer: Deque[int] = deque()
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_duration_sec is too short for the sample rate.")
+
+        if max_buffer_sec is None:
+            max_buffer_sec = max(chunk_duration_sec * 4, 10.0)
+        self.capacity = int(sample_rate * max_buffer_sec)
+        if self.capacity < self.chunk_size:
+            raise ValueError("max_buffer_sec must be at least chunk_duration_sec.")
+
+        if hop_duration_sec is None:
+            self.hop_size = self.chunk_size
+        else:
+            if hop_duration_sec <= 0:
+                raise ValueError("hop_duration_sec must be positive.")
+            self.hop_size = int(sample_rate * hop_duration_sec)
+            if not 0 < self.hop_size <= self.chunk_size:
+                raise ValueError("hop_duration_sec must not exceed chunk_duration_sec.")
+        self.sliding = self.hop_size < self.chunk_size
+
+        self.overflow_policy = overflow_policy
+        self.encoding = get_encoding(encoding)
+        self._read_pos = 0
+        self._size = 0
+        if self.sliding:
+            # ring[i]와 ring[i + capacity]에 같은 값을 저장해 어느 위치에서 시작하는
+            # 윈도우든 연속된 뷰로 꺼낼 수 있게 한다.
+            self._ring = np.zeros(self.capacity * 2, dtype=np.float32)
+            self._output = None
+            # 코드 → 링 버퍼 dtype 값 조회 테이블 (링 버퍼가 float32이므로 미리 정규화)
+            self._decode_table = (
+                None
+                if self.encoding.table is None
+                else (self.encoding.table * _INT16_SCALE).astype(np.float32)
+            )
+        else:
+            self._ring = np.zeros(self.capacity, dtype=np.int16)
+            # get_processed_chunk가 반환하는 재사용 출력 버퍼
+            self._output = np.empty(self.chunk_size, dtype=np.float32)
+            self._decode_table = self.encoding.table
+        # read_frames용 출력 버퍼 (처음 사용할 때 할당)
+        self._frame_output: Optional[np.ndarray] = None
+
+        # 스트림 시작 이후의 절대 샘플 위치 (버퍼에 받아들인 샘플 기준)
+        # write_offset - read_offset == 현재 버퍼에 쌓인 샘플 수
+        self.read_offset = 0
+        self.write_offset = 0
+
+        self.dropped_samples = 0
+        self.rejected_samples = 0
+
+    @property
+    def available(self) -> int:
+        """현재 버퍼에 쌓인 샘플 수."""
+
+        return self._size
+
+    @property
+    def bytes_per_sample(self) -> int:
+        """add_chunk로 받는 바이너리의 샘플당 바이트 수."""
 
-    def add_chunk(self, audio_bytes: bytes) -> None:
+        return self.encoding.bytes_per_sample
+
+    def add_chunk(self, audio_bytes: bytes) -> int:
         """
-        PCM 16-bit 바이너리 오디오 데이터를 버퍼에 추가한다.
+        encoding 형식의 바이너리 오디오 데이터를 버퍼에 추가한다.
 
         Args:
-            audio_bytes: 리틀엔디언 PCM 16-bit( signed int16 ) 바이너리
+            audio_bytes: 리틀엔디언 PCM 16-bit( signed int16 ) 바이너리,
+                또는 μ-law/A-law 1바이트 코드열
+
+        Returns:
+            버퍼에 기록된 샘플 수 (reject 정책으로 버려지면 0)
         """
 
         if not audio_bytes:
-            return
+            return 0
 
-        audio_np = np.frombuffer(audio_bytes, dtype=np.int16)
+        if self._decode_table is None:
+            return self.add_samples(np.frombuffer(audio_bytes, dtype=np.int16))
+        return self._add(np.frombuffer(audio_bytes, dtype=np.uint8), self._decode_table)
 
-        # deque에 int16 값을 바로 저장 (popleft할 때 변환 없이 사용)
-        self.buffer.extend(audio_np.tolist())
+    def add_samples(self, samples: np.ndarray) -> int:
+        """
+        int16 샘플 배열을 링 버퍼에 복사한다. (최대 두 번의 슬라이스 대입)
+        """
+
+        return self._add(samples, None)
+
+    def _add(self, samples: np.ndarray, table: Optional[np.ndarray]) -> int:
+        """
+        samples(table이 있으면 조회 테이블 인덱스)를 링 버퍼에 기록한다.
+        """
+
+        count = len(samples)
+        if count == 0:
+            return 0
+
+        free = self.capacity - self._size
+        if count > free:
+            if self.overflow_policy == OVERFLOW_REJECT:
+                self.rejected_samples += count
+                return 0
+            overflow = count - free
+            skipped = 0
+            if count > self.capacity:
+                # 한 번에 용량보다 많이 들어오면 마지막 capacity개만 남는다.
+                skipped = count - self.capacity
+                samples = samples[-self.capacity:]
+            discard = min(overflow, self._size)
+            self._read_pos = (self._read_pos + discard) % self.capacity
+            self._size -= discard
+            self.read_offset += discard + skipped
+            self.dropped_samples += overflow
+
+        self.write_offset += count
+        count = len(samples)
+        write_pos = (self._read_pos + self._size) % self.capacity
+        first = min(count, self.capacity - write_pos)
+        self._write(write_pos, samples[:first], table)
+        if first < count:
+            self._write(0, samples[first:], table)
+        self._size += count
+        return count
+
+    def _write(self, pos: int, samples: np.ndarray, table: Optional[np.ndarray] = None) -> None:
+        end = pos + len(samples)
+        primary = self._ring[pos:end]
+        if table is not None:
+            # uint8 코드는 항상 256개 테이블 범위 안이므로 mode="clip"으로 out 버퍼링을 피한다.
+            np.take(table, samples, out=primary, mode="clip")
+        elif self.sliding:
+            np.multiply(samples, _INT16_SCALE, out=primary, casting="unsafe")
+        else:
+            primary[:] = samples
+        if self.sliding:
+            self._ring[pos + self.capacity:end + self.capacity] = primary
 
     def get_processed_chunk(self) -> Optional[np.ndarray]:
         """
         chunk_size 만큼 샘플이 쌓이면 float32 정규화 배열을 반환한다.
         누적 샘플이 부족한 경우 None을 반환한다.
+
+        반환 후 hop_size만큼 앞으로 이동하므로, 슬라이딩 모드에서는 다음 윈도우가
+        이번 윈도우의 뒤쪽 (chunk_size - hop_size) 샘플과 겹친다.
+
+        반환 배열은 내부 버퍼(출력 버퍼 또는 링 버퍼 뷰)를 재사용하므로 다음
+        add_chunk/get_processed_chunk 호출 전까지만 유효하다.
+        더 오래 보관하려면 호출자가 복사해야 한다.
+        """
+
+        if self._size < self.chunk_size:
+            return None
+
+        if self.sliding:
+            start = self._read_pos
+            window = self._ring[start:start + self.chunk_size]
+            self._read_pos = (start + self.hop_size) % self.capacity
+            self._size -= self.hop_size
+            self.read_offset += self.hop_size
+            return window
+
+        return self._consume(self.chunk_size, self._output)
+
+    def read_frames(self, frame_size: int) -> Optional[np.ndarray]:
         """
+        쌓인 샘플 중 frame_size의 배수만큼을 한 번에 꺼내 float32 배열로 반환한다.
+        (VAD처럼 고정 청크 대신 프레임 단위로 스트림을 소비하는 경우에 사용)
 
-        if len(self.buffer) < self.chunk_size:
+        반환 배열은 get_processed_chunk와 마찬가지로 다음 호출 전까지만 유효하다.
+        """
+
+        if self.sliding:
+            raise RuntimeError("read_frames is not available in sliding-window mode.")
+        if frame_size <= 0:
+            raise ValueError("frame_size must be positive.")
+
+        count = (self._size // frame_size) * frame_size
+        if count == 0:
             return None
+        if self._frame_output is None:
+            self._frame_output = np.empty(self.capacity, dtype=np.float32)
+        return self._consume(count, self._frame_output[:count])
 
-        samples = [self.buffer.popleft() for _ in range(self.chunk_size)]
-        audio_chunk = np.array(samples, dtype=np.float32) / 32768.0
+    def read_coalesced(self, max_samples: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        처리가 밀렸을 때 준비된 청크들을 하나의 연속 구간으로 꺼낸다. (STT 호출 횟수 감소)
 
-        return audio_chunk
+        - 고정 청크 모드: 쌓인 완전한 청크 전부(최대 max_samples)를 이어 붙여 반환한다.
+        - 슬라이딩 모드: 쌓인 샘플 전체를 링 버퍼 뷰로 반환하고, 다음 윈도우와 겹칠
+          (chunk_size - hop_size) 샘플만 남긴다.
+
+        Returns:
+            청크가 하나도 준비되지 않았으면 None
+        """
+
+        if self._size < self.chunk_size:
+            return None
+        limit = self._size if max_samples is None else max(min(self._size, max_samples), self.chunk_size)
+
+        if not self.sliding:
+            count = (limit // self.chunk_size) * self.chunk_size
+            if self._frame_output is None:
+                self._frame_output = np.empty(self.capacity, dtype=np.float32)
+            return self._consume(count, self._frame_output[:count])
+
+        start = self._read_pos
+        span = self._ring[start:start + limit]
+        advance = limit - (self.chunk_size - self.hop_size)
+        self._read_pos = (start + advance) % self.capacity
+        self._size -= advance
+        self.read_offset += advance
+        return span
+
+    def discard(self, count: int) -> int:
+        """
+        가장 오래된 샘플을 최대 count개 버린다. (처리 지연 시 라이브 지점으로 건너뛰기용)
+
+        Returns:
+            실제로 버린 샘플 수
+        """
+
+        count = max(0, min(count, self._size))
+        self._read_pos = (self._read_pos + count) % self.capacity
+        self._size -= count
+        self.read_offset += count
+        self.dropped_samples += count
+        return count
+
+    def _consume(self, count: int, output: np.ndarray) -> np.ndarray:
+        start = self._read_pos
+        first = min(count, self.capacity - start)
+        # int16 → float32 변환을 출력 버퍼에 바로 기록 (중간 배열 없음)
+        np.multiply(self._ring[start:start + first], _INT16_SCALE, out=output[:first], casting="unsafe")
+        if first < count:
+            np.multiply(self._ring[:count - first], _INT16_SCALE, out=output[first:count], casting="unsafe")
+
+        self._read_pos = (start + count) % self.capacity
+        self._size -= count
+        self.read_offset += count
+        return output
 
     def reset(self) -> None:
         """
         버퍼를 완전히 초기화한다.
         """
 
-        self.buffer.clear()
+        self._read_pos = 0
+        self._size = 0
+        self.read_offset = self.write_offset
+
+    def stats(self) -> Dict[str, float]:
+        """
+        버퍼 사용량/유실 샘플 관측용 카운터를 반환한다.
+        """
 
+        return {
+            "buffered_samples": self._size,
+            "capacity_samples": self.capacity,
+            "window_samples": self.chunk_size,
+            "hop_samples": self.hop_size,
+            "buffered_sec": self._size / self.sample_rate,
+            "overflow_policy": self.overflow_policy,
+            "encoding": self.encoding.name,
+            "dropped_samples": self.dropped_samples,
+            "rejected_samples": self.rejected_samples,
+        }
@@ -0,0 +1,105 @@
+"""
+/ws/audio 수신 오디오 인코딩 (G.711 μ-law / A-law).
+
+기본 전송 형식은 16kHz PCM 16-bit (256 kbit/s)이다. 클라이언트가 `?encoding=mulaw` 또는
+`?encoding=alaw`로 연결하면 샘플당 1바이트(128 kbit/s)로 보내고, 서버는 256개 항목의
+조회 테이블로 디코딩한다. 디코딩은 AudioBufferManager가 링 버퍼에 바로 쓰므로 중간 배열이
+생기지 않는다. (np.take(table, codes, out=ring_slice))
+
+인코더는 클라이언트 구현과 테스트의 기준 구현이다. (ITU-T G.711, Sun g711.c와 동일한 결과)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+ENCODING_PCM16 = "pcm16"
+ENCODING_MULAW = "mulaw"
+ENCODING_ALAW = "alaw"
+ENCODINGS = (ENCODING_PCM16, ENCODING_MULAW, ENCODING_ALAW)
+
+# 세그먼트 경계 (Sun g711.c의 seg_uend / seg_aend)
+_MULAW_SEG_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+_ALAW_SEG_END = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF], dtype=np.int32)
+_MULAW_BIAS = 0x84
+_MULAW_CLIP = 8159
+
+
+def _mulaw_table() -> np.ndarray:
+    code = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = (((mantissa << 3) + _MULAW_BIAS) << exponent) - _MULAW_BIAS
+    return np.where(code & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+def _alaw_table() -> np.ndarray:
+    code = np.arange(256, dtype=np.int32) ^ 0x55
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = np.where(
+        exponent == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0),
+    )
+    return np.where(code & 0x80, magnitude, -magnitude).astype(np.int16)
+
+
+# 코드(uint8) → int16 샘플
+MULAW_TABLE = _mulaw_table()
+ALAW_TABLE = _alaw_table()
+
+
+@dataclass(frozen=True)
+class AudioEncoding:
+    """수신 오디오 인코딩 정보."""
+
+    name: str
+    bytes_per_sample: int
+    # 1바이트 코드 → int16 샘플 조회 테이블 (PCM이면 None)
+    table: Optional[np.ndarray] = None
+
+
+_ENCODINGS = {
+    ENCODING_PCM16: AudioEncoding(ENCODING_PCM16, 2),
+    ENCODING_MULAW: AudioEncoding(ENCODING_MULAW, 1, MULAW_TABLE),
+    ENCODING_ALAW: AudioEncoding(ENCODING_ALAW, 1, ALAW_TABLE),
+}
+
+
+def get_encoding(name: str) -> AudioEncoding:
+    """
+    인코딩 이름으로 정보를 찾는다. 지원하지 않는 이름이면 ValueError.
+    """
+
+    try:
+        return _ENCODINGS[name]
+    except KeyError:
+        raise ValueError(f"encoding must be one of {ENCODINGS}.") from None
+
+
+def encode_mulaw(samples: np.ndarray) -> np.ndarray:
+    """int16 샘플을 μ-law 코드(uint8)로 인코딩한다."""
+
+    pcm = samples.astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    pcm = np.minimum(np.abs(pcm), _MULAW_CLIP) + (_MULAW_BIAS >> 2)
+    seg = np.searchsorted(_MULAW_SEG_END, pcm)
+    code = np.where(seg >= 8, 0x7F, (np.minimum(seg, 7) << 4) | ((pcm >> (seg + 1)) & 0x0F))
+    return (code ^ mask).astype(np.uint8)
+
+
+def encode_alaw(samples: np.ndarray) -> np.ndarray:
+    """int16 샘플을 A-law 코드(uint8)로 인코딩한다."""
+
+    pcm = samples.astype(np.int32) >> 3
+    negative = pcm < 0
+    mask = np.where(negative, 0x55, 0xD5)
+    pcm = np.where(negative, -pcm - 1, pcm)
+    seg = np.searchsorted(_ALAW_SEG_END, pcm)
+    shift = np.where(seg < 2, 1, seg)
+    code = np.where(seg >= 8, 0x7F, (np.minimum(seg, 7) << 4) | ((pcm >> shift) & 0x0F))
+    return (code ^ mask).astype(np.uint8)
@@ -0,0 +1,284 @@
+"""
+Deepgram 실시간(live) 스트리밍 STT 세션.
+
+/ws/audio 연결 하나당 Deepgram live 소켓(wss://api.deepgram.com/v1/listen) 하나를 열어 두고,
+수신한 오디오 바이너리를 컨테이너(WAV) 변환 없이 그대로 보낸다. Deepgram이 보내는
+중간(interim) / 확정(final) 인식 결과는 receive()로 순서대로 꺼낸다.
+
+청크마다 HTTP 요청을 새로 만드는 DeepgramSTTService.transcribe와 달리 연결 수립/컨테이너
+오버헤드가 세션당 한 번뿐이고, 발화 경계 판단(endpointing)도 Deepgram이 한다.
+
+url을 바꾸면 같은 메시지 형식을 흉내 내는 로컬 서버로 테스트할 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from .codecs import ENCODING_ALAW, ENCODING_MULAW, ENCODING_PCM16, get_encoding
+
+logger = logging.getLogger(__name__)
+
+DEEPGRAM_LIVE_URL = "wss://api.deepgram.com/v1/listen"
+
+# 서버 수신 인코딩 이름 → Deepgram encoding 파라미터
+_DEEPGRAM_ENCODINGS = {ENCODING_PCM16: "linear16", ENCODING_MULAW: "mulaw", ENCODING_ALAW: "alaw"}
+
+
+class DeepgramLiveError(RuntimeError):
+    """Deepgram live 소켓 연결/통신 실패."""
+
+
+@dataclass
+class LiveTranscript:
+    """Deepgram live 인식 결과 하나."""
+
+    text: str
+    is_final: bool
+    start_sec: float  # 스트림 시작 기준 구간 시작 (초)
+    duration_sec: float
+    speech_final: bool = False  # Deepgram이 발화 끝(endpoint)으로 판단한 결과
+
+    @property
+    def end_sec(self) -> float:
+        return self.start_sec + self.duration_sec
+
+
+class DeepgramLiveSession:
+    """
+    Deepgram live 소켓 하나의 송신/수신 관리.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        model: str = "nova-2",
+        language: str = "ko",
+        sample_rate: int = 16_000,
+        encoding: str = ENCODING_PCM16,
+        interim_results: bool = True,
+        endpointing_ms: Optional[int] = 300,
+        keepalive_sec: float = 5.0,
+        connect_timeout_sec: float = 10.0,
+        url: str = DEEPGRAM_LIVE_URL,
+    ) -> None:
+        """
+        Args:
+            api_key: Deepgram API 키
+            model: Deepgram 모델 이름
+            language: 인식 언어 코드
+            sample_rate: 보낼 오디오의 샘플링 레이트
+            encoding: 보낼 오디오 형식 ("pcm16" | "mulaw" | "alaw", /ws/audio에서 협상한 값)
+            interim_results: 확정 전 중간 결과도 받을지 여부
+            endpointing_ms: 발화 종료로 볼 무음 길이 (None이면 Deepgram 기본값)
+            keepalive_sec: 오디오를 보내지 않는 동안 KeepAlive를 보낼 간격
+                (Deepgram은 약 10초 동안 데이터가 없으면 연결을 닫는다.)
+            connect_timeout_sec: 연결 수립 제한 시간
+            url: live API 주소 (테스트용 로컬 서버로 바꿀 수 있음)
+        """
+
+        if encoding not in _DEEPGRAM_ENCODINGS:
+            raise ValueError(f"encoding must be one of {tuple(_DEEPGRAM_ENCODINGS)}.")
+
+        self.api_key = api_key
+        self.sample_rate = sample_rate
+        self._bytes_per_sample = get_encoding(encoding).bytes_per_sample
+        self.keepalive_sec = keepalive_sec
+        self.connect_timeout_sec = connect_timeout_sec
+        params: Dict[str, Any] = {
+            "model": model,
+            "language": language,
+            "encoding": _DEEPGRAM_ENCODINGS[encoding],
+            "sample_rate": sample_rate,
+            "channels": 1,
+            "interim_results": str(interim_results).lower(),
+            "punctuate": "false",
+            "smart_format": "false",
+        }
+        if endpointing_ms is not None:
+            params["endpointing"] = endpointing_ms
+        self.url = f"{url}?{urlencode(params)}"
+
+        self._connection = None
+        self._transcripts: "asyncio.Queue[Optional[LiveTranscript]]" = asyncio.Queue()
+        self._reader: Optional[asyncio.Task] = None
+        self._keepalive: Optional[asyncio.Task] = None
+        self._last_send = 0.0
+        self._closing = False
+        self.error: Optional[BaseException] = None
+
+        self.sent_bytes = 0
+        self.interim_results = 0
+        self.final_results = 0
+        self.connected_at: Optional[float] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def start(self) -> None:
+        """
+        live 소켓을 연결하고 수신/KeepAlive 태스크를 시작한다.
+        """
+
+        try:
+            from websockets.asyncio.client import connect
+        except ImportError as exc:
+            raise DeepgramLiveError(
+                "websockets 패키지가 설치되어 있지 않습니다. `pip install websockets>=13`을 실행하세요."
+            ) from exc
+
+        try:
+            self._connection = await asyncio.wait_for(
+                connect(
+                    self.url,
+                    additional_headers={"Authorization": f"Token {self.api_key}"},
+                    max_size=None,
+                ),
+                timeout=self.connect_timeout_sec,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            raise DeepgramLiveError(f"Deepgram live 연결 실패: {exc}") from exc
+
+        self.connected_at = time.time()
+        self._last_send = time.monotonic()
+        self._reader = asyncio.create_task(self._read_loop())
+        if self.keepalive_sec > 0:
+            self._keepalive = asyncio.create_task(self._keepalive_loop())
+        logger.info("[Deepgram] Live session connected")
+
+    async def send_audio(self, audio_bytes: bytes) -> None:
+        """
+        오디오 바이너리를 그대로 보낸다. 연결이 끊겼으면 DeepgramLiveError.
+        """
+
+        if not audio_bytes:
+            return
+        if self._connection is None or not self.connected:
+            raise DeepgramLiveError("Deepgram live session is not connected.") from self.error
+        try:
+            await self._connection.send(audio_bytes)
+        except Exception as exc:  # pylint: disable=broad-except
+            raise DeepgramLiveError(f"Deepgram live 전송 실패: {exc}") from exc
+        self._last_send = time.monotonic()
+        self.sent_bytes += len(audio_bytes)
+
+    async def receive(self) -> Optional[LiveTranscript]:
+        """
+        다음 인식 결과를 기다린다. 연결이 끝나면 None.
+        """
+
+        return await self._transcripts.get()
+
+    async def finish(self, timeout_sec: float = 5.0) -> None:
+        """
+        CloseStream을 보내 남은 오디오의 확정 결과를 받은 뒤 연결을 닫는다.
+        """
+
+        if self._connection is None or self._closing:
+            return
+        self._closing = True
+        try:
+            if self.connected:
+                await self._connection.send(json.dumps({"type": "CloseStream"}))
+                await asyncio.wait_for(asyncio.shield(self._reader), timeout=timeout_sec)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("[Deepgram] Live session did not finish cleanly: %s", exc)
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        결과를 기다리지 않고 연결을 닫는다.
+        """
+
+        self._closing = True
+        for task in (self._keepalive, self._reader):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._connection is not None:
+            try:
+                await self._connection.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+        for task in (self._keepalive, self._reader):
+            if task is not None:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):  # pylint: disable=broad-except
+                    pass
+        # 수신 태스크가 취소되어 종료 표시를 넣지 못했을 수 있다.
+        self._transcripts.put_nowait(None)
+
+    async def _read_loop(self) -> None:
+        try:
+            async for message in self._connection:
+                if isinstance(message, bytes):
+                    continue
+                transcript = self._parse(message)
+                if transcript is not None:
+                    self._transcripts.put_nowait(transcript)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            if not self._closing:
+                self.error = exc
+                logger.warning("[Deepgram] Live session closed unexpectedly: %s", exc)
+        finally:
+            self._transcripts.put_nowait(None)
+
+    def _parse(self, message: str) -> Optional[LiveTranscript]:
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            logger.warning("[Deepgram] Ignoring non-JSON live message: %s", message[:100])
+            return None
+
+        message_type = payload.get("type")
+        if message_type == "Error" or "err_code" in payload:
+            logger.error("[Deepgram] Live API error: %s", payload)
+            return None
+        if message_type != "Results":
+            # Metadata / SpeechStarted / UtteranceEnd 등은 사용하지 않는다.
+            return None
+
+        alternatives = payload.get("channel", {}).get("alternatives") or [{}]
+        text = (alternatives[0].get("transcript") or "").strip()
+        if not text:
+            return None
+        is_final = bool(payload.get("is_final"))
+        if is_final:
+            self.final_results += 1
+        else:
+            self.interim_results += 1
+        return LiveTranscript(
+            text=text,
+            is_final=is_final,
+            start_sec=float(payload.get("start", 0.0)),
+            duration_sec=float(payload.get("duration", 0.0)),
+            speech_final=bool(payload.get("speech_final")),
+        )
+
+    async def _keepalive_loop(self) -> None:
+        message = json.dumps({"type": "KeepAlive"})
+        while True:
+            await asyncio.sleep(self.keepalive_sec / 2)
+            if time.monotonic() - self._last_send >= self.keepalive_sec:
+                await self._connection.send(message)
+                self._last_send = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "sent_sec": round(self.sent_bytes / (self.sample_rate * self._bytes_per_sample), 3),
+            "interim_results": self.interim_results,
+            "final_results": self.final_results,
+            "error": str(self.error) if self.error is not None else None,
+        }
@@ -3,6 +3,12 @@ Phase 2: Deepgram STT 서비스 구현.
 
 Deepgram WebSocket 기반 실시간 STT 서비스
 WhisperSTTService와 동일한 인터페이스 유지
+
+파이프라인은 transcribe_async()를 서버 이벤트 루프에서 바로 await한다. 모든 세션이 하나의
+연결 풀(httpx.AsyncClient)을 공유하므로 요청마다 스레드/이벤트 루프/클라이언트를 만들지 않는다.
+
+/ws/audio 세션에서는 open_live_session()으로 연결당 live 스트리밍 소켓 하나를 열어
+청크마다 HTTP 요청을 보내는 대신 오디오를 계속 흘려보낸다. (deepgram_live.py 참고)
 """
 
 from __future__ import annotations
@@ -14,6 +20,9 @@ from typing import Optional
 
 import numpy as np
 
+from .codecs import ENCODING_PCM16
+from .deepgram_live import DEEPGRAM_LIVE_URL, DeepgramLiveSession
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +35,7 @@ class DeepgramSTTService:
     Deepgram STT 서비스.
     
     Deepgram API를 사용하여 오디오를 텍스트로 변환합니다.
-    WhisperSTTService와 동일한 인터페이스(`transcribe()` 메서드)를 제공합니다.
+    WhisperSTTService와 동일한 인터페이스(`transcribe()` / `transcribe_async()` 메서드)를 제공합니다.
     """
 
     def __init__(
@@ -35,12 +44,18 @@ class DeepgramSTTService:
         *,
         language: str = "ko",
         model: str = "nova-2",
+        live_url: Optional[str] = None,
+        max_connections: int = 32,
+        timeout_sec: float = 10.0,
     ) -> None:
         """
         Args:
             api_key: Deepgram API 키 (None이면 환경변수에서 읽음)
             language: 음성 인식 대상 언어 코드 (기본값: "ko")
             model: Deepgram 모델 이름 (기본값: "nova-2", 다른 옵션: "general", "base")
+            live_url: live 스트리밍 API 주소 (None이면 DEEPGRAM_LIVE_URL 환경변수 또는 기본 주소)
+            max_connections: 공유 HTTP 연결 풀 크기 (동시 요청 상한)
+            timeout_sec: HTTP 요청 제한 시간
         """
         self.api_key = api_key or os.getenv("DEEPGRAM_API_KEY")
         if not self.api_key:
@@ -51,11 +66,25 @@ class DeepgramSTTService:
         
         self.language = language
         self.model = model
+        self.live_url = live_url or os.getenv("DEEPGRAM_LIVE_URL", DEEPGRAM_LIVE_URL)
         
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
         try:
+            import httpx
             from deepgram import AsyncDeepgramClient
             # Deepgram SDK v5 사용 (AsyncDeepgramClient)
-            self.deepgram = AsyncDeepgramClient(api_key=self.api_key)
+            # 연결 풀은 처음 요청한 이벤트 루프(서버 루프)에서 만들어져 모든 세션이 재사용한다.
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=timeout_sec,
+            )
+            self.deepgram = AsyncDeepgramClient(api_key=self.api_key, httpx_client=self._http_client)
             logger.info("✅ DeepgramSTTService initialized (language: %s, model: %s)", language, model)
         except ImportError as exc:
             raise DeepgramNotAvailableError(
@@ -67,6 +96,67 @@ class DeepgramSTTService:
                 f"Deepgram 초기화 중 오류 발생: {exc}"
             ) from exc
 
+    def open_live_session(
+        self,
+        *,
+        sample_rate: int = 16_000,
+        encoding: str = ENCODING_PCM16,
+        interim_results: bool = False,
+        endpointing_ms: Optional[int] = 300,
+    ) -> DeepgramLiveSession:
+        """
+        /ws/audio 세션 하나가 사용할 live 스트리밍 세션을 만든다. (연결은 start()에서)
+
+        Args:
+            sample_rate: 보낼 오디오의 샘플링 레이트
+            encoding: 보낼 오디오 형식 ("pcm16" | "mulaw" | "alaw")
+            interim_results: 확정 전 중간 결과도 받을지 여부
+            endpointing_ms: 발화 종료로 볼 무음 길이 (ms)
+        """
+
+        return DeepgramLiveSession(
+            self.api_key,
+            model=self.model,
+            language=self.language,
+            sample_rate=sample_rate,
+            encoding=encoding,
+            interim_results=interim_results,
+            endpointing_ms=endpointing_ms,
+            url=self.live_url,
+        )
+
+    async def transcribe_async(self, audio_np: np.ndarray) -> str:
+        """
+        서버 이벤트 루프에서 바로 await하는 비동기 STT. (공유 연결 풀 사용)
+
+        Args:
+            audio_np: float32 numpy array, normalized to [-1.0, 1.0], 16kHz
+
+        Returns:
+            str: 변환된 텍스트 (빈 문자열 가능)
+        """
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self.transcribe_stream(audio_np)
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        """공유 HTTP 연결 풀을 닫는다. (서버 종료 시)"""
+
+        await self._http_client.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "deepgram",
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+        }
+
     async def transcribe_stream(self, audio_np: np.ndarray) -> str:
         """
         오디오 청크를 Deepgram으로 전송하여 텍스트 변환 (비동기).
@@ -156,7 +246,8 @@ class DeepgramSTTService:
 
     def transcribe(self, audio_np: np.ndarray) -> str:
         """
-        동기 버전 (WhisperSTTService 호환).
+        동기 버전 (WhisperSTTService 호환). 이벤트 루프 밖의 호출자용이며,
+        파이프라인은 transcribe_async()를 사용한다.
         
         이 메서드는 asyncio.to_thread()에서 호출되므로, 
         별도 스레드에서 실행되며 새 이벤트 루프를 생성할 수 있습니다.
@@ -10,12 +10,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from typing import Deque, Optional, Protocol, Tuple
 
 import numpy as np
 
-from .buffer_manager import AudioBufferManager
+from .buffer_manager import AudioBufferManager, OVERFLOW_DROP_OLDEST
+from .codecs import ENCODING_PCM16
+from .deepgram_live import LiveTranscript
+from .transcript_dedup import TranscriptDeduplicator
+from .vad import Utterance, UtteranceSegmenter, VADConfig
 from .whisper_service import WhisperSTTService, WhisperNotAvailableError
 from .deepgram_service import DeepgramSTTService, DeepgramNotAvailableError
 from nlp.harmful_classifier import (
@@ -23,12 +28,23 @@ from nlp.harmful_classifier import (
     ClassificationResult,
     TransformersNotAvailableError,
 )
+from nlp.batch_scheduler import ClassifierBatchScheduler
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.keyword_store import KeywordStore
+from utils.result_cache import ResultCache, cache_text_key
+from nlp.text_normalizer import TextNormalizer
 
 LOGGER = logging.getLogger("harmful-filter")
 
 
 class STTServiceProtocol(Protocol):
-    """STT 서비스 프로토콜 (WhisperSTTService 또는 DeepgramSTTService와 호환)."""
+    """
+    STT 서비스 프로토콜 (WhisperSTTService 또는 DeepgramSTTService와 호환).
+
+    transcribe_async(audio_np)를 함께 제공하면 파이프라인은 이를 이벤트 루프에서 바로
+    await한다. (네트워크 STT는 루프에서 직접, CPU STT는 서비스 전용 실행기에서 실행)
+    transcribe만 있는 서비스는 asyncio.to_thread로 호출한다.
+    """
     
     def transcribe(self, audio_np: np.ndarray) -> str:
         """오디오 배열을 텍스트로 변환."""
@@ -46,6 +62,11 @@ class PipelineOutput:
     classification: ClassificationResult
     audio_duration_sec: float
     processing_time_ms: float
+    # 처리한 오디오 구간의 절대 샘플 위치 [start, end) (스트림 시작 기준)
+    start_sample: Optional[int] = None
+    end_sample: Optional[int] = None
+    # live 스트리밍 STT의 중간(interim) 결과면 False
+    is_final: bool = True
 
 
 class AudioProcessingPipeline:
@@ -63,21 +84,65 @@ class AudioProcessingPipeline:
         *,
         sample_rate: int = 16_000,
         chunk_duration_sec: float = 1.0,
+        hop_duration_sec: Optional[float] = None,
         keywords: Optional[list[str]] = None,
+        keyword_matcher: Optional[KeywordMatcher] = None,
+        keyword_store: Optional[KeywordStore] = None,
+        result_cache: Optional[ResultCache] = None,
+        classifier_scheduler: Optional[ClassifierBatchScheduler] = None,
+        max_buffer_sec: Optional[float] = None,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        vad_config: Optional[VADConfig] = None,
+        encoding: str = ENCODING_PCM16,
     ) -> None:
         if stt_service is None:
             raise ValueError("STT 서비스가 초기화되지 않았습니다.")
+        if vad_config is not None and hop_duration_sec is not None:
+            raise ValueError("VAD 모드와 슬라이딩 윈도우 모드는 함께 사용할 수 없습니다.")
         
         self.stt_service = stt_service
         self.classifier = classifier  # None일 수 있음 (키워드 기반 분류만 사용)
-        self.keywords = keywords or []  # 키워드 목록 (main.py의 BAD_WORDS 전달)
+        # keyword_store가 주어지면 매 호출마다 최신 스냅샷의 매처를 사용한다. (핫 리로드)
+        # 컴파일된 매처가 주어지면 공유하고, 키워드 목록만 주어지면 여기서 컴파일한다.
+        self.keyword_store = keyword_store
+        self.keyword_matcher = (
+            keyword_matcher
+            if keyword_matcher is not None
+            else KeywordMatcher(keywords or [], normalizer=TextNormalizer())
+        )
+        # 프로세스 공용 결과 캐시 (None이면 캐시 없이 매번 계산)
+        self.result_cache = result_cache
+        # 다른 세션과 분류기 호출을 묶어 배치 추론 (None이면 세션별 단건 추론)
+        self.classifier_scheduler = classifier_scheduler
         self.buffer_manager = AudioBufferManager(
-            sample_rate=sample_rate, chunk_duration_sec=chunk_duration_sec
+            sample_rate=sample_rate,
+            chunk_duration_sec=chunk_duration_sec,
+            hop_duration_sec=hop_duration_sec,
+            max_buffer_sec=max_buffer_sec,
+            overflow_policy=overflow_policy,
+            encoding=encoding,
+        )
+        # 겹치는 윈도우(hop < chunk)에서는 이전 윈도우와 중복된 인식 결과를 제거한다.
+        self.transcript_dedup = (
+            TranscriptDeduplicator() if self.buffer_manager.sliding else None
+        )
+        # VAD 모드에서는 고정 청크 대신 음성 발화 단위로 STT를 호출하고 비음성 구간은 버린다.
+        self.segmenter = (
+            UtteranceSegmenter(vad_config, sample_rate=sample_rate)
+            if vad_config is not None
+            else None
         )
+        self._pending_utterances: Deque[Utterance] = deque()
+        # 마지막으로 꺼낸 구간의 절대 샘플 범위 [start, end)
+        self.last_segment_range: Optional[Tuple[int, int]] = None
+        self.stt_calls = 0
 
     async def process_audio(self, audio_bytes: bytes) -> Optional[PipelineOutput]:
         """
         오디오 바이너리를 버퍼에 추가하고, 충분히 쌓이면 STT/분류 결과를 반환한다.
+
+        메시지 하나당 최대 한 구간만 처리한다. 수신과 처리를 분리하는 경우에는
+        feed / next_segment / process_segment를 직접 사용한다. (AudioStreamSession 참고)
         """
         total_start = time.time()
 
@@ -86,46 +151,140 @@ class AudioProcessingPipeline:
 
         # 1. 버퍼에 추가 및 청크 가져오기
         buffer_start = time.time()
-        self.buffer_manager.add_chunk(audio_bytes)
-        audio_chunk = self.buffer_manager.get_processed_chunk()
+        self.feed(audio_bytes)
+        audio_chunk = self.next_segment()
         buffer_time = (time.time() - buffer_start) * 1000
 
         if audio_chunk is None:
             # 버퍼링 중 - 아직 충분한 데이터가 없음
             return None
 
+        return await self.process_segment(
+            audio_chunk, started_at=total_start, buffer_time_ms=buffer_time
+        )
+
+    def feed(self, audio_bytes: bytes) -> int:
+        """
+        오디오 바이너리를 버퍼에 추가한다.
+
+        Returns:
+            버퍼에 기록된 샘플 수
+        """
+
+        return self.buffer_manager.add_chunk(audio_bytes)
+
+    def next_segment(self) -> Optional[np.ndarray]:
+        """
+        STT로 보낼 준비가 된 다음 구간(청크/윈도우/발화)을 꺼낸다. 없으면 None.
+
+        반환 배열은 버퍼를 재사용할 수 있으므로 다음 feed/next_segment 호출 전에 처리해야 한다.
+        """
+
+        if self.segmenter is not None:
+            return self._next_utterance()
+        start = self.buffer_manager.read_offset
+        chunk = self.buffer_manager.get_processed_chunk()
+        if chunk is not None:
+            self.last_segment_range = (start, start + len(chunk))
+        return chunk
+
+    def next_coalesced_segment(self, max_sec: float) -> Optional[np.ndarray]:
+        """
+        처리가 밀렸을 때, 준비된 구간들을 최대 max_sec 길이의 한 구간으로 합쳐 꺼낸다.
+        """
+
+        max_samples = int(max_sec * self.buffer_manager.sample_rate)
+        if self.segmenter is None:
+            start = self.buffer_manager.read_offset
+            span = self.buffer_manager.read_coalesced(max_samples)
+            if span is not None:
+                self.last_segment_range = (start, start + len(span))
+            return span
+
+        self._segment_buffered_frames()
+        if not self._pending_utterances:
+            return None
+        merged = [self._pending_utterances.popleft()]
+        total = len(merged[0].audio)
+        while (
+            self._pending_utterances
+            and total + len(self._pending_utterances[0].audio) <= max_samples
+        ):
+            total += len(self._pending_utterances[0].audio)
+            merged.append(self._pending_utterances.popleft())
+        # 발화 사이의 버려진 비음성 구간도 범위에 포함된다.
+        self.last_segment_range = (merged[0].start_sample, merged[-1].end_sample)
+        if len(merged) == 1:
+            return merged[0].audio
+        return np.concatenate([utterance.audio for utterance in merged])
+
+    @property
+    def backlog_sec(self) -> float:
+        """버퍼/대기 발화에 쌓여 아직 STT로 보내지 않은 오디오 길이 (초)."""
+
+        pending = sum(len(utterance.audio) for utterance in self._pending_utterances)
+        return (self.buffer_manager.available + pending) / self.buffer_manager.sample_rate
+
+    def drop_backlog(self, keep_sec: float) -> int:
+        """
+        밀린 오디오 중 가장 오래된 부분부터 버려 keep_sec 이하만 남긴다.
+
+        Returns:
+            버린 샘플 수
+        """
+
+        sample_rate = self.buffer_manager.sample_rate
+        keep = int(keep_sec * sample_rate)
+        dropped = 0
+        # 대기 중인 발화가 버퍼에 남은 샘플보다 오래된 오디오다.
+        while self._pending_utterances and self.backlog_sec * sample_rate > keep:
+            dropped += len(self._pending_utterances.popleft().audio)
+        excess = self.buffer_manager.available - keep
+        if excess > 0:
+            dropped += self.buffer_manager.discard(excess)
+        if dropped and self.transcript_dedup is not None:
+            # 건너뛴 구간 앞뒤의 인식 결과는 더 이상 겹치지 않는다.
+            self.transcript_dedup.reset()
+        return dropped
+
+    async def process_segment(
+        self,
+        audio_chunk: np.ndarray,
+        *,
+        started_at: Optional[float] = None,
+        buffer_time_ms: float = 0.0,
+        sample_range: Optional[Tuple[int, int]] = None,
+    ) -> Optional[PipelineOutput]:
+        """
+        오디오 구간 하나를 STT → 유해성 분류한다. 인식된 새 텍스트가 없으면 None.
+
+        sample_range를 생략하면 마지막 next_segment 호출로 꺼낸 구간의 범위를 사용한다.
+        """
+
+        total_start = started_at if started_at is not None else time.time()
+        if sample_range is None:
+            sample_range = self.last_segment_range
+        buffer_time = buffer_time_ms
+
         # 2. STT 변환
         stt_start = time.time()
-        text = await asyncio.to_thread(self.stt_service.transcribe, audio_chunk)
+        self.stt_calls += 1
+        text = await self._transcribe(audio_chunk)
         stt_time = (time.time() - stt_start) * 1000
 
         if not text or len(text.strip()) == 0:
             LOGGER.info("[Pipeline] No text detected, skipping classification")
             return None
 
+        if self.transcript_dedup is not None:
+            text = self.transcript_dedup.merge(text)
+            if not text:
+                LOGGER.info("[Pipeline] Window repeated previous transcript, skipping classification")
+                return None
+
         # 3. 유해성 판단
         classifier_start = time.time()
-        
-        # 키워드 기반 검사
-        keyword_harmful = False
-        matched_keywords = []
-        text_lower = text.lower()
-        if self.keywords:
-            matched_keywords = [word for word in self.keywords if word.lower() in text_lower]
-            keyword_harmful = len(matched_keywords) > 0
-
-        # Classifier가 있으면 Classifier도 사용
-        if self.classifier is not None:
-            classifier_result = await asyncio.to_thread(self.classifier.predict, text)
-            is_harmful = keyword_harmful or classifier_result.is_harmful
-            if keyword_harmful:
-                confidence = 1.0
-            else:
-                confidence = classifier_result.confidence
-        else:
-            is_harmful = keyword_harmful
-            confidence = 1.0 if keyword_harmful else 0.0
-
+        classification = await self._assess(text)
         classifier_time = (time.time() - classifier_start) * 1000
         total_time = (time.time() - total_start) * 1000
 
@@ -139,16 +298,127 @@ class AudioProcessingPipeline:
         if total_time > 3000:
             LOGGER.warning("[Pipeline] ⚠️ Total latency exceeds 3s: %.2fms", total_time)
 
-        classification = ClassificationResult(
-            is_harmful=is_harmful,
-            confidence=confidence,
-            text=text
-        )
-
         return PipelineOutput(
             text=text,
             classification=classification,
             audio_duration_sec=len(audio_chunk) / self.buffer_manager.sample_rate,
             processing_time_ms=total_time,
+            start_sample=sample_range[0] if sample_range is not None else None,
+            end_sample=sample_range[1] if sample_range is not None else None,
+        )
+
+    async def process_transcript(self, transcript: LiveTranscript) -> Optional[PipelineOutput]:
+        """
+        live 스트리밍 STT가 보낸 인식 결과 하나를 유해성 분류한다.
+
+        확정(final) 결과는 키워드 + 분류기로, 중간(interim) 결과는 빠른 키워드 검사로만 판단한다.
+        (중간 결과는 계속 바뀌므로 분류기 호출은 확정 결과에만 쓴다.)
+        """
+
+        started_at = time.time()
+        text = transcript.text.strip()
+        if not text:
+            return None
+        if transcript.is_final:
+            self.stt_calls += 1
+        classification = await self._assess(text, use_classifier=transcript.is_final)
+
+        sample_rate = self.buffer_manager.sample_rate
+        start_sample = round(transcript.start_sec * sample_rate)
+        end_sample = round(transcript.end_sec * sample_rate)
+        return PipelineOutput(
+            text=text,
+            classification=classification,
+            audio_duration_sec=transcript.duration_sec,
+            processing_time_ms=(time.time() - started_at) * 1000,
+            start_sample=start_sample,
+            end_sample=end_sample,
+            is_final=transcript.is_final,
         )
 
+    async def _transcribe(self, audio_chunk: np.ndarray) -> str:
+        transcribe_async = getattr(self.stt_service, "transcribe_async", None)
+        if transcribe_async is not None:
+            return await transcribe_async(audio_chunk)
+        return await asyncio.to_thread(self.stt_service.transcribe, audio_chunk)
+
+    async def _assess(self, text: str, *, use_classifier: bool = True) -> ClassificationResult:
+        """
+        키워드 검사 + (분류기가 있으면) 분류기 결과를 합쳐 유해성을 판단한다.
+        """
+
+        keyword_harmful = len(self._match_keywords(text)) > 0
+
+        # Classifier가 있으면 Classifier도 사용
+        if use_classifier and self.classifier is not None:
+            classifier_result = await self._classify(text)
+            is_harmful = keyword_harmful or classifier_result.is_harmful
+            confidence = 1.0 if keyword_harmful else classifier_result.confidence
+        else:
+            is_harmful = keyword_harmful
+            confidence = 1.0 if keyword_harmful else 0.0
+
+        return ClassificationResult(is_harmful=is_harmful, confidence=confidence, text=text)
+
+    def _next_utterance(self) -> Optional[np.ndarray]:
+        """
+        버퍼에 쌓인 프레임을 VAD에 넣고, 완성된 발화가 있으면 하나를 꺼낸다.
+        한 번에 여러 발화가 완성되면 나머지는 다음 호출에서 처리한다.
+        """
+
+        self._segment_buffered_frames()
+        if not self._pending_utterances:
+            return None
+        utterance = self._pending_utterances.popleft()
+        self.last_segment_range = (utterance.start_sample, utterance.end_sample)
+        return utterance.audio
+
+    def _segment_buffered_frames(self) -> None:
+        start = self.buffer_manager.read_offset
+        frames = self.buffer_manager.read_frames(self.segmenter.frame_size)
+        if frames is not None:
+            self._pending_utterances.extend(self.segmenter.process(frames, start_sample=start))
+
+    def _match_keywords(self, text: str) -> list[str]:
+        """
+        check_keywords와 같은 단어 경계 기준으로 매칭한다. 정규화가 공백을 지우므로 부분 문자열
+        모드는 "시 발표", "개 새로운"처럼 단어 사이에 걸친 일반 문장도 매칭한다.
+        """
+
+        if self.keyword_store is not None:
+            snapshot = self.keyword_store.snapshot
+            matcher, version = snapshot.matcher, snapshot.version
+        else:
+            # 버전을 알 수 없는 고정 매처는 캐시하지 않는다.
+            matcher, version = self.keyword_matcher, None
+
+        if len(matcher) == 0:
+            return []
+
+        if self.result_cache is None or version is None:
+            return matcher.find_all(text)
+
+        cache_key = ("keywords", version, text)
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            cached = tuple(matcher.find_all(text))
+            self.result_cache.put(cache_key, cached)
+        return list(cached)
+
+    async def _classify(self, text: str) -> ClassificationResult:
+        if self.result_cache is None:
+            return await self._predict(text)
+
+        model_name = getattr(self.classifier, "model_name", type(self.classifier).__name__)
+        backend = getattr(self.classifier, "backend", None)
+        cache_key = ("classifier", model_name, backend, cache_text_key(text))
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            cached = await self._predict(text)
+            self.result_cache.put(cache_key, cached)
+        return cached
+
+    async def _predict(self, text: str) -> ClassificationResult:
+        if self.classifier_scheduler is not None and self.classifier_scheduler.running:
+            return await self.classifier_scheduler.predict(text)
+        return await asyncio.to_thread(self.classifier.predict, text)
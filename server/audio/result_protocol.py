@@ -0,0 +1,141 @@
+"""
+/ws/audio 결과 전송 프로토콜.
+
+기본값은 기존과 같은 JSON 텍스트 프레임이다. 클라이언트가 `?protocol=binary`로 연결하면
+버퍼링 응답(ack)을 보내지 않고, 분석 결과만 고정 헤더 + UTF-8 텍스트의 바이너리 프레임으로
+보낸다. 연결/오류 같은 드문 제어 메시지는 두 모드 모두 JSON 텍스트 프레임을 쓴다.
+
+바이너리 결과 프레임 (리틀엔디언, 헤더 48바이트):
+
+    offset  type     field
+    0       uint8    version (=1)
+    1       uint8    flags (bit0: is_harmful, bit1: interim - 확정 전 중간 결과)
+    2       uint16   text_length (바이트)
+    4       uint32   seq (결과 순번, 0부터)
+    8       uint32   first_frame (구간에 포함된 첫 오디오 메시지 순번)
+    12      uint32   last_frame (구간에 포함된 마지막 오디오 메시지 순번)
+    16      uint64   start_sample (구간 시작 절대 샘플 위치)
+    24      uint64   end_sample (구간 끝 절대 샘플 위치, 미포함)
+    32      float32  confidence
+    36      float32  processing_time_ms
+    40      float32  lag_sec
+    44      uint32   reserved (0)
+    48      bytes    text (UTF-8, text_length 바이트)
+
+오디오 메시지 순번은 클라이언트가 보낸 바이너리 오디오 메시지의 0부터 시작하는 순서이며,
+샘플 위치는 서버 버퍼가 받아들인 샘플 기준이다.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict
+
+PROTOCOL_JSON = "json"
+PROTOCOL_BINARY = "binary"
+PROTOCOLS = (PROTOCOL_JSON, PROTOCOL_BINARY)
+
+RESULT_FRAME_VERSION = 1
+_FLAG_HARMFUL = 0x01
+_FLAG_INTERIM = 0x02
+_HEADER = struct.Struct("<BBHIIIQQfffI")
+_MAX_TEXT_BYTES = 0xFFFF
+
+HEADER_SIZE = _HEADER.size
+
+
+@dataclass
+class ResultFrame:
+    """결과 프레임 하나의 내용 (전송 형식과 무관)."""
+
+    seq: int
+    text: str
+    is_harmful: bool
+    confidence: float
+    processing_time_ms: float
+    start_sample: int
+    end_sample: int
+    first_frame: int
+    last_frame: int
+    lag_sec: float
+    is_final: bool = True
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "is_final": self.is_final,
+            "start_sample": self.start_sample,
+            "end_sample": self.end_sample,
+            "first_frame": self.first_frame,
+            "last_frame": self.last_frame,
+            "lag_sec": round(self.lag_sec, 3),
+        }
+
+
+def encode_result(frame: ResultFrame) -> bytes:
+    """
+    결과를 바이너리 프레임으로 인코딩한다. 텍스트가 65,535바이트를 넘으면 잘라낸다.
+    """
+
+    text = frame.text.encode("utf-8")
+    if len(text) > _MAX_TEXT_BYTES:
+        # UTF-8 문자 중간에서 잘리지 않도록 다시 디코딩해 마무리한다.
+        text = text[:_MAX_TEXT_BYTES].decode("utf-8", errors="ignore").encode("utf-8")
+
+    header = _HEADER.pack(
+        RESULT_FRAME_VERSION,
+        (_FLAG_HARMFUL if frame.is_harmful else 0) | (0 if frame.is_final else _FLAG_INTERIM),
+        len(text),
+        frame.seq & 0xFFFFFFFF,
+        frame.first_frame & 0xFFFFFFFF,
+        frame.last_frame & 0xFFFFFFFF,
+        frame.start_sample,
+        frame.end_sample,
+        frame.confidence,
+        frame.processing_time_ms,
+        frame.lag_sec,
+        0,
+    )
+    return header + text
+
+
+def decode_result(data: bytes) -> ResultFrame:
+    """
+    바이너리 결과 프레임을 디코딩한다. (테스트/디버깅용, 클라이언트 구현의 기준)
+    """
+
+    if len(data) < HEADER_SIZE:
+        raise ValueError("result frame is shorter than the header.")
+
+    (
+        version,
+        flags,
+        text_length,
+        seq,
+        first_frame,
+        last_frame,
+        start_sample,
+        end_sample,
+        confidence,
+        processing_time_ms,
+        lag_sec,
+        _reserved,
+    ) = _HEADER.unpack_from(data)
+    if version != RESULT_FRAME_VERSION:
+        raise ValueError(f"unsupported result frame version: {version}")
+
+    text = bytes(data[HEADER_SIZE:HEADER_SIZE + text_length]).decode("utf-8")
+    return ResultFrame(
+        seq=seq,
+        text=text,
+        is_harmful=bool(flags & _FLAG_HARMFUL),
+        confidence=confidence,
+        processing_time_ms=processing_time_ms,
+        start_sample=start_sample,
+        end_sample=end_sample,
+        first_frame=first_frame,
+        last_frame=last_frame,
+        lag_sec=lag_sec,
+        is_final=not flags & _FLAG_INTERIM,
+    )
@@ -0,0 +1,406 @@
+"""
+/ws/audio 세션의 수신/처리 분리 (생산자-소비자).
+
+수신 태스크는 오디오 메시지를 크기 제한 큐에 넣기만 하고, 처리 태스크가 큐를 비워
+버퍼에 넣은 뒤 준비된 구간을 모두 STT/분류한다. STT가 실행되는 동안에도 소켓에서
+계속 프레임을 읽으며, 처리가 실시간보다 max_lag_sec 이상 밀리면 lag_policy에 따라
+밀린 오디오를 합치거나(coalesce) 버린다(skip_to_live / drop_oldest).
+
+결과에는 순번(seq)과 해당 구간의 절대 샘플 범위, 그 구간을 담고 있던 오디오 메시지
+순번 범위가 붙는다. 전송 형식(JSON/바이너리)은 result_protocol 참고.
+
+live 세션(Deepgram 스트리밍 STT)이 주어지면 처리 태스크는 수신한 오디오를 버퍼링 없이
+live 소켓으로 그대로 보내고, 별도 태스크가 인식 결과를 받아 분류/전송한다. live 연결이
+실패하거나 끊기면 그 시점부터 기존 구간 단위 STT로 이어서 처리한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from .deepgram_live import DeepgramLiveError, DeepgramLiveSession
+from .pipeline import AudioProcessingPipeline, PipelineOutput
+from .result_protocol import PROTOCOL_BINARY, PROTOCOL_JSON, PROTOCOLS, ResultFrame, encode_result
+
+LOGGER = logging.getLogger("harmful-filter")
+
+LAG_COALESCE = "coalesce"
+LAG_SKIP_TO_LIVE = "skip_to_live"
+LAG_DROP_OLDEST = "drop_oldest"
+_LAG_POLICIES = (LAG_COALESCE, LAG_SKIP_TO_LIVE, LAG_DROP_OLDEST)
+# 결과 구간 → 오디오 메시지 순번 매핑을 위해 보관하는 최근 메시지 수
+_FRAME_HISTORY = 4096
+
+
+class AudioStreamSession:
+    """
+    WebSocket 한 연결의 오디오 수신 큐와 처리 루프.
+    """
+
+    def __init__(
+        self,
+        pipeline: AudioProcessingPipeline,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        *,
+        serialize: Callable[[PipelineOutput], Dict[str, Any]],
+        queue_size: int = 64,
+        lag_policy: str = LAG_COALESCE,
+        max_lag_sec: float = 3.0,
+        max_coalesce_sec: float = 10.0,
+        bytes_per_sample: Optional[int] = None,
+        protocol: str = PROTOCOL_JSON,
+        send_bytes: Optional[Callable[[bytes], Awaitable[None]]] = None,
+        acks: Optional[bool] = None,
+        live: Optional[DeepgramLiveSession] = None,
+        live_drain_timeout_sec: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            pipeline: 세션 전용 오디오 파이프라인
+            send: 클라이언트로 JSON 메시지를 보내는 코루틴 (websocket.send_json)
+            serialize: 파이프라인 결과를 응답 딕셔너리로 변환하는 함수
+            queue_size: 수신 큐 최대 메시지 수 (가득 차면 수신 태스크가 대기 → TCP 배압)
+            lag_policy: 처리 지연이 max_lag_sec를 넘었을 때의 동작
+                - "coalesce": 밀린 구간을 하나로 합쳐 STT 한 번에 처리
+                - "skip_to_live": 밀린 오디오를 버리고 최신 구간 하나만 남김
+                - "drop_oldest": 가장 오래된 오디오부터 버려 max_lag_sec 이하로 유지
+            max_lag_sec: 지연 정책을 적용하기 시작하는 밀린 오디오 길이 (초)
+            max_coalesce_sec: coalesce 시 한 번에 합치는 최대 길이 (초)
+            bytes_per_sample: 수신 바이너리의 샘플당 바이트 수 (큐 지연 계산용, None이면 버퍼의 인코딩 기준)
+            protocol: 결과 전송 형식 ("json" | "binary")
+            send_bytes: 바이너리 프레임을 보내는 코루틴 (binary 모드에서 필수)
+            acks: 결과가 없을 때 buffering 응답을 보낼지 여부 (None이면 json 모드에서만 전송)
+            live: 연결당 live 스트리밍 STT 세션 (None이면 구간 단위 STT)
+            live_drain_timeout_sec: live 소켓 종료/끊김 후 이미 받은 인식 결과를 분류/전송하며 기다리는 최대 시간
+        """
+
+        if lag_policy not in _LAG_POLICIES:
+            raise ValueError(f"lag_policy must be one of {_LAG_POLICIES}.")
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"protocol must be one of {PROTOCOLS}.")
+        if protocol == PROTOCOL_BINARY and send_bytes is None:
+            raise ValueError("send_bytes is required for the binary protocol.")
+        if max_lag_sec <= 0:
+            raise ValueError("max_lag_sec must be positive.")
+
+        self.pipeline = pipeline
+        self.serialize = serialize
+        self.lag_policy = lag_policy
+        self.max_lag_sec = max_lag_sec
+        self.max_coalesce_sec = max_coalesce_sec
+        self.protocol = protocol
+        self.acks = protocol == PROTOCOL_JSON if acks is None else acks
+        self._send = send
+        self._send_bytes = send_bytes
+        self._send_lock = asyncio.Lock()
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=queue_size)
+        self._queued_bytes = 0
+        if bytes_per_sample is None:
+            bytes_per_sample = pipeline.buffer_manager.bytes_per_sample
+        self._bytes_per_second = pipeline.buffer_manager.sample_rate * bytes_per_sample
+        self._worker: Optional[asyncio.Task] = None
+        # 최근 오디오 메시지들의 시작 절대 샘플 위치 (메시지 순번 = 기준 순번 + 인덱스)
+        self._frame_starts: Deque[int] = deque(maxlen=_FRAME_HISTORY)
+        self._frames_fed = 0
+        self._result_seq = 0
+        self.live = live
+        self.live_drain_timeout_sec = live_drain_timeout_sec
+        self._relay: Optional[asyncio.Task] = None
+        self._live_samples = 0  # live 소켓으로 보낸 샘플 수
+        self.live_fallbacks = 0
+
+        self.received_messages = 0
+        self.processed_segments = 0
+        self.lag_events = 0
+        self.dropped_sec = 0.0
+        self.coalesced_segments = 0
+        self.max_observed_lag_sec = 0.0
+        self.started_at = time.time()
+
+    @property
+    def lag_sec(self) -> float:
+        """수신했지만 아직 STT로 보내지 않은 오디오 길이 (초)."""
+
+        return self._queued_bytes / self._bytes_per_second + self.pipeline.backlog_sec
+
+    def start(self) -> asyncio.Task:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self.run())
+        return self._worker
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def put(self, audio_bytes: bytes) -> None:
+        """
+        수신한 오디오 메시지를 큐에 넣는다. 큐가 가득 차면 빈 자리가 날 때까지 기다린다.
+        """
+
+        if not audio_bytes:
+            return
+        await self._queue.put(audio_bytes)
+        self._queued_bytes += len(audio_bytes)
+        self.received_messages += 1
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        """수신/처리 태스크가 동시에 보내지 않도록 직렬화한다."""
+
+        async with self._send_lock:
+            await self._send(payload)
+
+    async def _send_frame(self, data: bytes) -> None:
+        async with self._send_lock:
+            await self._send_bytes(data)
+
+    async def close(self) -> None:
+        """
+        처리 태스크를 종료한다. (아직 처리하지 않은 오디오는 버린다)
+
+        live 모드에서는 먼저 CloseStream을 보내 이미 보낸 오디오의 확정 결과를 받고,
+        그 결과까지 분류/전송한 뒤 종료한다. (live_drain_timeout_sec 이내)
+        """
+
+        if self._worker is None:
+            return
+        live = self.live
+        if live is not None and live.connected and not self._worker.done():
+            await live.finish(self.live_drain_timeout_sec)
+            if self._relay is not None:
+                await self._drain_relay(self._relay)
+        if not self._worker.done():
+            self._worker.cancel()
+        try:
+            await self._worker
+        except (asyncio.CancelledError, Exception):  # pylint: disable=broad-except
+            pass
+
+    async def run(self) -> None:
+        """
+        처리 루프: 큐에 쌓인 메시지를 모두 버퍼에 넣고 준비된 구간을 전부 처리한다.
+        """
+
+        if self.live is not None:
+            pending = await self._run_live()
+            # live STT를 쓸 수 없게 되면 받은 오디오부터 구간 단위 STT로 이어서 처리한다.
+            if pending is not None:
+                await self._process_ready(self._feed(pending))
+
+        while True:
+            fed_bytes = self._feed(await self._queue.get())
+            await self._process_ready(fed_bytes)
+
+    async def _run_live(self) -> Optional[bytes]:
+        """
+        수신한 오디오를 live 소켓으로 보내고, 인식 결과는 별도 태스크에서 전송한다.
+
+        Returns:
+            live STT 실패로 구간 단위 처리로 넘겨야 할 메시지 (없으면 None)
+        """
+
+        live = self.live
+        try:
+            await live.start()
+        except DeepgramLiveError as exc:
+            LOGGER.warning("[WARN] Live STT unavailable, using chunked STT: %s", exc)
+            self._fall_back_from_live()
+            return None
+
+        relay = self._relay = asyncio.create_task(self._relay_transcripts(live))
+        audio_bytes: Optional[bytes] = None
+        try:
+            while True:
+                audio_bytes = await self._queue.get()
+                self._queued_bytes -= len(audio_bytes)
+                self._frame_starts.append(self._live_samples)
+                self._frames_fed += 1
+                await live.send_audio(audio_bytes)
+                self._live_samples += len(audio_bytes) // self.pipeline.buffer_manager.bytes_per_sample
+                audio_bytes = None
+                if self.acks and self._queue.empty():
+                    await self.send(
+                        {"status": "buffering", "size": live.sent_bytes, "lag_sec": round(self.lag_sec, 3)}
+                    )
+        except DeepgramLiveError as exc:
+            LOGGER.warning("[WARN] Live STT connection lost, using chunked STT: %s", exc)
+            # 끊기기 전에 받아 둔 결과(대개 마지막 확정 결과)는 종료 표시(None)까지 분류/전송한다.
+            await live.close()
+            await self._drain_relay(relay)
+        finally:
+            relay.cancel()
+            await live.close()
+
+        if audio_bytes is not None:
+            # 보내지 못한 메시지는 구간 단위 처리에서 다시 기록한다.
+            self._frame_starts.pop()
+            self._frames_fed -= 1
+            self._queued_bytes += len(audio_bytes)
+        self._fall_back_from_live()
+        return audio_bytes
+
+    def _fall_back_from_live(self) -> None:
+        self.live_fallbacks += 1
+        self.live = None
+        # 절대 샘플 위치가 live로 보낸 오디오 뒤에서 이어지도록 맞춘다.
+        buffer_manager = self.pipeline.buffer_manager
+        buffer_manager.read_offset = buffer_manager.write_offset = self._live_samples
+
+    async def _drain_relay(self, relay: asyncio.Task) -> None:
+        try:
+            await asyncio.wait_for(relay, timeout=self.live_drain_timeout_sec)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "[WARN] Live transcripts not drained within %.1fs, dropping the rest", self.live_drain_timeout_sec
+            )
+        except Exception as relay_err:  # pylint: disable=broad-except
+            LOGGER.warning("[WARN] Live transcript relay stopped: %s", relay_err)
+
+    async def _relay_transcripts(self, live: DeepgramLiveSession) -> None:
+        while True:
+            transcript = await live.receive()
+            if transcript is None:
+                return
+            try:
+                result = await self.pipeline.process_transcript(transcript)
+            except Exception as process_err:  # pylint: disable=broad-except
+                LOGGER.error("[ERROR] Error processing transcript: %s", process_err, exc_info=True)
+                continue
+            if result is not None:
+                await self._emit(result)
+
+    def _feed(self, audio_bytes: bytes) -> int:
+        self._queued_bytes -= len(audio_bytes)
+        self._frame_starts.append(self.pipeline.buffer_manager.write_offset)
+        self._frames_fed += 1
+        self.pipeline.feed(audio_bytes)
+        return len(audio_bytes)
+
+    def _frames_for(self, sample_range: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        """절대 샘플 범위 [start, end)를 담고 있던 오디오 메시지 순번 범위."""
+
+        if sample_range is None or not self._frame_starts:
+            return 0, 0
+        starts = self._frame_starts
+        base = self._frames_fed - len(starts)
+        start, end = sample_range
+        first = max(bisect.bisect_right(starts, start) - 1, 0)
+        last = max(bisect.bisect_left(starts, end) - 1, first)
+        return base + first, base + last
+
+    def _drain_queue(self) -> int:
+        fed_bytes = 0
+        while not self._queue.empty():
+            fed_bytes += self._feed(self._queue.get_nowait())
+        return fed_bytes
+
+    async def _process_ready(self, fed_bytes: int) -> None:
+        produced = 0
+        while True:
+            fed_bytes += self._drain_queue()
+            segment = self._next_segment()
+            if segment is None:
+                break
+
+            self.processed_segments += 1
+            try:
+                result = await self.pipeline.process_segment(segment)
+            except Exception as process_err:  # pylint: disable=broad-except
+                LOGGER.error("[ERROR] Error processing audio: %s", process_err, exc_info=True)
+                await self.send(
+                    {"status": "error", "detail": f"Audio processing error: {str(process_err)}"}
+                )
+                continue
+
+            if result is not None:
+                produced += 1
+                await self._emit(result)
+
+        if produced == 0 and fed_bytes and self.acks:
+            await self.send(
+                {"status": "buffering", "size": fed_bytes, "lag_sec": round(self.lag_sec, 3)}
+            )
+
+    async def _emit(self, result: PipelineOutput) -> None:
+        sample_range = (
+            (result.start_sample, result.end_sample) if result.start_sample is not None else None
+        )
+        first_frame, last_frame = self._frames_for(sample_range)
+        frame = ResultFrame(
+            seq=self._result_seq,
+            text=result.text or "",
+            is_harmful=bool(result.classification.is_harmful),
+            confidence=float(result.classification.confidence),
+            processing_time_ms=float(result.processing_time_ms),
+            start_sample=result.start_sample or 0,
+            end_sample=result.end_sample or 0,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            lag_sec=self.lag_sec,
+            is_final=result.is_final,
+        )
+        self._result_seq += 1
+
+        if self.protocol == PROTOCOL_BINARY:
+            await self._send_frame(encode_result(frame))
+            return
+        payload = self.serialize(result)
+        payload.update(frame.to_json())
+        await self.send(payload)
+
+    def _next_segment(self) -> Optional[np.ndarray]:
+        lag = self.lag_sec
+        self.max_observed_lag_sec = max(self.max_observed_lag_sec, lag)
+        if lag <= self.max_lag_sec:
+            return self.pipeline.next_segment()
+
+        self.lag_events += 1
+        if self.lag_policy == LAG_COALESCE:
+            segment = self.pipeline.next_coalesced_segment(self.max_coalesce_sec)
+            if segment is not None:
+                self.coalesced_segments += 1
+            return segment
+
+        sample_rate = self.pipeline.buffer_manager.sample_rate
+        if self.lag_policy == LAG_SKIP_TO_LIVE:
+            keep_sec = self.pipeline.buffer_manager.chunk_size / sample_rate
+        else:
+            keep_sec = self.max_lag_sec
+        dropped = self.pipeline.drop_backlog(keep_sec)
+        self.dropped_sec += dropped / sample_rate
+        LOGGER.warning(
+            "[WARN] Audio session lagging %.2fs (policy=%s): dropped %.2fs",
+            lag,
+            self.lag_policy,
+            dropped / sample_rate,
+        )
+        return self.pipeline.next_segment()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "lag_sec": round(self.lag_sec, 3),
+            "max_lag_sec": round(self.max_observed_lag_sec, 3),
+            "lag_policy": self.lag_policy,
+            "protocol": self.protocol,
+            "stt_mode": "live" if self.live is not None else "chunked",
+            "live_fallbacks": self.live_fallbacks,
+            "encoding": self.pipeline.buffer_manager.encoding.name,
+            "results": self._result_seq,
+            "queue_depth": self._queue.qsize(),
+            "received_messages": self.received_messages,
+            "processed_segments": self.processed_segments,
+            "stt_calls": self.pipeline.stt_calls,
+            "lag_events": self.lag_events,
+            "coalesced_segments": self.coalesced_segments,
+            "dropped_sec": round(self.dropped_sec, 3),
+            "connected_sec": round(time.time() - self.started_at, 1),
+        }
+        if self.live is not None:
+            stats["live"] = self.live.stats()
+        return stats
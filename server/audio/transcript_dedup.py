@@ -0,0 +1,78 @@
+"""
+겹치는 오디오 윈도우의 STT 결과에서 이미 내보낸 구간을 제거하는 모듈.
+
+슬라이딩 윈도우 모드에서는 같은 발화가 연속된 윈도우에 반복해서 인식되므로,
+직전까지 내보낸 단어열의 끝부분과 새 결과의 앞부분이 겹치는 만큼을 잘라내고
+새로 들어온 단어만 돌려준다.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Deque, List
+
+# 비교 시 무시하는 문장 부호 (STT가 윈도우마다 다르게 붙이는 경우가 많다)
+_PUNCTUATION = re.compile(r"[^\w]+")
+
+
+def _comparable(word: str) -> str:
+    return _PUNCTUATION.sub("", word).lower()
+
+
+class TranscriptDeduplicator:
+    """
+    윈도우별 STT 결과를 누적 단어열과 비교해 새 단어만 반환한다.
+    """
+
+    def __init__(self, history_words: int = 32) -> None:
+        """
+        Args:
+            history_words: 겹침 비교를 위해 보관할 최근 단어 수
+        """
+
+        if history_words <= 0:
+            raise ValueError("history_words must be positive.")
+
+        self._history: Deque[str] = deque(maxlen=history_words)
+
+    def merge(self, text: str) -> str:
+        """
+        새 윈도우의 인식 결과 중 이전 결과와 겹치지 않는 부분을 반환한다.
+
+        윈도우 시작 지점에서 잘린 단어 조각이 맨 앞에 붙는 경우를 고려해,
+        첫 단어를 건너뛴 정렬도 함께 시도한다.
+
+        Returns:
+            새로 인식된 텍스트 (모두 중복이면 빈 문자열)
+        """
+
+        words = text.split()
+        if not words:
+            return ""
+
+        keys = [_comparable(word) for word in words]
+        skip = self._overlap(keys)
+        new_words = words[skip:]
+        self._history.extend(keys[skip:])
+        return " ".join(new_words)
+
+    def reset(self) -> None:
+        self._history.clear()
+
+    def _overlap(self, keys: List[str]) -> int:
+        history = list(self._history)
+        if not history:
+            return 0
+
+        # 가장 길게 겹치는 정렬을 고른다. 앞 조각을 건너뛰는 정렬은 우연한 일치를
+        # 피하기 위해 두 단어 이상 겹칠 때만, 그리고 더 길게 겹칠 때만 채택한다.
+        best_size, best_skip = 0, 0
+        for offset, min_size in ((0, 1), (1, 2)):
+            candidate = keys[offset:]
+            for size in range(min(len(history), len(candidate)), min_size - 1, -1):
+                if history[-size:] == candidate[:size]:
+                    if size > best_size:
+                        best_size, best_skip = size, offset + size
+                    break
+        return best_skip
@@ -0,0 +1,231 @@
+"""
+음성 구간 검출(VAD) 및 발화 단위 분할(endpointing).
+
+수신 오디오를 짧은 프레임으로 나눠 에너지(dBFS)와 영교차율(ZCR)을 NumPy로 한 번에 계산하고,
+음성 프레임만 모아 발화가 끝났거나(무음 지속) 최대 길이에 도달했을 때 가변 길이 발화를
+STT로 넘긴다. 게임 오디오의 대부분을 차지하는 무음/배경음 프레임은 STT로 보내지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_EPS = 1e-10
+
+
+@dataclass
+class Utterance:
+    """STT로 보낼 발화 구간."""
+
+    audio: np.ndarray
+    start_sample: int  # 스트림 시작 기준 절대 샘플 위치
+
+    @property
+    def end_sample(self) -> int:
+        return self.start_sample + len(self.audio)
+
+
+@dataclass
+class VADConfig:
+    """VAD/endpointing 설정."""
+
+    frame_ms: float = 30.0
+    # 이 값보다 조용한 프레임은 항상 비음성으로 본다.
+    min_energy_db: float = -45.0
+    # 적응형 잡음 바닥 대비 이만큼 커야 음성으로 본다.
+    noise_margin_db: float = 10.0
+    # 잡음 바닥 추정 갱신 비율. 조용해지면 빠르게 내려가고, 시끄러워지면 천천히 올라가
+    # 계속 이어지는 배경 음악/효과음은 몇 초 뒤 잡음으로 취급된다.
+    noise_fall_rate: float = 0.2
+    noise_rise_rate: float = 0.005
+    # 영교차율이 이보다 높으면 광대역 잡음으로 보고 비음성 처리한다.
+    max_zero_crossing_rate: float = 0.4
+    # 발화 시작으로 인정할 최소 연속 음성 길이
+    min_speech_ms: float = 90.0
+    # 이만큼 무음이 이어지면 발화 종료
+    end_silence_ms: float = 300.0
+    # 발화가 이 길이에 도달하면 끝나지 않았더라도 잘라서 보낸다.
+    max_utterance_sec: float = 5.0
+    # 발화 시작 직전에 붙여 보낼 길이 (첫 음절 잘림 방지)
+    pre_roll_ms: float = 150.0
+
+
+def frame_features(audio: np.ndarray, frame_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    float32 오디오를 frame_size 단위로 나눠 프레임별 (에너지 dBFS, 영교차율)을 계산한다.
+    마지막 불완전 프레임은 무시한다.
+    """
+
+    count = len(audio) // frame_size
+    frames = audio[: count * frame_size].reshape(count, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    energy_db = 20.0 * np.log10(rms + _EPS)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_size - 1)
+    return energy_db, zcr
+
+
+class UtteranceSegmenter:
+    """
+    연속 오디오 스트림을 음성 발화 단위로 잘라내는 세션별 상태 머신.
+    """
+
+    def __init__(self, config: VADConfig | None = None, *, sample_rate: int = 16_000) -> None:
+        self.config = config or VADConfig()
+        cfg = self.config
+        if cfg.frame_ms <= 0 or cfg.max_utterance_sec <= 0:
+            raise ValueError("frame_ms and max_utterance_sec must be positive.")
+
+        self.sample_rate = sample_rate
+        self.frame_size = int(sample_rate * cfg.frame_ms / 1000)
+        if self.frame_size < 2:
+            raise ValueError("frame_ms is too short for the sample rate.")
+
+        self._min_speech_frames = max(1, round(cfg.min_speech_ms / cfg.frame_ms))
+        self._end_silence_frames = max(1, round(cfg.end_silence_ms / cfg.frame_ms))
+        self._max_frames = max(1, int(cfg.max_utterance_sec * 1000 / cfg.frame_ms))
+        # (절대 샘플 위치, 프레임) 쌍으로 보관
+        self._pre_roll: Deque[Tuple[int, np.ndarray]] = deque(
+            maxlen=max(0, round(cfg.pre_roll_ms / cfg.frame_ms))
+        )
+
+        # 발화 누적 버퍼 (최대 길이 + 시작 판정 대기/프리롤 프레임만큼 미리 할당)
+        max_samples = (self._max_frames + self._pre_roll.maxlen + self._min_speech_frames) * self.frame_size
+        self._utterance = np.empty(max_samples, dtype=np.float32)
+        self._length = 0
+        self._utterance_start: Optional[int] = None
+        self._position = 0  # 다음 프레임의 절대 샘플 위치
+        self._in_speech = False
+        self._onset: List[Tuple[int, np.ndarray]] = []
+        self._silence_run = 0
+        self._noise_floor_db = cfg.min_energy_db - cfg.noise_margin_db
+
+        self.frames = 0
+        self.speech_frames = 0
+        self.utterances = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    def process(self, audio: np.ndarray, *, start_sample: Optional[int] = None) -> List[Utterance]:
+        """
+        frame_size 배수 길이의 float32 오디오를 처리하고, 완성된 발화 목록을 반환한다.
+
+        Args:
+            audio: 연속된 float32 오디오
+            start_sample: audio 첫 샘플의 절대 위치 (None이면 이전 호출에 이어지는 것으로 본다)
+
+        Returns:
+            STT로 보낼 발화 목록 (각 발화의 audio는 호출자가 소유하는 복사본)
+        """
+
+        if start_sample is not None:
+            self._position = start_sample
+        if len(audio) < self.frame_size:
+            return []
+
+        cfg = self.config
+        energy_db, zcr = frame_features(audio, self.frame_size)
+        below_zcr = zcr <= cfg.max_zero_crossing_rate
+        loud_enough = energy_db > cfg.min_energy_db
+
+        utterances: List[Utterance] = []
+        for index in range(len(energy_db)):
+            frame = audio[index * self.frame_size:(index + 1) * self.frame_size]
+            position = self._position + index * self.frame_size
+            energy = float(energy_db[index])
+            threshold = self._noise_floor_db + cfg.noise_margin_db
+            is_speech = bool(loud_enough[index] and below_zcr[index] and energy > threshold)
+            rate = cfg.noise_fall_rate if energy < self._noise_floor_db else cfg.noise_rise_rate
+            self._noise_floor_db += rate * (energy - self._noise_floor_db)
+
+            self.frames += 1
+            self.speech_frames += int(is_speech)
+            utterance = self._step(position, frame, is_speech)
+            if utterance is not None:
+                utterances.append(utterance)
+
+        self._position += len(energy_db) * self.frame_size
+        return utterances
+
+    def flush(self) -> List[Utterance]:
+        """
+        스트림 종료 시 진행 중인 발화를 내보낸다.
+        """
+
+        if not self._in_speech or self._length == 0:
+            self._reset_utterance()
+            return []
+        return [self._emit()]
+
+    def _step(self, position: int, frame: np.ndarray, is_speech: bool) -> Optional[Utterance]:
+        if not self._in_speech:
+            if not is_speech:
+                # 시작 판정 중이던 프레임은 프리롤로 돌린다.
+                for pending in self._onset:
+                    self._pre_roll.append(pending)
+                self._onset.clear()
+                self._pre_roll.append((position, frame.copy()))
+                return None
+
+            self._onset.append((position, frame.copy()))
+            if len(self._onset) < self._min_speech_frames:
+                return None
+
+            self._in_speech = True
+            self._silence_run = 0
+            for buffered_position, buffered in (*self._pre_roll, *self._onset):
+                self._append(buffered_position, buffered)
+            self._pre_roll.clear()
+            self._onset.clear()
+            return None
+
+        self._append(position, frame)
+        self._silence_run = 0 if is_speech else self._silence_run + 1
+
+        if self._silence_run >= self._end_silence_frames:
+            return self._emit()
+        if self._length >= self._max_frames * self.frame_size:
+            # 최대 길이 도달: 발화는 계속되는 것으로 보고 다음 구간을 바로 이어서 쌓는다.
+            utterance = self._emit()
+            self._in_speech = True
+            return utterance
+        return None
+
+    def _append(self, position: int, frame: np.ndarray) -> None:
+        if self._utterance_start is None:
+            self._utterance_start = position
+        end = self._length + len(frame)
+        self._utterance[self._length:end] = frame
+        self._length = end
+
+    def _emit(self) -> Utterance:
+        # 끝부분의 무음 프레임은 STT에 보낼 필요가 없다.
+        trailing = self._silence_run * self.frame_size
+        utterance = Utterance(
+            audio=self._utterance[: max(self._length - trailing, 0)].copy(),
+            start_sample=self._utterance_start if self._utterance_start is not None else self._position,
+        )
+        self.utterances += 1
+        self._reset_utterance()
+        return utterance
+
+    def _reset_utterance(self) -> None:
+        self._length = 0
+        self._utterance_start = None
+        self._in_speech = False
+        self._silence_run = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "frames": self.frames,
+            "speech_frames": self.speech_frames,
+            "speech_ratio": self.speech_frames / self.frames if self.frames else 0.0,
+            "utterances": self.utterances,
+            "noise_floor_db": round(self._noise_floor_db, 1),
+        }
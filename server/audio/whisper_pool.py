@@ -0,0 +1,257 @@
+"""
+Whisper 모델 복제본(replica) 풀과 세션 간 공정 스케줄러.
+
+CPU Whisper는 모델 하나가 한 번에 하나의 발화만 디코딩할 수 있으므로(whisper_service 참고),
+N개의 복제본을 올려 두고 요청마다 비어 있는 복제본 하나를 배정한다. 각 복제본은 자기 전용
+추론 스레드에서 실행되고, PyTorch 연산은 GIL을 놓으므로 복제본 수만큼 코어를 나눠 쓴다.
+
+복제본이 모두 사용 중이면 요청은 세션(/ws/audio 연결)별 대기열에 쌓이고, 복제본이 비면
+대기 중인 세션을 라운드 로빈으로 돌며 하나씩 배정한다. 한 세션이 요청을 몰아서 보내도
+다른 세션의 발화가 그 뒤에 밀리지 않는다. 대기 시간은 stats()로 확인한다.
+
+max_batch > 1이면 복제본 하나에 여러 세션의 발화를 배치로 묶어 보낸다
+(WhisperSTTService.transcribe_batch). 대기 요청이 max_batch보다 적으면 가장 오래된 요청이
+batch_window_ms만큼 기다릴 때까지 더 모은 뒤 배정한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence, Set
+
+import numpy as np
+
+from .whisper_service import WhisperSTTService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Request:
+    audio: np.ndarray
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class WhisperReplicaPool:
+    """
+    Whisper 복제본 N개와 세션별 라운드 로빈 대기열.
+
+    STTServiceProtocol을 따르며, for_session()으로 얻은 핸들을 파이프라인에 넘기면
+    그 세션의 요청이 세션 대기열을 거친다.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[WhisperSTTService],
+        *,
+        max_batch: int = 1,
+        batch_window_ms: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            replicas: 로드된 Whisper 서비스들
+            max_batch: 복제본 하나에 한 번에 보낼 최대 발화 수 (1이면 배치 없음)
+            batch_window_ms: 배치를 채우기 위해 가장 오래된 요청을 더 기다리게 할 최대 시간
+        """
+
+        if not replicas:
+            raise ValueError("at least one Whisper replica is required.")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+
+        self.replicas: List[WhisperSTTService] = list(replicas)
+        self._free: Deque[WhisperSTTService] = deque(self.replicas)
+        # 세션 키 → 대기 요청 (FIFO), 대기 요청이 있는 세션의 라운드 로빈 순서
+        self._queues: Dict[Hashable, Deque[_Request]] = {}
+        self._ready: Deque[Hashable] = deque()
+        self._running: Set[asyncio.Task] = set()
+        self.max_batch = max_batch
+        self.batch_window_sec = batch_window_ms / 1000
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+        self.requests = 0
+        self.batches = 0
+        self.dispatched = 0
+        self.total_wait_sec = 0.0
+        self.max_wait_sec = 0.0
+        self.last_wait_sec = 0.0
+
+    @classmethod
+    def load(
+        cls,
+        count: int,
+        factory: Callable[[], WhisperSTTService],
+        *,
+        threads_per_replica: Optional[int] = None,
+        max_batch: int = 1,
+        batch_window_ms: float = 0.0,
+    ) -> "WhisperReplicaPool":
+        """
+        factory로 복제본 count개를 로드한다.
+
+        Args:
+            count: 복제본 수 (동시에 디코딩할 수 있는 발화 수)
+            factory: WhisperSTTService 하나를 만드는 함수
+            threads_per_replica: 복제본당 PyTorch 연산 스레드 수. 복제본이 여럿이면
+                (코어 수 / 복제본 수)로 줄여야 스레드가 코어 수를 넘어 경합하지 않는다.
+                각 복제본의 추론 스레드에만 적용되며, None이면 PyTorch 기본값을 유지한다.
+            max_batch, batch_window_ms: __init__ 참고
+        """
+
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        replicas = []
+        for index in range(count):
+            replica = factory()
+            if threads_per_replica is not None:
+                replica.limit_threads(threads_per_replica)
+            replicas.append(replica)
+            logger.info("Whisper replica %d/%d loaded", index + 1, count)
+        return cls(replicas, max_batch=max_batch, batch_window_ms=batch_window_ms)
+
+    def for_session(self, session: Hashable) -> "WhisperPoolSession":
+        """세션 하나의 요청을 같은 대기열로 묶는 STT 핸들을 반환한다."""
+
+        return WhisperPoolSession(self, session)
+
+    def transcribe(self, audio_np: np.ndarray) -> str:
+        """
+        동기 호출 (이벤트 루프 밖의 호출자용). 첫 번째 복제본에서 직렬로 실행한다.
+        """
+
+        return self.replicas[0].transcribe(audio_np)
+
+    async def transcribe_async(self, audio_np: np.ndarray, *, session: Hashable = None) -> str:
+        """
+        비어 있는 복제본 하나에서 변환한다. 모두 사용 중이면 세션 대기열에서 차례를 기다린다.
+        """
+
+        request = _Request(audio_np, asyncio.get_running_loop().create_future(), time.monotonic())
+        queue = self._queues.get(session)
+        if queue is None:
+            queue = self._queues[session] = deque()
+            self._ready.append(session)
+        queue.append(request)
+        self.requests += 1
+        self._dispatch()
+        return await request.future
+
+    def _dispatch(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        while self._free and self._ready:
+            delay = self._batch_delay()
+            if delay > 0:
+                # 배치가 덜 찼으면 가장 오래된 요청의 대기 한도까지 더 모은다.
+                self._flush_timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            batch = self._take_batch()
+            if not batch:
+                continue
+            task = asyncio.create_task(self._run(self._free.popleft(), batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _batch_delay(self) -> float:
+        if self.max_batch == 1 or self.batch_window_sec <= 0:
+            return 0.0
+        queued = [request for queue in self._queues.values() for request in queue]
+        if len(queued) >= self.max_batch:
+            return 0.0
+        oldest = min(request.enqueued_at for request in queued)
+        return oldest + self.batch_window_sec - time.monotonic()
+
+    def _take_batch(self) -> List[_Request]:
+        """대기 중인 세션을 라운드 로빈으로 돌며 최대 max_batch개의 요청을 꺼낸다."""
+
+        batch: List[_Request] = []
+        now = time.monotonic()
+        while self._ready and len(batch) < self.max_batch:
+            session = self._ready.popleft()
+            queue = self._queues[session]
+            request = queue.popleft()
+            if queue:
+                # 남은 요청은 다른 세션들 뒤로 보낸다.
+                self._ready.append(session)
+            else:
+                del self._queues[session]
+            if request.future.done():
+                # 기다리던 세션이 끊겨 취소된 요청
+                continue
+
+            wait_sec = now - request.enqueued_at
+            self.dispatched += 1
+            self.total_wait_sec += wait_sec
+            self.max_wait_sec = max(self.max_wait_sec, wait_sec)
+            self.last_wait_sec = wait_sec
+            batch.append(request)
+        return batch
+
+    async def _run(self, replica: WhisperSTTService, batch: List[_Request]) -> None:
+        self.batches += 1
+        try:
+            if len(batch) == 1:
+                texts = [await replica.transcribe_async(batch[0].audio)]
+            else:
+                texts = await replica.transcribe_batch_async([request.audio for request in batch])
+        except Exception as exc:  # pylint: disable=broad-except
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+        else:
+            for request, text in zip(batch, texts):
+                if not request.future.done():
+                    request.future.set_result(text)
+        finally:
+            self._free.append(replica)
+            self._dispatch()
+
+    async def aclose(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        for replica in self.replicas:
+            await replica.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        busy_sec = sum(replica.busy_sec for replica in self.replicas)
+        audio_sec = sum(replica.audio_sec for replica in self.replicas)
+        return {
+            "backend": "whisper",
+            "model": self.replicas[0].model_name,
+            "decode_mode": self.replicas[0].decode_mode,
+            "replicas": len(self.replicas),
+            "busy_replicas": len(self.replicas) - len(self._free),
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "waiting_sessions": len(self._ready),
+            "requests": self.requests,
+            "max_batch": self.max_batch,
+            "avg_batch": round(self.dispatched / self.batches, 2) if self.batches else 0.0,
+            "avg_wait_ms": round(self.total_wait_sec / self.dispatched * 1000, 1) if self.dispatched else 0.0,
+            "max_wait_ms": round(self.max_wait_sec * 1000, 1),
+            "last_wait_ms": round(self.last_wait_sec * 1000, 1),
+            "rtf": round(busy_sec / audio_sec, 3) if audio_sec else None,
+        }
+
+
+class WhisperPoolSession:
+    """
+    WhisperReplicaPool의 세션 핸들 (/ws/audio 연결 하나당 하나).
+    """
+
+    def __init__(self, pool: WhisperReplicaPool, session: Hashable) -> None:
+        self.pool = pool
+        self.session = session
+
+    def transcribe(self, audio_np: np.ndarray) -> str:
+        return self.pool.transcribe(audio_np)
+
+    async def transcribe_async(self, audio_np: np.ndarray) -> str:
+        return await self.pool.transcribe_async(audio_np, session=self.session)
@@ -1,11 +1,29 @@
 """
 Phase 2: Whisper STT 서비스 구현.
+
+Whisper 추론은 CPU/GPU 연산이므로 transcribe_async()는 서비스 전용 실행기(스레드 1개)에서
+실행한다. 서버 기본 스레드 풀을 차지하지 않고, 한 모델에서 디코딩이 동시에 돌지 않는다.
+(Whisper 디코딩은 모델에 kv-cache 훅을 걸었다 떼므로 같은 모델로 동시에 실행할 수 없다.)
+
+Whisper 인코더는 입력 길이와 무관하게 30초 log-mel 창을 처리하므로, 파이프라인은 Whisper를
+쓸 때 1초 청크 대신 발화 단위(최대 WHISPER_MAX_UTTERANCE_SEC)로 모아서 보낸다.
+decode_mode="fast"(기본)는 model.transcribe() 대신 whisper.decode()를 한 번만 호출한다.
+(온도 폴백 재디코딩/구간 탐색 없음, 발화 길이에 맞춘 최대 토큰 수, 30초 패딩 버퍼 재사용)
+호출마다 실시간 배율(RTF = 처리 시간 / 오디오 길이)을 기록한다.
+
+transcribe_batch()는 여러 세션의 발화를 (N, n_mels, 3000) mel 배치로 묶어 인코더를 한 번에
+통과시키고, 디코더도 배치 단위로 함께(lockstep) 토큰을 생성한다. 배치를 모으는 스케줄링은
+whisper_pool.WhisperReplicaPool이 한다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Callable, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -14,6 +32,14 @@ logger = logging.getLogger(__name__)
 
 ModelLoader = Callable[[str], object]
 
+SAMPLE_RATE = 16_000
+# Whisper 인코더 입력 창 (30초, 모델 구조상 고정)
+_WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+DECODE_FAST = "fast"
+DECODE_TRANSCRIBE = "transcribe"
+_DECODE_MODES = (DECODE_FAST, DECODE_TRANSCRIBE)
+
 
 class WhisperNotAvailableError(ImportError):
     """Whisper 패키지가 설치되지 않은 경우 발생하는 예외."""
@@ -34,6 +60,9 @@ class WhisperSTTService:
         language: str = "ko",
         use_fp16: bool = False,
         model_loader: Optional[ModelLoader] = None,
+        decode_mode: str = DECODE_FAST,
+        tokens_per_sec: float = 15.0,
+        no_speech_threshold: float = 0.6,
     ) -> None:
         """
         Args:
@@ -41,11 +70,20 @@ class WhisperSTTService:
             language: 음성 인식 대상 언어 코드
             use_fp16: GPU 사용 등으로 fp16 활성화 여부
             model_loader: 주입 가능한 모델 로더(테스트용)
+            decode_mode: "fast"(단일 greedy 디코딩) 또는 "transcribe"(model.transcribe 그대로)
+            tokens_per_sec: fast 모드에서 오디오 1초당 허용할 최대 토큰 수 (반복 환각 방지)
+            no_speech_threshold: fast 모드에서 이보다 무음 확률이 높으면 빈 문자열 반환
         """
 
+        if decode_mode not in _DECODE_MODES:
+            raise ValueError(f"decode_mode must be one of {_DECODE_MODES}.")
+
         self.model_name = model_name
         self.language = language
         self.use_fp16 = use_fp16
+        self.tokens_per_sec = tokens_per_sec
+        self.no_speech_threshold = no_speech_threshold
+        whisper_module = None
 
         if model_loader is None:
             try:
@@ -67,24 +105,103 @@ class WhisperSTTService:
                 ) from exc
 
             model_loader = whisper.load_model
+            whisper_module = whisper
+        else:
+            try:
+                import whisper as whisper_module  # type: ignore
+            except ImportError:
+                whisper_module = None
 
         logger.info("Loading Whisper model: %s", model_name)
         self.model = model_loader(model_name)
         logger.info("✅ Whisper model loaded: %s", model_name)
 
+        # fast 모드는 whisper.decode / log_mel_spectrogram 과 model.dims 가 필요하다.
+        fast_supported = (
+            whisper_module is not None
+            and hasattr(whisper_module, "decode")
+            and hasattr(self.model, "dims")
+        )
+        if decode_mode == DECODE_FAST and not fast_supported:
+            logger.info("Whisper fast decode unavailable for this model, using model.transcribe")
+            decode_mode = DECODE_TRANSCRIBE
+        self.decode_mode = decode_mode
+        self._whisper = whisper_module
+        # 30초 입력 창 패딩 버퍼 (호출마다 새로 할당하지 않고 앞부분만 덮어쓴다)
+        self._pad_buffer = np.zeros(_WINDOW_SAMPLES, dtype=np.float32) if decode_mode == DECODE_FAST else None
+        self._pad_used = 0
+        self._lock = threading.Lock()
+
+        # 모델 하나당 추론 스레드 하나 (대기 중인 요청은 실행기 큐에서 순서대로 처리)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"whisper-{model_name}")
+        self.requests = 0
+        self.batches = 0
+        self.pending = 0
+        self.busy_sec = 0.0
+        self.audio_sec = 0.0
+        self.last_rtf: Optional[float] = None
+
+    async def transcribe_async(self, audio_np: np.ndarray) -> str:
+        """
+        전용 추론 스레드에서 transcribe()를 실행하고 결과를 기다린다.
+        """
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.transcribe, audio_np)
+        finally:
+            self.pending -= 1
+
+    async def transcribe_batch_async(self, audios: Sequence[np.ndarray]) -> List[str]:
+        """
+        전용 추론 스레드에서 transcribe_batch()를 실행하고 결과를 기다린다.
+        """
+
+        self.pending += len(audios)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.transcribe_batch, audios)
+        finally:
+            self.pending -= len(audios)
+
+    def limit_threads(self, num_threads: int) -> None:
+        """
+        전용 추론 스레드의 PyTorch 연산 스레드 수를 제한한다.
+
+        torch.set_num_threads는 호출한 스레드에서 시작하는 병렬 구간에 적용되므로(OpenMP 빌드)
+        추론 스레드 안에서 호출해 분류기 등 다른 스레드의 PyTorch 연산에는 영향을 주지 않는다.
+        실행기 큐에서 이후의 추론보다 먼저 실행된다.
+        """
+
+        self._executor.submit(_set_torch_threads, num_threads).result()
+
+    async def aclose(self) -> None:
+        """추론 스레드를 정리한다. (서버 종료 시, 진행 중인 추론은 기다리지 않는다)"""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "backend": "whisper",
+            "model": self.model_name,
+            "requests": self.requests,
+            "batches": self.batches,
+            "pending": self.pending,
+            "decode_mode": self.decode_mode,
+            "busy_sec": round(self.busy_sec, 3),
+            "audio_sec": round(self.audio_sec, 3),
+            # 누적/마지막 호출 실시간 배율 (1 미만이어야 실시간 처리 가능)
+            "rtf": round(self.busy_sec / self.audio_sec, 3) if self.audio_sec else None,
+            "last_rtf": round(self.last_rtf, 3) if self.last_rtf is not None else None,
+        }
+
     def transcribe(self, audio_np: np.ndarray) -> str:
         """
         16kHz float32 오디오 배열을 Whisper 모델로 변환하여 텍스트를 반환한다.
         """
 
-        if self.model is None:  # pragma: no cover - 방어 로직
-            raise RuntimeError("Whisper 모델이 로드되지 않았습니다.")
-
-        audio = np.asarray(audio_np, dtype=np.float32)
-        if audio.ndim != 1:
-            raise ValueError("audio_np는 1차원 배열이어야 합니다.")
-        if audio.size == 0:
-            raise ValueError("audio_np는 비어있을 수 없습니다.")
+        audio = self._validate(audio_np)
 
         # 오디오 통계 로깅
         audio_mean = float(np.mean(np.abs(audio)))
@@ -96,8 +213,15 @@ class WhisperSTTService:
         if audio_mean < 0.001:
             logger.warning("[WARN] Audio signal is very quiet (mean_abs=%.4f). STT may fail.", audio_mean)
 
-        result = self.model.transcribe(audio, language=self.language, fp16=self.use_fp16)
-        text = (result.get("text") if isinstance(result, dict) else "") or ""
+        started = time.perf_counter()
+        with self._lock:
+            if self.decode_mode == DECODE_FAST and audio.size <= _WINDOW_SAMPLES:
+                text = self._decode_fast(audio)
+            else:
+                result = self.model.transcribe(audio, language=self.language, fp16=self.use_fp16)
+                text = (result.get("text") if isinstance(result, dict) else "") or ""
+        self._record_timing(audio.size / SAMPLE_RATE, time.perf_counter() - started)
+        self.batches += 1
         
         # STT 결과 로깅
         if text and text.strip():
@@ -107,4 +231,110 @@ class WhisperSTTService:
 
         return text.strip()
 
+    def transcribe_batch(self, audios: Sequence[np.ndarray]) -> List[str]:
+        """
+        여러 발화를 한 번의 배치 인코딩/디코딩으로 변환한다. (fast 모드, 모두 30초 이하일 때)
+
+        그 밖의 경우에는 발화마다 transcribe()를 호출한 것과 같다.
+        """
+
+        batch = [self._validate(audio) for audio in audios]
+        if len(batch) == 1:
+            return [self.transcribe(batch[0])]
+        if self.decode_mode != DECODE_FAST or any(audio.size > _WINDOW_SAMPLES for audio in batch):
+            return [self.transcribe(audio) for audio in batch]
+
+        duration_sec = sum(audio.size for audio in batch) / SAMPLE_RATE
+        started = time.perf_counter()
+        with self._lock:
+            texts = self._decode_fast_batch(batch)
+        self._record_timing(duration_sec, time.perf_counter() - started, count=len(batch))
+        self.batches += 1
+        return [text.strip() for text in texts]
+
+    def _validate(self, audio_np: np.ndarray) -> np.ndarray:
+        if self.model is None:  # pragma: no cover - 방어 로직
+            raise RuntimeError("Whisper 모델이 로드되지 않았습니다.")
+
+        audio = np.asarray(audio_np, dtype=np.float32)
+        if audio.ndim != 1:
+            raise ValueError("audio_np는 1차원 배열이어야 합니다.")
+        if audio.size == 0:
+            raise ValueError("audio_np는 비어있을 수 없습니다.")
+        return audio
+
+    def _padded_mel(self, audio: np.ndarray):
+        """
+        발화를 재사용 버퍼에서 30초 창으로 패딩하고 log-mel 스펙트로그램을 계산한다.
+        """
+
+        pad = self._pad_buffer
+        pad[:audio.size] = audio
+        if self._pad_used > audio.size:
+            pad[audio.size:self._pad_used] = 0.0
+        self._pad_used = audio.size
+
+        # mel 필터뱅크는 whisper가 (장치, n_mels)별로 캐시해 재사용한다.
+        return self._whisper.log_mel_spectrogram(pad, self.model.dims.n_mels, device=self.model.device)
+
+    def _decoding_options(self, duration_sec: float):
+        return self._whisper.DecodingOptions(
+            language=self.language,
+            fp16=self.use_fp16,
+            temperature=0.0,
+            without_timestamps=True,
+            # 짧은 발화에서 224토큰까지 반복 생성하는 환각을 막는다.
+            sample_len=min(224, int(16 + self.tokens_per_sec * duration_sec)),
+        )
+
+    def _is_no_speech(self, result) -> bool:
+        if result.no_speech_prob > self.no_speech_threshold and result.avg_logprob < -1.0:
+            logger.info("[INFO] Whisper fast decode: no speech (p=%.2f)", result.no_speech_prob)
+            return True
+        return False
+
+    def _decode_fast_batch(self, batch: List[np.ndarray]) -> List[str]:
+        """
+        발화 N개의 mel을 (N, n_mels, 3000)으로 쌓아 whisper.decode 한 번으로 변환한다.
+
+        최대 토큰 수는 가장 긴 발화 기준이고, 끝난 발화는 EOT를 유지한 채 나머지를 기다린다.
+        """
+
+        import torch  # type: ignore  # whisper가 설치되어 있으면 torch도 있다.
+
+        mels = torch.stack([self._padded_mel(audio) for audio in batch])
+        longest_sec = max(audio.size for audio in batch) / SAMPLE_RATE
+        results = self._whisper.decode(self.model, mels, self._decoding_options(longest_sec))
+        return ["" if self._is_no_speech(result) else result.text for result in results]
+
+    def _decode_fast(self, audio: np.ndarray) -> str:
+        """
+        발화 하나를 30초 창 한 번의 greedy 디코딩으로 변환한다.
+        """
+
+        mel = self._padded_mel(audio)
+        result = self._whisper.decode(self.model, mel, self._decoding_options(audio.size / SAMPLE_RATE))
+        return "" if self._is_no_speech(result) else result.text
+
+    def _record_timing(self, duration_sec: float, elapsed_sec: float, *, count: int = 1) -> None:
+        rtf = elapsed_sec / duration_sec
+        self.requests += count
+        self.busy_sec += elapsed_sec
+        self.audio_sec += duration_sec
+        self.last_rtf = rtf
+        logger.info(
+            "[INFO] Whisper %s x%d: %.2fs audio in %.0fms (RTF %.2f)",
+            self.decode_mode,
+            count,
+            duration_sec,
+            elapsed_sec * 1000,
+            rtf,
+        )
+
 
+def _set_torch_threads(num_threads: int) -> None:
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        return
+    torch.set_num_threads(num_threads)
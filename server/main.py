@@ -1,25 +1,41 @@
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 import asyncio
+import dataclasses
 import json
 import logging
 import os
+import threading
 import time
 from pathlib import Path
-import io
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, File, UploadFile
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, File, Header, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from PIL import Image
 
+from audio.codecs import ENCODING_PCM16, ENCODINGS
 from audio.pipeline import AudioProcessingPipeline, PipelineOutput, STTServiceProtocol
+from audio.whisper_pool import WhisperReplicaPool
 from audio.whisper_service import WhisperSTTService, WhisperNotAvailableError
 from audio.deepgram_service import DeepgramSTTService, DeepgramNotAvailableError
-from nlp.harmful_classifier import HarmfulTextClassifier, TransformersNotAvailableError
-from services.paddle_ocr_service import get_ocr_service
+from audio.result_protocol import PROTOCOL_JSON, PROTOCOLS
+from audio.stream_session import AudioStreamSession
+from audio.vad import VADConfig
+from nlp.batch_scheduler import ClassifierBatchScheduler
+from nlp.harmful_classifier import (
+    ClassificationResult,
+    HarmfulTextClassifier,
+    TransformersNotAvailableError,
+)
+from nlp.keyword_store import KeywordStore
+from nlp.onnx_backend import OnnxParityError, OnnxRuntimeNotAvailableError
+from services.frame_change import FrameChangeDetector, crop_box, merge_lines
+from services.ocr_pool import OCROverloadedError, OCRWorkerPool
+from services.raw_image import RawImageError, decode_raw, is_raw_content_type
+from utils.readiness import ComponentRegistry
+from utils.result_cache import ResultCache, cache_text_key
 
 # .env 파일 로드 (server 디렉토리 또는 상위 디렉토리에서 찾기)
 LOGGER = logging.getLogger("harmful-filter")
@@ -43,61 +59,301 @@ else:
     LOGGER.warning("[WARN] ⚠️ Using environment variables or system defaults.")
 
 # ============== 전역 변수 ==============
-BAD_WORDS: List[str] = []
+KEYWORDS_PATH = os.path.join(os.path.dirname(__file__), "data", "bad_words.json")
+# 띄어쓰기/자모 분리/초성 약어(3음절 이상)/유사 글자 변형은 TextNormalizer가
+# 매칭 단계에서 처리하므로 사전에는 기본형만 둔다.
+DEFAULT_KEYWORDS: List[str] = [
+    "ㅅㅂ",
+    "ㅂㅅ",
+    "시발",
+    "씨발",
+    "개새",
+    "개새끼",
+    "병신",
+    "새끼",
+    "간나",
+    "개놈",
+    "미친",
+    "미친놈",
+]
+# bad_words.json 변경 감지 주기 (초, 0이면 자동 리로드 비활성화)
+KEYWORDS_RELOAD_INTERVAL_SEC = float(os.getenv("KEYWORDS_RELOAD_INTERVAL_SEC", "5"))
+KEYWORD_STORE = KeywordStore(KEYWORDS_PATH, DEFAULT_KEYWORDS)  # 컴파일된 매처 스냅샷 보관
+# 키워드/분류기 결과 캐시 (OCR/STT에서 반복되는 문장 재분석 방지, 모든 엔드포인트 공유)
+RESULT_CACHE = ResultCache(
+    max_size=int(os.getenv("RESULT_CACHE_SIZE", "4096")),
+    ttl_sec=float(os.getenv("RESULT_CACHE_TTL_SEC", "300")),
+)
+# /analyze/batch 한 번에 받을 수 있는 최대 텍스트 수
+ANALYZE_BATCH_MAX_ITEMS = int(os.getenv("ANALYZE_BATCH_MAX_ITEMS", "1000"))
 STT_SERVICE: Optional[STTServiceProtocol] = None  # DeepgramSTTService 또는 WhisperSTTService
 CLASSIFIER: Optional[HarmfulTextClassifier] = None
+# 모든 세션/엔드포인트의 분류기 호출을 묶어 배치 추론하는 스케줄러
+CLASSIFIER_SCHEDULER: Optional[ClassifierBatchScheduler] = None
+# STT/분류기/OCR 모델 병렬 로딩 및 준비 상태
+MODELS = ComponentRegistry()
+# 열려 있는 /ws/audio 세션 (GET /metrics에서 세션별 처리 지연 보고)
+AUDIO_SESSIONS: Set[AudioStreamSession] = set()
+# 모델이 필요한 요청이 로딩 완료를 기다리는 최대 시간 (초, 초과 시 503)
+MODEL_READY_TIMEOUT_SEC = float(os.getenv("MODEL_READY_TIMEOUT_SEC", "10"))
+# STT 윈도우 길이와 이동 간격 (AUDIO_HOP_SEC < AUDIO_WINDOW_SEC이면 겹치는 슬라이딩 윈도우)
+AUDIO_WINDOW_SEC = float(os.getenv("AUDIO_WINDOW_SEC", "1.0"))
+AUDIO_HOP_SEC = float(os.getenv("AUDIO_HOP_SEC", "0")) or None
+# VAD/발화 단위 분할 (켜져 있으면 AUDIO_WINDOW_SEC/AUDIO_HOP_SEC 대신 발화 단위로 STT 호출)
+AUDIO_VAD_CONFIG = (
+    VADConfig(
+        min_energy_db=float(os.getenv("AUDIO_VAD_MIN_ENERGY_DB", "-45")),
+        end_silence_ms=float(os.getenv("AUDIO_VAD_END_SILENCE_MS", "300")),
+        max_utterance_sec=float(os.getenv("AUDIO_VAD_MAX_UTTERANCE_SEC", "5")),
+    )
+    if os.getenv("AUDIO_VAD", "1") == "1"
+    else None
+)
+# 세션별 수신 큐 크기와 처리 지연 대응 정책 (coalesce | skip_to_live | drop_oldest)
+AUDIO_QUEUE_SIZE = int(os.getenv("AUDIO_QUEUE_SIZE", "64"))
+AUDIO_LAG_POLICY = os.getenv("AUDIO_LAG_POLICY", "coalesce")
+AUDIO_MAX_LAG_SEC = float(os.getenv("AUDIO_MAX_LAG_SEC", "3"))
+# 세션별 오디오 링 버퍼 상한과 초과 시 정책 (drop_oldest | reject)
+AUDIO_BUFFER_MAX_SEC = float(os.getenv("AUDIO_BUFFER_MAX_SEC", "10"))
+AUDIO_OVERFLOW_POLICY = os.getenv("AUDIO_OVERFLOW_POLICY", "drop_oldest")
+# Deepgram 사용 시 /ws/audio 연결당 live 스트리밍 소켓 하나로 STT (0이면 구간마다 HTTP 요청)
+DEEPGRAM_LIVE = os.getenv("DEEPGRAM_LIVE", "1") == "1"
+DEEPGRAM_ENDPOINTING_MS = int(os.getenv("DEEPGRAM_ENDPOINTING_MS", "300"))
+# Whisper(대체 STT)는 30초 창 단위로 디코딩하므로 항상 발화 단위로 모아서 보낸다.
+WHISPER_DECODE_MODE = os.getenv("WHISPER_DECODE_MODE", "fast")
+WHISPER_MAX_UTTERANCE_SEC = min(float(os.getenv("WHISPER_MAX_UTTERANCE_SEC", "15")), 30.0)
+# Whisper 복제본 수 (동시에 디코딩할 수 있는 발화 수)와 복제본당 PyTorch 스레드 수
+WHISPER_REPLICAS = max(1, int(os.getenv("WHISPER_REPLICAS", "1")))
+WHISPER_THREADS_PER_REPLICA = int(
+    os.getenv("WHISPER_THREADS_PER_REPLICA", str(max(1, (os.cpu_count() or 1) // WHISPER_REPLICAS)))
+)
+# 여러 세션의 발화를 한 번에 인코딩/디코딩할 최대 배치 크기와 배치를 모으는 최대 대기 시간
+WHISPER_BATCH_SIZE = max(1, int(os.getenv("WHISPER_BATCH_SIZE", "1")))
+WHISPER_BATCH_WINDOW_MS = float(os.getenv("WHISPER_BATCH_WINDOW_MS", "50"))
+# OCR 작업자 프로세스 수 (0이면 서버 프로세스 안의 스레드 하나)와 동시에 받을 최대 요청 수
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "1"))
+OCR_MAX_PENDING = int(os.getenv("OCR_MAX_PENDING", str(max(1, OCR_WORKERS) * 2)))
+# client_id별 ROI 프레임 변화 감지 (변화 없는 프레임은 OCR 없이 직전 텍스트 재사용,
+# OCR_INCREMENTAL=1이면 바뀐 행 구간만 다시 OCR하고 나머지는 직전 줄 재사용)
+FRAME_CHANGE = FrameChangeDetector(
+    block_size=int(os.getenv("OCR_CHANGE_BLOCK_SIZE", "16")),
+    threshold=float(os.getenv("OCR_CHANGE_THRESHOLD", "6")),
+    ttl_sec=float(os.getenv("OCR_CHANGE_TTL_SEC", "300")),
+    incremental=os.getenv("OCR_INCREMENTAL", "1") == "1",
+    max_changed_ratio=float(os.getenv("OCR_INCREMENTAL_MAX_CHANGED_RATIO", "0.6")),
+    reuse_boxes=os.getenv("OCR_REUSE_BOXES", "0") == "1",
+    box_refresh_sec=float(os.getenv("OCR_BOX_REFRESH_SEC", "10")),
+    min_confidence=float(os.getenv("OCR_REUSE_MIN_CONFIDENCE", "0.8")),
+)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    global STT_SERVICE, CLASSIFIER  # pylint: disable=global-statement
-
-    load_keywords()
 
+def _load_stt_service() -> STTServiceProtocol:
+    """STT 서비스 로드 (Deepgram 우선, 실패 시 Whisper로 대체)"""
     try:
         # Deepgram STT 서비스 초기화
-        STT_SERVICE = DeepgramSTTService(language="ko", model="nova-2")
+        service = DeepgramSTTService(language="ko", model="nova-2")
         LOGGER.info("[INFO] ✅ Deepgram STT Service initialized successfully")
+        return service
     except DeepgramNotAvailableError as exc:
         LOGGER.warning("[WARN] Deepgram STT 초기화 실패: %s", exc)
         LOGGER.warning("[WARN] Whisper STT로 대체 시도...")
-        try:
-            STT_SERVICE = WhisperSTTService(model_name="base")
-            LOGGER.info("[INFO] ✅ Whisper STT Service initialized successfully (fallback)")
-        except WhisperNotAvailableError as whisper_exc:
-            LOGGER.warning("[WARN] Whisper STT 초기화 실패: %s", whisper_exc)
-            STT_SERVICE = None
-        except Exception as whisper_exc:  # pylint: disable=broad-except
-            LOGGER.error("[ERROR] Whisper STT 초기화 중 예상치 못한 오류: %s", whisper_exc, exc_info=True)
-            STT_SERVICE = None
-    except Exception as exc:  # pylint: disable=broad-except
-        LOGGER.error("[ERROR] Deepgram STT 초기화 중 예상치 못한 오류: %s", exc, exc_info=True)
-        STT_SERVICE = None
 
     try:
-        CLASSIFIER = HarmfulTextClassifier()
-        LOGGER.info("[INFO] ✅ Harmful Text Classifier initialized successfully")
-    except TransformersNotAvailableError as exc:
-        LOGGER.warning("[WARN] KoELECTRA 분류기 초기화 실패: %s", exc)
-        CLASSIFIER = None
-    except Exception as exc:  # pylint: disable=broad-except
-        LOGGER.error("[ERROR] Classifier 초기화 중 예상치 못한 오류: %s", exc, exc_info=True)
-        CLASSIFIER = None
+        service = WhisperReplicaPool.load(
+            WHISPER_REPLICAS,
+            lambda: WhisperSTTService(model_name="base", decode_mode=WHISPER_DECODE_MODE),
+            threads_per_replica=WHISPER_THREADS_PER_REPLICA if WHISPER_REPLICAS > 1 else None,
+            max_batch=WHISPER_BATCH_SIZE,
+            batch_window_ms=WHISPER_BATCH_WINDOW_MS,
+        )
+    except WhisperNotAvailableError as whisper_exc:
+        LOGGER.warning("[WARN] Whisper STT 초기화 실패: %s", whisper_exc)
+        raise RuntimeError(f"사용 가능한 STT 서비스가 없습니다: {whisper_exc}") from whisper_exc
+    LOGGER.info("[INFO] ✅ Whisper STT Service initialized successfully (fallback)")
+    return service
 
-    # PaddleOCR 서비스 프리로드 (첫 요청 지연 방지)
+
+def _load_classifier() -> HarmfulTextClassifier:
+    """KoELECTRA 분류기 로드 (ONNX 백엔드 실패 시 torch로 대체)"""
+    classifier_backend = os.getenv("CLASSIFIER_BACKEND", "torch").lower()
     try:
-        ocr_service = get_ocr_service()
-        LOGGER.info("[INFO] ✅ PaddleOCR Service initialized successfully")
-    except Exception as ocr_exc:  # pylint: disable=broad-except
-        LOGGER.error("[ERROR] PaddleOCR 서비스 초기화 실패: %s", ocr_exc, exc_info=True)
-        LOGGER.warning("[WARN] OCR 엔드포인트가 동작하지 않을 수 있습니다.")
+        classifier = HarmfulTextClassifier(backend=classifier_backend)
+    except (OnnxRuntimeNotAvailableError, OnnxParityError) as onnx_exc:
+        LOGGER.warning("[WARN] ONNX 백엔드 초기화 실패, torch 백엔드로 대체: %s", onnx_exc)
+        classifier = HarmfulTextClassifier(backend="torch")
+    LOGGER.info(
+        "[INFO] ✅ Harmful Text Classifier initialized successfully (backend: %s)",
+        classifier.backend,
+    )
+    return classifier
+
+
+async def _on_stt_ready(service: STTServiceProtocol) -> None:
+    global STT_SERVICE  # pylint: disable=global-statement
+    STT_SERVICE = service
+
+
+async def _on_classifier_ready(classifier: HarmfulTextClassifier) -> None:
+    global CLASSIFIER, CLASSIFIER_SCHEDULER  # pylint: disable=global-statement
+    scheduler = ClassifierBatchScheduler(
+        classifier,
+        max_batch_size=int(os.getenv("CLASSIFIER_MAX_BATCH_SIZE", "16")),
+        max_wait_ms=float(os.getenv("CLASSIFIER_MAX_WAIT_MS", "10")),
+        max_queue_size=int(os.getenv("CLASSIFIER_QUEUE_SIZE", "256")),
+    )
+    await scheduler.start()
+    # 스케줄러 시작에 실패하면 컴포넌트는 failed 상태가 되고 전역 변수는 그대로 None이다.
+    CLASSIFIER, CLASSIFIER_SCHEDULER = classifier, scheduler
+
+
+def _load_ocr_pool() -> OCRWorkerPool:
+    """OCR 작업자를 띄우고 작업자마다 PaddleOCR 로드/예열이 끝날 때까지 기다린다."""
 
-    LOGGER.info("[INFO] FastAPI server startup complete")
+    return OCRWorkerPool(OCR_WORKERS, max_pending=OCR_MAX_PENDING).start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_keywords()
+    reload_task: Optional[asyncio.Task] = None
+    if KEYWORDS_RELOAD_INTERVAL_SEC > 0:
+        reload_task = asyncio.create_task(KEYWORD_STORE.watch(KEYWORDS_RELOAD_INTERVAL_SEC))
+
+    # 모델은 각각의 작업 스레드에서 병렬로 로드하며, 서버는 로딩 완료를 기다리지 않고
+    # 바로 요청을 받는다. (키워드 기반 /analyze는 즉시 동작, 모델이 필요한 엔드포인트는
+    # 해당 컴포넌트를 기다리거나 503 응답)
+    MODELS.start("stt", _load_stt_service, on_ready=_on_stt_ready)
+    MODELS.start("classifier", _load_classifier, on_ready=_on_classifier_ready)
+    # PaddleOCR 작업자 풀 프리로드 (첫 요청 지연 방지, OCR은 이벤트 루프 밖에서 실행)
+    # (로딩 중에 종료되면 로딩이 끝난 뒤 작업자 프로세스를 정리한다)
+    MODELS.start("ocr", _load_ocr_pool, dispose=lambda pool: pool.shutdown())
+
+    LOGGER.info("[INFO] FastAPI server startup complete (models loading in background)")
     LOGGER.info("[INFO] Server URL: http://127.0.0.1:8000")
     LOGGER.info("[INFO] API docs: http://127.0.0.1:8000/docs")
-    LOGGER.info("[INFO] STT Service: %s", "✅ Loaded" if STT_SERVICE is not None else "❌ Not loaded")
-    LOGGER.info("[INFO] Classifier: %s", "✅ Loaded" if CLASSIFIER is not None else "❌ Not loaded")
+    LOGGER.info("[INFO] Readiness: GET /health/ready")
     yield
 
+    if reload_task is not None:
+        reload_task.cancel()
+    await MODELS.shutdown()
+    if CLASSIFIER_SCHEDULER is not None:
+        await CLASSIFIER_SCHEDULER.stop()
+    if STT_SERVICE is not None and hasattr(STT_SERVICE, "aclose"):
+        # Deepgram 공유 HTTP 연결 풀 / Whisper 추론 스레드 정리
+        await STT_SERVICE.aclose()
+    ocr_pool = MODELS.get("ocr")
+    if ocr_pool is not None:
+        ocr_pool.shutdown()
+
+
+async def require_component(name: str) -> Any:
+    """
+    모델 컴포넌트가 준비될 때까지 최대 MODEL_READY_TIMEOUT_SEC 기다린 뒤 반환한다.
+    준비되지 않으면 503 응답을 발생시킨다.
+    """
+
+    value = await MODELS.wait(name, timeout=MODEL_READY_TIMEOUT_SEC)
+    if value is None:
+        state = MODELS.state(name)
+        status = state.status if state is not None else "unregistered"
+        if status == "failed":
+            message = f"{name} 모델 로딩에 실패했습니다."
+        else:
+            message = f"{name} 모델이 아직 준비되지 않았습니다. GET /health/ready 로 상태를 확인하세요."
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "component": name,
+                "status": status,
+                "error": state.error if state is not None else None,
+                "message": message,
+            },
+        )
+    return value
+
+
+async def run_ocr(image_data, client_id: Optional[str] = None, image=None):
+    """
+    OCR 작업자 풀에서 이미지를 처리한다. (모델 로딩 중이면 대기, 대기열이 가득 차면 즉시 503)
+
+    client_id가 있으면 그 클라이언트가 마지막으로 OCR한 프레임과 비교해, 변화가 없으면
+    OCR 없이 그때의 텍스트를 돌려준다. 일부만 바뀌었으면 바뀐 행 구간만 OCR(또는 직전 줄
+    상자만 재인식)해 나머지 영역의 직전 줄과 합친다.
+
+    image는 무압축 픽셀 업로드를 감싼 RGB 배열이며, 주면 디코딩 없이 그대로 쓴다.
+
+    Returns:
+        (texts, ocr_time, unchanged)
+    """
+
+    if not client_id:
+        texts, ocr_time = await _call_ocr_pool("extract_text", image_data if image is None else image)
+        return texts, ocr_time, False
+
+    check = await asyncio.to_thread(FRAME_CHANGE.check, client_id, image_data, image)
+    if check.unchanged:
+        return list(check.texts), 0.0, True
+
+    lines, ocr_time = None, 0.0
+    plan = check.plan
+    if plan is not None and plan.recognize:
+        # 검출 없이 직전 줄 상자만 재인식하고, 신뢰도가 낮으면 아래에서 전체를 다시 검출한다.
+        results, ocr_time = await _call_ocr_pool(
+            "recognize", [crop_box(check.image, line.box) for line in plan.recognize]
+        )
+        lines = FRAME_CHANGE.accept_recognition(plan, results)
+        if lines is None:
+            check.plan = plan = None
+    elif plan is not None:
+        crops = [check.image[start:end] for start, end in plan.regions]
+        recognized, ocr_time = await _call_ocr_pool("extract_lines", crops) if crops else ([], 0.0)
+        lines = merge_lines(plan.kept, list(zip(plan.regions, recognized)))
+    if lines is None:
+        (lines,), detect_time = await _call_ocr_pool("extract_lines", [check.image])
+        ocr_time += detect_time
+    FRAME_CHANGE.update(client_id, check, lines)
+    return [line.text for line in lines], ocr_time, False
+
+
+async def read_ocr_upload(
+    file: UploadFile,
+    width: Optional[int],
+    height: Optional[int],
+    stride: Optional[int],
+):
+    """
+    OCR 업로드를 읽는다. 무압축 픽셀 형식(image/x-raw-*)이면 복사 없이 RGB 배열로 감싸고,
+    그 밖의 이미지 파일(PNG 등)은 작업자에서 디코딩하도록 바이트만 반환한다.
+
+    Returns:
+        (image_data, image 또는 None)
+    """
+
+    if not file.content_type or not file.content_type.startswith("image/"):
+        raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
+
+    image_data = await file.read()
+    if not is_raw_content_type(file.content_type):
+        return image_data, None
+    try:
+        return image_data, decode_raw(image_data, file.content_type, width, height, stride)
+    except RawImageError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+async def _call_ocr_pool(method: str, *args):
+    ocr_pool = await require_component("ocr")
+    try:
+        return await getattr(ocr_pool, method)(*args)
+    except OCROverloadedError as exc:
+        LOGGER.warning("[WARN] OCR request rejected: %s", exc)
+        raise HTTPException(
+            status_code=503,
+            detail={"component": "ocr", "status": "overloaded", "message": str(exc)},
+            headers={"Retry-After": "1"},
+        ) from exc
+
 
 app = FastAPI(
     title="유해 표현 필터 API",
@@ -119,14 +375,20 @@ app.add_middleware(
 # ============== 데이터 모델 ==============
 class HealthResponse(BaseModel):
     status: str
+    ready: bool = False  # 모든 모델 컴포넌트 로딩 완료 여부
+    components: Dict[str, Dict[str, Any]] = {}  # 컴포넌트별 status/load_time_ms/error
     keywords_loaded: int
+    keywords_version: int = 0
+    keywords_file_version: Optional[str] = None
+    keywords_built_at: Optional[float] = None  # epoch seconds
+    keywords_build_time_ms: float = 0.0
     stt_loaded: bool = False
     ai_model_loaded: bool = False
 
 
 class AnalyzeRequest(BaseModel):
     text: str
-    use_ai: bool = False  # 확장용 플래그
+    use_ai: bool = False  # True이면 키워드 미검출 시 분류기로 추가 판별
 
 
 class AnalyzeResponse(BaseModel):
@@ -136,66 +398,36 @@ class AnalyzeResponse(BaseModel):
     method: str
     processing_time: float
 
-def load_keywords() -> None:
-    """키워드 파일 로드"""
-    global BAD_WORDS
-    keywords_path = os.path.join(os.path.dirname(__file__), "data", "bad_words.json")
-
-    default_keywords = [
-        "ㅅㅂ",
-        "ㅂㅅ",
-        "시발",
-        "씨발",
-        "시 발",
-        "씨 발",
-        "개새",
-        "개 새",
-        "ㄱㅅㄲ",
-        "병신",
-        "병 신",
-        "ㅄ",
-        "새끼",
-        "새 끼",
-        "간나",
-        "간 나",
-        "개놈",
-        "개 놈",
-        "미친",
-        "미 친",
-        "미친놈",
-        "미친 놈",
-        "미 친 놈",
-    ]
 
-    if os.path.exists(keywords_path):
-        try:
-            with open(keywords_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                BAD_WORDS = data.get("keywords", default_keywords)
-                print(f"[INFO] {len(BAD_WORDS)} keywords loaded")
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"[WARN] failed to load keywords file: {exc}")
-            BAD_WORDS = default_keywords
-    else:
-        print("[WARN] bad_words.json missing. Using default keywords.")
-        BAD_WORDS = default_keywords
-
-        # 폴더 생성 및 기본 파일 저장
-        os.makedirs(os.path.dirname(keywords_path), exist_ok=True)
-        with open(keywords_path, "w", encoding="utf-8") as file:
-            json.dump(
-                {
-                    "keywords": default_keywords,
-                    "version": "1.0",
-                    "updated_at": "2024-11-11",
-                },
-                file,
-                ensure_ascii=False,
-                indent=2,
-            )
-        print("[INFO] default bad_words.json created")
+class AnalyzeBatchRequest(BaseModel):
+    texts: List[str]
+    use_ai: bool = False  # True이면 키워드 미검출 항목을 분류기로 추가 판별
+    batch_size: int = 32  # 분류기 미니배치 크기
 
 
+class AnalyzeBatchItem(BaseModel):
+    has_violation: bool
+    confidence: float
+    matched_keywords: List[str]
+    method: str
+
+
+class AnalyzeBatchTiming(BaseModel):
+    keyword: float  # ms
+    classifier: float  # ms
+    total: float  # ms
+    items_per_sec: float
+
+
+class AnalyzeBatchResponse(BaseModel):
+    count: int
+    keywords_version: int
+    results: List[AnalyzeBatchItem]
+    processing_time: AnalyzeBatchTiming
+
+def load_keywords() -> None:
+    """키워드 파일 로드 및 매처 컴파일 (기존 매처는 원자적으로 교체)"""
+    KEYWORD_STORE.load()
 
 
 def check_keywords(text: str) -> List[str]:
@@ -208,37 +440,44 @@ def check_keywords(text: str) -> List[str]:
     Returns:
         감지된 키워드 목록
     """
-    import re
-    
     if not text or not text.strip():
         return []
 
-    text_lower = text.lower()
-    matched: List[str] = []
-
-    for bad_word in BAD_WORDS:
-        bad_word_lower = bad_word.lower().strip()
-        if not bad_word_lower:
-            continue
-        
-        # 단어 단위 매칭을 위해 정규식 사용
-        # 공백이나 특수문자, 문자열 시작/끝으로 구분된 키워드만 매칭
-        # 한글의 경우 단어 경계가 제대로 작동하지 않을 수 있으므로
-        # 공백이나 특수문자, 문자열 시작/끝으로 구분된 키워드만 매칭
-        # \W는 단어 문자가 아닌 문자 (공백, 특수문자 등)
-        word_boundary_pattern = r'(^|[\s\W])' + re.escape(bad_word_lower) + r'([\s\W]|$)'
-        
-        if re.search(word_boundary_pattern, text_lower):
-            matched.append(bad_word)
-            LOGGER.warning("[ALERT] Keyword detected: '%s' in '%s'", bad_word, text)
-        # 키워드가 전체 텍스트와 정확히 일치하는 경우
-        elif bad_word_lower == text_lower.strip():
-            matched.append(bad_word)
-            LOGGER.warning("[ALERT] Keyword detected (exact match): '%s' in '%s'", bad_word, text)
+    # 사전은 KEYWORD_STORE에서 미리 컴파일되며, 텍스트는 정규화 후 단일 패스로 순회한다.
+    # 공백이나 특수문자, 문자열 시작/끝으로 구분된 키워드만 매칭 (기존 정규식 경계와 동일)
+    # 반환값은 사전 키워드가 아니라 원본 텍스트에 실제로 나타난 표기이다. ("시 발" 등)
+    snapshot = KEYWORD_STORE.snapshot
+    cache_key = ("keywords", snapshot.version, text)
+    cached = RESULT_CACHE.get(cache_key)
+    if cached is None:
+        cached = tuple(snapshot.matcher.find_all(text))
+        RESULT_CACHE.put(cache_key, cached)
+    matched = list(cached)
+    for bad_word in matched:
+        LOGGER.warning("[ALERT] Keyword detected: '%s' in '%s'", bad_word, text)
 
     return matched
 
 
+async def classify_text(text: str) -> ClassificationResult:
+    """
+    분류기 판별 (결과 캐시 → 배치 스케줄러 → 단건 추론 순으로 사용)
+    """
+
+    # 같은 모델이라도 onnx(int8)와 torch 결과는 다를 수 있으므로 백엔드별로 캐시한다.
+    cache_key = ("classifier", CLASSIFIER.model_name, CLASSIFIER.backend, cache_text_key(text))
+    cached = RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if CLASSIFIER_SCHEDULER is not None and CLASSIFIER_SCHEDULER.running:
+        result = await CLASSIFIER_SCHEDULER.predict(text)
+    else:
+        result = await asyncio.to_thread(CLASSIFIER.predict, text)
+    RESULT_CACHE.put(cache_key, result)
+    return result
+
+
 # ============== API 엔드포인트 ==============
 @app.get("/")
 async def root():
@@ -248,27 +487,100 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "health": "GET /health",
+            "liveness": "GET /health/live",
+            "readiness": "GET /health/ready",
+            "metrics": "GET /metrics",
             "docs": "GET /docs",
             "keywords": "GET /keywords",
+            "keywords_reload": "POST /keywords/reload",
+            "analyze_batch": "POST /analyze/batch",
         },
     }
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
+    snapshot = KEYWORD_STORE.snapshot
     return HealthResponse(
         status="ok",
-        keywords_loaded=len(BAD_WORDS),
+        keywords_loaded=len(snapshot.keywords),
+        keywords_version=snapshot.version,
+        keywords_file_version=snapshot.file_version,
+        keywords_built_at=snapshot.built_at,
+        keywords_build_time_ms=snapshot.build_time_ms,
         stt_loaded=STT_SERVICE is not None,
         ai_model_loaded=CLASSIFIER is not None,
+        ready=MODELS.all_ready(),
+        components=MODELS.status(),
     )
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """
+    프로세스 생존 여부 (모델 로딩 상태와 무관)
+    """
+
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    컴포넌트별 준비 상태 (하나라도 준비되지 않았으면 503)
+    """
+
+    ready = MODELS.all_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "keywords": {"status": "ready", "version": KEYWORD_STORE.snapshot.version},
+            "components": MODELS.status(),
+        },
+    )
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """
+    성능 튜닝용 런타임 카운터
+    """
+
+    return {
+        "result_cache": RESULT_CACHE.stats(),
+        "classifier_scheduler": CLASSIFIER_SCHEDULER.stats() if CLASSIFIER_SCHEDULER else None,
+        "audio_sessions": [session.stats() for session in AUDIO_SESSIONS],
+        "stt": STT_SERVICE.stats() if STT_SERVICE is not None and hasattr(STT_SERVICE, "stats") else None,
+        "ocr": MODELS.get("ocr").stats() if MODELS.is_ready("ocr") else None,
+        "ocr_frames": FRAME_CHANGE.stats(),
+        "threads": threading.active_count(),
+    }
+
+
 @app.get("/keywords")
 async def get_keywords():
+    snapshot = KEYWORD_STORE.snapshot
+    return {
+        "total": len(snapshot.keywords),
+        "version": snapshot.version,
+        "keywords": snapshot.keywords,
+    }
+
+
+@app.post("/keywords/reload")
+async def reload_keywords():
+    """
+    bad_words.json을 즉시 다시 읽어 매처를 교체한다. (빌드는 작업 스레드에서 수행)
+    """
+
+    snapshot = await asyncio.to_thread(KEYWORD_STORE.load)
     return {
-        "total": len(BAD_WORDS),
-        "keywords": BAD_WORDS,
+        "total": len(snapshot.keywords),
+        "version": snapshot.version,
+        "file_version": snapshot.file_version,
+        "built_at": snapshot.built_at,
+        "build_time_ms": round(snapshot.build_time_ms, 3),
     }
 
 
@@ -296,7 +608,16 @@ async def analyze_text(request: AnalyzeRequest) -> AnalyzeResponse:
 
     matched_keywords = check_keywords(text)
     has_violation = len(matched_keywords) > 0
-    
+    confidence = 1.0 if has_violation else 0.0
+    method = "keyword"
+
+    if request.use_ai and not has_violation:
+        await require_component("classifier")
+        classification = await classify_text(text)
+        has_violation = classification.is_harmful
+        confidence = classification.confidence
+        method = "ai"
+
     # 상세한 디버깅 로그 추가
     if has_violation:
         LOGGER.warning("[ALERT] ⚠️ HARMFUL DETECTED - Text: '%s', Matched keywords: %s", 
@@ -309,13 +630,97 @@ async def analyze_text(request: AnalyzeRequest) -> AnalyzeResponse:
 
     return AnalyzeResponse(
         has_violation=has_violation,
-        confidence=1.0 if has_violation else 0.0,
+        confidence=confidence,
         matched_keywords=matched_keywords,
-        method="keyword",
+        method=method,
         processing_time=processing_time_ms,
     )
 
 
+@app.post("/analyze/batch", response_model=AnalyzeBatchResponse)
+async def analyze_text_batch(request: AnalyzeBatchRequest) -> AnalyzeBatchResponse:
+    """
+    여러 텍스트를 한 번의 요청으로 분석 (백필/대량 처리용)
+
+    키워드 매칭은 배치 전체에 같은 사전 스냅샷으로 수행하고,
+    분류기는 키워드로 판정되지 않은 항목만 batch_size 단위 미니배치로 호출한다.
+    """
+
+    start_time = time.perf_counter()
+
+    if len(request.texts) > ANALYZE_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"texts는 최대 {ANALYZE_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.",
+        )
+    if request.batch_size <= 0:
+        raise HTTPException(status_code=400, detail="batch_size는 양수여야 합니다.")
+
+    texts = [text.strip() for text in request.texts]
+    snapshot = KEYWORD_STORE.snapshot
+
+    # 1. 키워드 매칭 (배치 전체, 작업 스레드에서 수행하여 이벤트 루프 점유 방지)
+    keyword_start = time.perf_counter()
+    find_all = snapshot.matcher.find_all
+    matched_per_item = await asyncio.to_thread(
+        lambda: [find_all(text) if text else [] for text in texts]
+    )
+    keyword_ms = (time.perf_counter() - keyword_start) * 1000
+
+    results = [
+        AnalyzeBatchItem(
+            has_violation=bool(matched),
+            confidence=1.0 if matched else 0.0,
+            matched_keywords=matched,
+            method="keyword" if text else "no_text",
+        )
+        for text, matched in zip(texts, matched_per_item)
+    ]
+
+    # 2. 분류기 (키워드 미검출 항목만 미니배치로)
+    classifier_ms = 0.0
+    if request.use_ai:
+        await require_component("classifier")
+        pending = [
+            index for index, item in enumerate(results)
+            if item.method == "keyword" and not item.has_violation
+        ]
+        if pending:
+            classifier_start = time.perf_counter()
+            predictions = await asyncio.to_thread(
+                CLASSIFIER.predict_batch,
+                [texts[index] for index in pending],
+                batch_size=request.batch_size,
+            )
+            classifier_ms = (time.perf_counter() - classifier_start) * 1000
+            for index, prediction in zip(pending, predictions):
+                results[index] = AnalyzeBatchItem(
+                    has_violation=prediction.is_harmful,
+                    confidence=prediction.confidence,
+                    matched_keywords=[],
+                    method="ai",
+                )
+
+    total_ms = (time.perf_counter() - start_time) * 1000
+    violations = sum(1 for item in results if item.has_violation)
+    LOGGER.info(
+        "[INFO] Batch analyzed: %d texts, %d violations | keyword: %.2fms | classifier: %.2fms | total: %.2fms",
+        len(results), violations, keyword_ms, classifier_ms, total_ms,
+    )
+
+    return AnalyzeBatchResponse(
+        count=len(results),
+        keywords_version=snapshot.version,
+        results=results,
+        processing_time=AnalyzeBatchTiming(
+            keyword=keyword_ms,
+            classifier=classifier_ms,
+            total=total_ms,
+            items_per_sec=len(results) / (total_ms / 1000) if total_ms > 0 else 0.0,
+        ),
+    )
+
+
 @app.get("/test")
 async def test_text_simple(text: str):
     """
@@ -331,58 +736,74 @@ async def test_text_simple(text: str):
 
 
 @app.post("/api/ocr")
-async def ocr_endpoint(file: UploadFile = File(...)):
+async def ocr_endpoint(
+    file: UploadFile = File(...),
+    client_id: Optional[str] = None,
+    x_image_width: Optional[int] = Header(None),
+    x_image_height: Optional[int] = Header(None),
+    x_image_stride: Optional[int] = Header(None),
+):
     """
     이미지 OCR 엔드포인트
     
     Request:
         - file: 이미지 파일 (multipart/form-data)
+          파트 Content-Type이 image/x-raw-bgra|rgba|rgb이면 무압축 픽셀 버퍼로 받으며,
+          X-Image-Width / X-Image-Height (/ X-Image-Stride) 헤더가 필요하다. (services/raw_image.py 참고)
+        - client_id: (query, 선택) 캡처 클라이언트/ROI 식별자. 주면 직전 OCR 프레임과 같은 프레임은 OCR 생략
         
     Response:
         {
             "texts": ["추출된", "텍스트", "리스트"],
             "processing_time": 0.123,
-            "text_count": 3
+            "text_count": 3,
+            "unchanged": false
         }
     """
     try:
-        # 파일 유효성 검사
-        if not file.content_type or not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
-        
-        # 이미지 로드
-        image_data = await file.read()
-        image = Image.open(io.BytesIO(image_data))
+        # 파일 유효성 검사 (무압축 픽셀 버퍼는 여기서 배열로 감싼다)
+        image_data, image = await read_ocr_upload(file, x_image_width, x_image_height, x_image_stride)
         
-        # OCR 실행
-        ocr_service = get_ocr_service()
-        texts, processing_time = ocr_service.extract_text(image)
+        # 이미지 디코딩과 OCR은 작업자에서 실행 (모델 로딩 실패/타임아웃, 과부하 시 503)
+        texts, processing_time, unchanged = await run_ocr(image_data, client_id, image)
         
         # 결과 반환
         return JSONResponse(content={
             "texts": texts,
             "processing_time": round(processing_time, 3),
-            "text_count": len(texts)
+            "text_count": len(texts),
+            "unchanged": unchanged,
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         LOGGER.error(f"OCR API 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/ocr-and-analyze")
-async def ocr_and_analyze_endpoint(file: UploadFile = File(...)):
+async def ocr_and_analyze_endpoint(
+    file: UploadFile = File(...),
+    client_id: Optional[str] = None,
+    x_image_width: Optional[int] = Header(None),
+    x_image_height: Optional[int] = Header(None),
+    x_image_stride: Optional[int] = Header(None),
+):
     """
     이미지 OCR + 유해성 분석 통합 엔드포인트
     
     Request:
-        - file: 이미지 파일
+        - file: 이미지 파일 (/api/ocr과 같이 무압축 픽셀 버퍼도 가능)
+        - client_id: (query, 선택) 캡처 클라이언트/ROI 식별자. 주면 직전 OCR 프레임과 같은 프레임은
+          OCR 없이 그때의 텍스트를 다시 분석한다. (unchanged=true, processing_time.ocr=0)
         
     Response:
         {
             "texts": ["추출된", "텍스트"],
             "is_harmful": true,
             "harmful_words": ["유해어1"],
+            "unchanged": false,
             "processing_time": {
                 "ocr": 0.123,
                 "analysis": 0.045,
@@ -394,16 +815,11 @@ async def ocr_and_analyze_endpoint(file: UploadFile = File(...)):
         import time
         start_total = time.time()
         
-        # 이미지 로드
-        if not file.content_type or not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
+        # 이미지 로드 (무압축 픽셀 버퍼는 여기서 배열로 감싼다)
+        image_data, image = await read_ocr_upload(file, x_image_width, x_image_height, x_image_stride)
         
-        image_data = await file.read()
-        image = Image.open(io.BytesIO(image_data))
-        
-        # OCR 실행
-        ocr_service = get_ocr_service()
-        texts, ocr_time = ocr_service.extract_text(image)
+        # 이미지 디코딩과 OCR은 작업자에서 실행 (모델 로딩 실패/타임아웃, 과부하 시 503)
+        texts, ocr_time, unchanged = await run_ocr(image_data, client_id, image)
         
         # 텍스트 결합 및 유해성 분석
         combined_text = " ".join(texts)
@@ -420,6 +836,7 @@ async def ocr_and_analyze_endpoint(file: UploadFile = File(...)):
             "texts": texts,
             "is_harmful": has_violation,
             "harmful_words": matched_keywords,
+            "unchanged": unchanged,
             "processing_time": {
                 "ocr": round(ocr_time, 3),
                 "analysis": round(analysis_time, 3),
@@ -427,6 +844,8 @@ async def ocr_and_analyze_endpoint(file: UploadFile = File(...)):
             }
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         LOGGER.error(f"OCR+분석 API 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -438,44 +857,130 @@ async def ocr_and_analyze_endpoint(file: UploadFile = File(...)):
 async def audio_stream(websocket: WebSocket) -> None:
     """
     오디오 바이너리 데이터를 수신하여 버퍼링/STT/유해성 분류 결과를 반환하는 WebSocket 엔드포인트.
+
+    Query:
+        protocol: 결과 전송 형식. "json"(기본) 또는 "binary" (audio/result_protocol.py 참고)
+        acks: "0"이면 buffering 응답 생략 (binary 모드는 기본 생략)
+        encoding: 수신 오디오 형식. "pcm16"(기본), "mulaw", "alaw" (audio/codecs.py 참고)
+        interim: "1"이면 live STT의 확정 전 중간 결과도 전송 (is_final=false)
     """
 
     await websocket.accept()
+
+    requested_protocol = websocket.query_params.get("protocol", PROTOCOL_JSON)
+    protocol = requested_protocol if requested_protocol in PROTOCOLS else PROTOCOL_JSON
+    acks_param = websocket.query_params.get("acks")
+    acks = None if acks_param is None else acks_param not in ("0", "false")
+    encoding = websocket.query_params.get("encoding", ENCODING_PCM16)
+    if encoding not in ENCODINGS:
+        # 형식을 모르는 오디오를 PCM으로 해석하면 잡음만 STT로 가므로 연결을 거부한다.
+        await websocket.send_json(
+            {
+                "status": "error",
+                "detail": f"지원하지 않는 오디오 인코딩입니다: {encoding}",
+                "supported_encodings": list(ENCODINGS),
+            }
+        )
+        await websocket.close(code=1003)  # Unsupported Data
+        return
+    interim = websocket.query_params.get("interim") in ("1", "true")
+
+    # STT 모델이 로딩 중이면 최대 MODEL_READY_TIMEOUT_SEC 대기
+    stt_service = await MODELS.wait("stt", timeout=MODEL_READY_TIMEOUT_SEC)
+
+    # Deepgram이면 연결당 live 스트리밍 세션 사용 (연결은 처리 태스크가 시작할 때)
+    live_session = (
+        stt_service.open_live_session(
+            encoding=encoding,
+            interim_results=interim,
+            endpointing_ms=DEEPGRAM_ENDPOINTING_MS,
+        )
+        if DEEPGRAM_LIVE and isinstance(stt_service, DeepgramSTTService)
+        else None
+    )
+
     # 연결 확인 메시지를 JSON 형식으로 전송
     await websocket.send_json({
         "status": "connected",
-        "message": "Connected (Deepgram STT)",
-        "stt_service": "Deepgram" if STT_SERVICE else "None"
+        "message": f"Connected ({type(stt_service).__name__ if stt_service else 'no STT'})",
+        "stt_service": type(stt_service).__name__ if stt_service else "None",
+        # 협상된 결과 전송 형식 (지원하지 않는 값을 요청하면 json)
+        "protocol": protocol,
+        "requested_protocol": requested_protocol,
+        "encoding": encoding,
+        "stt_mode": "live" if live_session is not None else "chunked",
+        "sample_rate": 16_000,
     })
 
     # STT 서비스가 없으면 에러 반환
-    if STT_SERVICE is None:
+    if stt_service is None:
+        stt_state = MODELS.state("stt")
         await websocket.send_json(
             {
                 "status": "error",
-                "detail": "STT 서비스가 초기화되지 않았습니다. 서버 로그를 확인하세요.",
+                "detail": "STT 서비스가 준비되지 않았습니다. GET /health/ready 로 상태를 확인하세요.",
+                "component_status": stt_state.status if stt_state is not None else "unregistered",
             }
         )
-        await websocket.close(code=1011)
+        await websocket.close(code=1013)  # Try Again Later
         return
     
     # Classifier가 없으면 키워드 기반 분류만 사용
     if CLASSIFIER is None:
-        LOGGER.warning("[WARN] Classifier가 없어 키워드 기반 분류만 사용합니다.")
+        LOGGER.warning("[WARN] Classifier가 준비되지 않아 로딩 완료 전까지 키워드 기반 분류만 사용합니다.")
     
     # 키워드 목록 확인 및 로그
-    LOGGER.info("[INFO] Creating pipeline with %d keywords", len(BAD_WORDS))
-    if not BAD_WORDS:
-        LOGGER.error("[ERROR] BAD_WORDS is empty! Keywords will not be checked.")
+    keyword_snapshot = KEYWORD_STORE.snapshot
+    LOGGER.info(
+        "[INFO] Creating pipeline with %d keywords (version %d)",
+        len(keyword_snapshot.keywords),
+        keyword_snapshot.version,
+    )
+    if not keyword_snapshot.keywords:
+        LOGGER.error("[ERROR] Keyword dictionary is empty! Keywords will not be checked.")
+
+    vad_config = AUDIO_VAD_CONFIG
+    session_stt = stt_service
+    if isinstance(stt_service, (WhisperSTTService, WhisperReplicaPool)):
+        # 1초 청크도 30초로 패딩해 디코딩하므로, AUDIO_VAD 설정과 관계없이 발화 단위로 모은다.
+        vad_config = dataclasses.replace(
+            vad_config or VADConfig(), max_utterance_sec=WHISPER_MAX_UTTERANCE_SEC
+        )
+    if isinstance(stt_service, WhisperReplicaPool):
+        # 복제본이 모두 사용 중이면 연결별 대기열에서 라운드 로빈으로 차례를 기다린다.
+        session_stt = stt_service.for_session(id(websocket))
 
     pipeline = AudioProcessingPipeline(
-        stt_service=STT_SERVICE,
+        stt_service=session_stt,
         classifier=CLASSIFIER,
         sample_rate=16_000,
-        chunk_duration_sec=1.0,
-        keywords=BAD_WORDS,  # 전역 키워드 목록 전달
+        chunk_duration_sec=AUDIO_WINDOW_SEC,
+        hop_duration_sec=None if vad_config is not None else AUDIO_HOP_SEC,
+        vad_config=vad_config,  # 비음성 구간은 STT로 보내지 않음
+        keyword_store=KEYWORD_STORE,  # 리로드 시 교체된 매처를 즉시 사용
+        result_cache=RESULT_CACHE,  # 반복 문구의 키워드/분류 결과 재사용
+        classifier_scheduler=CLASSIFIER_SCHEDULER,  # 세션 간 분류기 배치 추론
+        max_buffer_sec=AUDIO_BUFFER_MAX_SEC,
+        overflow_policy=AUDIO_OVERFLOW_POLICY,
+        encoding=encoding,  # μ-law/A-law는 링 버퍼에 바로 디코딩
     )
 
+    # 수신 태스크(이 핸들러)는 큐에 넣기만 하고, 처리 태스크가 밀린 구간을 모두 처리한다.
+    session = AudioStreamSession(
+        pipeline,
+        websocket.send_json,
+        serialize=_serialize_pipeline_output,
+        queue_size=AUDIO_QUEUE_SIZE,
+        lag_policy=AUDIO_LAG_POLICY,
+        max_lag_sec=AUDIO_MAX_LAG_SEC,
+        protocol=protocol,
+        send_bytes=websocket.send_bytes,
+        acks=acks,
+        live=live_session,
+    )
+    AUDIO_SESSIONS.add(session)
+    processor = session.start()
+
     try:
         while True:
             try:
@@ -489,10 +994,16 @@ async def audio_stream(websocket: WebSocket) -> None:
                 LOGGER.info("[INFO] WebSocket client disconnected: /ws/audio")
                 break
 
+            if processor.done():
+                # 결과 전송 실패 등으로 처리 태스크가 끝났으면 세션 종료
+                if not processor.cancelled() and processor.exception() is not None:
+                    LOGGER.info("[INFO] Audio processing task stopped: %s", processor.exception())
+                break
+
             audio_bytes = message.get("bytes")
             if audio_bytes is None:
                 try:
-                    await websocket.send_json(
+                    await session.send(
                         {
                             "status": "error",
                             "detail": "binary audio data required",
@@ -504,36 +1015,12 @@ async def audio_stream(websocket: WebSocket) -> None:
                     break
                 continue
 
-            try:
-                result = await pipeline.process_audio(audio_bytes)
-                if result is None:
-                    try:
-                        await websocket.send_json({"status": "buffering", "size": len(audio_bytes)})
-                    except Exception as send_err:
-                        LOGGER.warning("[WARN] Failed to send buffering status (connection may be closed): %s", send_err)
-                        break
-                    continue
-
-                # 메시지 전송 전 연결 상태 확인
-                try:
-                    await websocket.send_json(_serialize_pipeline_output(result))
-                except Exception as send_err:
-                    # 연결이 끊어진 경우 - 정상적인 종료로 처리
-                    LOGGER.info("[INFO] WebSocket connection closed while sending result: %s", send_err)
-                    break
-            except Exception as process_err:
-                LOGGER.error("[ERROR] Error processing audio: %s", process_err, exc_info=True)
-                try:
-                    await websocket.send_json(
-                        {
-                            "status": "error",
-                            "detail": f"Audio processing error: {str(process_err)}",
-                        }
-                    )
-                except Exception:
-                    # 연결이 끊어진 경우 - 더 이상 메시지를 보낼 수 없음
-                    LOGGER.info("[INFO] WebSocket connection closed, cannot send error message")
-                    break
+            if pipeline.classifier is None and CLASSIFIER is not None:
+                # 세션 시작 후 로딩이 끝난 분류기를 연결
+                pipeline.classifier = CLASSIFIER
+                pipeline.classifier_scheduler = CLASSIFIER_SCHEDULER
+
+            await session.put(audio_bytes)
 
     except WebSocketDisconnect:
         LOGGER.info("[INFO] WebSocket client disconnected: /ws/audio")
@@ -545,6 +1032,10 @@ async def audio_stream(websocket: WebSocket) -> None:
         except Exception:
             # 이미 연결이 끊어진 경우 무시
             pass
+    finally:
+        await session.close()
+        AUDIO_SESSIONS.discard(session)
+        LOGGER.info("[INFO] Audio session closed: %s", session.stats())
 
 
 def _serialize_pipeline_output(result: PipelineOutput) -> dict:
@@ -2,5 +2,11 @@
 자연어 처리 관련 유틸리티 및 서비스 패키지 초기화.
 """
 
-__all__ = ["harmful_classifier"]
-
+__all__ = [
+    "batch_scheduler",
+    "harmful_classifier",
+    "keyword_matcher",
+    "keyword_store",
+    "onnx_backend",
+    "text_normalizer",
+]
@@ -0,0 +1,198 @@
+"""
+여러 연결/엔드포인트의 분류기 호출을 모아 하나의 배치로 추론하는 스케줄러.
+
+/ws/audio 세션마다 batch=1 추론을 따로 실행하면 같은 CPU 코어를 두고 경쟁하므로,
+요청을 큐에 모았다가 크기 제한(max_batch_size) 또는 짧은 대기 시간(max_wait_ms)에
+도달하면 `HarmfulTextClassifier.predict_batch`로 한 번에 처리하고 결과를 각 호출자의
+future로 돌려준다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .harmful_classifier import ClassificationResult, HarmfulTextClassifier
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    text: str
+    future: "asyncio.Future[ClassificationResult]"
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class ClassifierBatchScheduler:
+    """
+    분류기 요청 마이크로 배칭 스케줄러.
+
+    이벤트 루프 안에서 start()로 워커를 띄운 뒤 predict()를 await하여 사용한다.
+    """
+
+    def __init__(
+        self,
+        classifier: HarmfulTextClassifier,
+        *,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        max_queue_size: int = 256,
+    ) -> None:
+        """
+        Args:
+            classifier: predict_batch를 제공하는 분류기
+            max_batch_size: 한 번에 추론할 최대 요청 수
+            max_wait_ms: 첫 요청 도착 후 배치를 채우기 위해 기다리는 최대 시간
+            max_queue_size: 대기 큐 최대 길이 (가득 차면 predict 호출자가 대기)
+        """
+
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative.")
+
+        self.classifier = classifier
+        self.max_batch_size = max_batch_size
+        self.max_wait_sec = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+        self._queue: Optional["asyncio.Queue[_PendingRequest]"] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.batches = 0
+        self.items = 0
+        self.max_observed_batch = 0
+        self.total_wait_ms = 0.0
+        self.total_inference_ms = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "Classifier batch scheduler started (max_batch=%d, max_wait=%.1fms)",
+            self.max_batch_size,
+            self.max_wait_sec * 1000,
+        )
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        # 처리되지 못한 요청은 호출자가 무한 대기하지 않도록 취소한다.
+        while self._queue is not None and not self._queue.empty():
+            request = self._queue.get_nowait()
+            if not request.future.done():
+                request.future.cancel()
+
+    async def predict(self, text: str) -> ClassificationResult:
+        """
+        분류 요청을 큐에 넣고, 배치 추론 결과를 기다린다.
+        """
+
+        if not self.running or self._queue is None:
+            raise RuntimeError("ClassifierBatchScheduler가 시작되지 않았습니다.")
+
+        if not text or not text.strip():
+            return ClassificationResult(is_harmful=False, confidence=0.0, text="")
+
+        future: "asyncio.Future[ClassificationResult]" = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(text, future))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_sec
+
+            while len(batch) < self.max_batch_size:
+                # 이미 쌓여 있는 요청은 대기 없이 가져온다.
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                # wait_for는 타임아웃과 동시에 완료된 항목을 잃을 수 있어 wait를 사용한다.
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter}, timeout=remaining)
+                if not done:
+                    getter.cancel()
+                    break
+                batch.append(getter.result())
+
+            await self._process(batch)
+
+    async def _process(self, batch: List[_PendingRequest]) -> None:
+        batch = [request for request in batch if not request.future.done()]
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        self.total_wait_ms += sum((started - request.enqueued_at) * 1000 for request in batch)
+
+        try:
+            results = await asyncio.to_thread(
+                self.classifier.predict_batch,
+                [request.text for request in batch],
+                batch_size=len(batch),
+            )
+        except asyncio.CancelledError:
+            for request in batch:
+                if not request.future.done():
+                    request.future.cancel()
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Batched classifier inference failed: %s", exc, exc_info=True)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            return
+        finally:
+            self.batches += 1
+            self.items += len(batch)
+            self.max_observed_batch = max(self.max_observed_batch, len(batch))
+            self.total_inference_ms += (time.perf_counter() - started) * 1000
+
+        for request, result in zip(batch, results):
+            if not request.future.done():
+                request.future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        배치 크기/큐 깊이/대기 시간 관측용 카운터를 반환한다.
+        """
+
+        return {
+            "running": self.running,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_sec * 1000,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            "max_observed_batch": self.max_observed_batch,
+            "avg_wait_ms": self.total_wait_ms / self.items if self.items else 0.0,
+            "avg_inference_ms": self.total_inference_ms / self.batches if self.batches else 0.0,
+        }
@@ -5,8 +5,11 @@ Phase 3: KoELECTRA 기반 유해성 분류기 구현.
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .onnx_backend import OnnxClassifierBackend, softmax
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,9 @@ logger = logging.getLogger(__name__)
 TokenizerLoader = Callable[[str], Any]
 ModelLoader = Callable[[str], Any]
 
+# backend="onnx"일 때 int8 ONNX 모델을 캐시하는 기본 위치 (server/models/onnx)
+DEFAULT_ONNX_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models", "onnx")
+
 
 class TransformersNotAvailableError(ImportError):
     """Transformers 또는 Torch 패키지가 설치되지 않은 경우 발생하는 예외."""
@@ -33,6 +39,7 @@ class HarmfulTextClassifier:
     KoELECTRA 분류기를 활용해 텍스트의 유해성을 판별하는 서비스.
 
     기본적으로 Hugging Face의 `AutoTokenizer`, `AutoModelForSequenceClassification`을 사용한다.
+    backend="onnx"이면 int8 양자화 ONNX 모델을 ONNX Runtime으로 추론한다. (CPU 서버용)
     테스트 용도로 tokenizer/model/torch 모듈을 주입할 수 있다.
     """
 
@@ -42,6 +49,9 @@ class HarmfulTextClassifier:
         *,
         num_labels: int = 2,
         max_length: int = 256,
+        batch_size: int = 32,
+        backend: str = "torch",
+        onnx_cache_dir: Optional[str] = None,
         tokenizer_loader: Optional[TokenizerLoader] = None,
         model_loader: Optional[ModelLoader] = None,
         torch_module: Optional[Any] = None,
@@ -51,22 +61,34 @@ class HarmfulTextClassifier:
             model_name: Hugging Face에 등록된 모델 이름
             num_labels: 분류 라벨 수 (0: 정상, 1: 유해)
             max_length: 토큰 최대 길이
+            batch_size: predict_batch 기본 미니배치 크기
+            backend: 추론 백엔드 ("torch" 또는 "onnx")
+            onnx_cache_dir: ONNX 모델 캐시 디렉터리 (None이면 server/models/onnx)
             tokenizer_loader: 토크나이저 로더 (테스트용 주입 가능)
             model_loader: 모델 로더 (테스트용 주입 가능)
             torch_module: torch 대체 모듈 (테스트용 주입 가능)
         """
 
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"지원하지 않는 backend입니다: {backend}")
+
         self.model_name = model_name
         self.max_length = max_length
+        self.batch_size = batch_size
+        self.backend = backend
+        self._onnx: Optional[OnnxClassifierBackend] = None
 
         if torch_module is None:
             try:
                 import torch  # type: ignore
             except ImportError as exc:  # pragma: no cover - 실제 환경에서만 발생
-                raise TransformersNotAvailableError(
-                    "PyTorch가 설치되어 있지 않습니다. "
-                    "Python 3.11 환경에서 `pip install torch torchaudio` 후 다시 시도하세요."
-                ) from exc
+                # 캐시된 ONNX 모델만 사용하는 경우 torch 없이도 동작한다.
+                if backend != "onnx":
+                    raise TransformersNotAvailableError(
+                        "PyTorch가 설치되어 있지 않습니다. "
+                        "Python 3.11 환경에서 `pip install torch torchaudio` 후 다시 시도하세요."
+                    ) from exc
+                torch = None
             self._torch = torch
         else:
             self._torch = torch_module
@@ -94,6 +116,21 @@ class HarmfulTextClassifier:
         logger.info("Loading KoELECTRA tokenizer: %s", model_name)
         self.tokenizer = tokenizer_loader(model_name)
 
+        if backend == "onnx":
+            self.onnx_cache_dir = onnx_cache_dir or DEFAULT_ONNX_CACHE_DIR
+            self._onnx = OnnxClassifierBackend.load_or_export(
+                model_name,
+                tokenizer=self.tokenizer,
+                model_factory=lambda: model_loader(model_name),
+                cache_dir=self.onnx_cache_dir,
+                intra_op_threads=int(os.getenv("ONNX_INTRA_OP_THREADS", "0")),
+            )
+            # torch 모델은 내보내기 후 버려지므로 상주 메모리에 남지 않는다.
+            self.model = None
+            self.device = "cpu"
+            logger.info("✅ KoELECTRA ONNX int8 model ready: %s", self._onnx.model_path)
+            return
+
         logger.info("Loading KoELECTRA model: %s", model_name)
         self.model = model_loader(model_name)
 
@@ -119,15 +156,73 @@ class HarmfulTextClassifier:
         텍스트가 유해한지 판별한다.
         """
 
-        if not text or not text.strip():
-            return ClassificationResult(is_harmful=False, confidence=0.0, text="")
+        return self.predict_batch([text])[0]
+
+    def predict_batch(
+        self, texts: Sequence[str], *, batch_size: Optional[int] = None
+    ) -> List[ClassificationResult]:
+        """
+        여러 텍스트를 미니배치로 묶어 판별하고, 입력 순서대로 결과를 반환한다.
+
+        입력을 길이순으로 정렬해 비슷한 길이끼리 배치를 구성(버킷팅)하고, 각 배치는
+        max_length가 아니라 배치 내 가장 긴 입력 길이까지만 패딩한다.
+        빈 텍스트는 모델을 거치지 않고 정상(0.0)으로 처리한다.
+
+        Args:
+            texts: 판별할 텍스트 목록
+            batch_size: 미니배치 크기 (None이면 생성 시 지정한 값)
+        """
+
+        if batch_size is None:
+            batch_size = self.batch_size
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
 
         if not hasattr(self.tokenizer, "__call__"):
             raise RuntimeError("Tokenizer가 호출 가능 객체가 아닙니다.")
 
+        results: List[ClassificationResult] = [
+            ClassificationResult(is_harmful=False, confidence=0.0, text="") for _ in texts
+        ]
+        # 문자 길이를 토큰 길이의 근사치로 사용해 버킷팅 (별도 토크나이즈 패스 불필요)
+        pending = sorted(
+            (index for index, text in enumerate(texts) if text and text.strip()),
+            key=lambda index: len(texts[index]),
+        )
+
+        for start in range(0, len(pending), batch_size):
+            indices = pending[start:start + batch_size]
+            confidences, predicted = self._forward([texts[index] for index in indices])
+
+            for row, index in enumerate(indices):
+                results[index] = ClassificationResult(
+                    is_harmful=bool(int(predicted[row].item())),
+                    confidence=float(confidences[row].item()),
+                    text=texts[index],
+                )
+
+        return results
+
+    def _forward(self, texts: List[str]) -> Tuple[Any, Any]:
+        """
+        텍스트 배치를 한 번에 토크나이즈/추론하여 (최대 확률, 예측 라벨) 텐서를 반환한다.
+        """
+
+        if self._onnx is not None:
+            encoded = self.tokenizer(
+                texts,
+                return_tensors="np",
+                padding="longest",
+                truncation=True,
+                max_length=self.max_length,
+            )
+            probs = softmax(self._onnx.run(encoded))
+            return probs.max(axis=-1), probs.argmax(axis=-1)
+
         encoded = self.tokenizer(
-            text,
+            texts,
             return_tensors="pt",
+            padding="longest",
             truncation=True,
             max_length=self.max_length,
         )
@@ -149,15 +244,4 @@ class HarmfulTextClassifier:
             raise RuntimeError("모델 출력에 logits가 없습니다.")
 
         probs = self._torch.nn.functional.softmax(logits, dim=-1)
-        predicted_index = int(self._torch.argmax(probs, dim=-1).item())
-        confidence = float(probs[0][predicted_index].item())
-
-        is_harmful = bool(predicted_index)
-
-        return ClassificationResult(
-            is_harmful=is_harmful,
-            confidence=confidence,
-            text=text,
-        )
-
-
+        return self._torch.max(probs, dim=-1)
@@ -0,0 +1,188 @@
+"""
+키워드 사전을 한 번만 컴파일하여 단일 패스로 매칭하는 Aho-Corasick 매처.
+
+기존 `check_keywords`는 호출마다 키워드 개수만큼 정규식을 생성/실행했기 때문에
+사전 크기에 비례하여 비용이 증가했다. 이 매처는 사전을 트라이 오토마톤으로
+미리 컴파일하고, 텍스트를 한 번만 순회하면서 모든 키워드 출현 위치를 찾는다.
+
+TextNormalizer를 지정하면 키워드의 정규화 형태(및 초성 약어)로 색인하고 입력도
+같은 방식으로 정규화하여, 띄어쓰기/자모/유사 글자 변형을 한 번의 순회로 처리한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .text_normalizer import NormalizedText, TextNormalizer
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 `\\w`와 동일한 기준으로 단어 문자 여부를 판별한다."""
+
+    return ch.isalnum() or ch == "_"
+
+
+def _is_choseong(ch: str) -> bool:
+    return "\u1100" <= ch <= "\u1112"
+
+
+def _splits_character(normalized: NormalizedText, start: int, end: int) -> bool:
+    """
+    정규화 텍스트의 [start, end) 매칭이 원본 문자(음절)의 중간에서 시작하거나 끝나는지 판별한다.
+
+    자모로 분해한 텍스트에서는 "간나"가 "간난"의 "간나ㄴ" 앞부분에 매칭되는 것처럼 음절 일부만
+    겹칠 수 있다. 단, 초성으로 끝나는 매칭("ㅅㅂ" 약어가 "ㅅ발"의 ㅂ 초성에 매칭)은 의도된 동작이다.
+    """
+
+    offsets = normalized.offsets
+    if start > 0 and offsets[start - 1] == offsets[start]:
+        return True
+    if end < len(offsets) and offsets[end] == offsets[end - 1]:
+        return not _is_choseong(normalized.text[end - 1])
+    return False
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """텍스트 내 키워드 출현 정보 (start/end는 원본 텍스트 기준)."""
+
+    keyword: str  # 사전에 등록된 원본 키워드
+    start: int
+    end: int
+    surface: str  # 원본 텍스트에 실제로 나타난 표기
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤 기반 다중 키워드 매처.
+
+    normalizer가 없으면 키워드는 소문자 + 양끝 공백 제거 후 컴파일된다.
+    `whole_word=True`이면 원본 텍스트 기준으로 기존 정규식
+    `(^|[\\s\\W])keyword([\\s\\W]|$)`와 동일한 경계 조건을 적용한다.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        *,
+        normalizer: Optional[TextNormalizer] = None,
+    ) -> None:
+        """
+        Args:
+            keywords: 원본 키워드 목록 (빈 문자열은 무시)
+            normalizer: 키워드/입력 정규화기 (None이면 소문자 비교만 수행)
+        """
+
+        self.keywords: List[str] = list(keywords)
+        self.normalizer = normalizer
+
+        # 상태 0은 루트. 각 상태는 (문자 → 다음 상태) 전이 테이블을 가진다.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태별 출력: (패턴 길이, 키워드 인덱스) 목록
+        self._output: List[List[Tuple[int, int]]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            if normalizer is None:
+                patterns = [keyword.lower().strip()]
+            else:
+                patterns = normalizer.keyword_variants(keyword)
+            for pattern in patterns:
+                if pattern:
+                    self._add_pattern(pattern, index)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _add_pattern(self, pattern: str, index: int) -> None:
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append((len(pattern), index))
+
+    def _build_failure_links(self) -> None:
+        queue: List[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                # 실패 링크의 출력을 병합하여 매칭 시 링크를 따라갈 필요를 없앤다.
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str, *, whole_word: bool = True) -> List[KeywordMatch]:
+        """
+        텍스트 내 모든 키워드 출현 위치를 반환한다.
+
+        Args:
+            text: 분석할 텍스트 (내부에서 소문자 변환 또는 정규화)
+            whole_word: True이면 원본 텍스트 기준 단어 경계 조건을 적용
+
+        Returns:
+            출현 순서(끝 위치 기준)로 정렬된 KeywordMatch 목록
+        """
+
+        if not text:
+            return []
+
+        normalized = None
+        if self.normalizer is None:
+            haystack = text.lower()
+        else:
+            normalized = self.normalizer.normalize(text)
+            haystack = normalized.text
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        length = len(text)
+        matches: List[KeywordMatch] = []
+
+        state = 0
+        for pos, ch in enumerate(haystack):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+
+            for pattern_len, index in output[state]:
+                if normalized is None:
+                    start, end = pos + 1 - pattern_len, pos + 1
+                else:
+                    if _splits_character(normalized, pos + 1 - pattern_len, pos + 1):
+                        continue
+                    start, end = normalized.span(pos + 1 - pattern_len, pos + 1)
+                if whole_word:
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if end < length and _is_word_char(text[end]):
+                        continue
+                matches.append(KeywordMatch(self.keywords[index], start, end, text[start:end]))
+
+        return matches
+
+    def find_all(self, text: str, *, whole_word: bool = True) -> List[str]:
+        """
+        텍스트에서 감지된 키워드의 실제 표기를 출현 순서대로 중복 없이 반환한다.
+        """
+
+        found: Dict[str, None] = {}
+        for match in self.iter_matches(text, whole_word=whole_word):
+            found.setdefault(match.surface, None)
+        return list(found)
@@ -0,0 +1,198 @@
+"""
+핫 리로드 가능한 키워드 사전 저장소.
+
+`bad_words.json`을 읽어 KeywordMatcher를 컴파일하고, 결과를 불변 스냅샷으로 보관한다.
+파일이 바뀌면 백그라운드 스레드에서 새 매처를 만든 뒤 스냅샷 참조 하나만 교체하므로,
+요청 처리 중인 코드는 항상 완전한 이전/새 매처 중 하나를 보게 되며 잠금 없이 읽는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .keyword_matcher import KeywordMatcher
+from .text_normalizer import TextNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KeywordSnapshot:
+    """특정 시점의 키워드 사전과 컴파일된 매처."""
+
+    keywords: List[str]
+    matcher: KeywordMatcher
+    version: int  # 서버 기동 후 빌드 횟수 (1부터 증가)
+    file_version: Optional[str]  # bad_words.json의 "version" 필드
+    built_at: float  # 빌드 완료 시각 (epoch seconds)
+    build_time_ms: float
+
+
+class KeywordStore:
+    """
+    키워드 파일을 감시하며 매처를 원자적으로 교체하는 저장소.
+    """
+
+    DEFAULT_FILE_VERSION = "1.0"
+
+    def __init__(
+        self,
+        path: str,
+        default_keywords: Sequence[str],
+        *,
+        normalizer: Optional[TextNormalizer] = None,
+    ) -> None:
+        """
+        Args:
+            path: bad_words.json 경로
+            default_keywords: 파일이 없거나 읽기에 실패했을 때 사용할 키워드
+            normalizer: 매처에 사용할 정규화기 (None이면 기본 TextNormalizer)
+        """
+
+        self.path = path
+        self.default_keywords = list(default_keywords)
+        self.normalizer = normalizer or TextNormalizer()
+        self._reload_lock = threading.Lock()
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        self._snapshot = self._build(self.default_keywords, None, version=0)
+
+    @property
+    def snapshot(self) -> KeywordSnapshot:
+        return self._snapshot
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        return self._snapshot.matcher
+
+    def load(self) -> KeywordSnapshot:
+        """
+        키워드 파일을 무조건 다시 읽어 매처를 빌드하고 교체한다.
+
+        최초 로드에서 파일이 없으면 기본 키워드로 파일을 생성한다.
+        이미 로드된 상태에서 파일 읽기에 실패하면 기존 스냅샷을 유지한다.
+        """
+
+        with self._reload_lock:
+            return self._load_locked()
+
+    def reload_if_changed(self) -> bool:
+        """
+        파일의 mtime/크기가 마지막 로드 이후 바뀐 경우에만 다시 로드한다.
+
+        Returns:
+            새 스냅샷으로 교체되었으면 True
+        """
+
+        with self._reload_lock:
+            if self._stat() == self._file_stamp:
+                return False
+            previous = self._snapshot
+            return self._load_locked() is not previous
+
+    async def watch(self, interval_sec: float) -> None:
+        """
+        interval_sec 간격으로 파일 변경을 확인하는 백그라운드 루프.
+        파일 확인과 매처 빌드는 작업 스레드에서 수행하여 이벤트 루프를 막지 않는다.
+        """
+
+        logger.info("Watching keyword file every %.1fs: %s", interval_sec, self.path)
+        while True:
+            await asyncio.sleep(interval_sec)
+            try:
+                await asyncio.to_thread(self.reload_if_changed)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Keyword reload check failed: %s", exc, exc_info=True)
+
+    def _load_locked(self) -> KeywordSnapshot:
+        initial = self._snapshot.version == 0
+        stamp = self._stat()
+
+        if stamp is None:
+            if not initial:
+                logger.warning("Keyword file disappeared; keeping version %d", self._snapshot.version)
+                return self._snapshot
+            logger.warning("bad_words.json missing. Using default keywords.")
+            keywords, file_version = self.default_keywords, self.DEFAULT_FILE_VERSION
+            self._write_defaults()
+            stamp = self._stat()
+        else:
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                keywords = data.get("keywords", self.default_keywords)
+                # "keywords": "시발" 처럼 문자열이면 list()가 글자 단위로 쪼개므로 형식을 먼저 확인한다.
+                if not isinstance(keywords, list) or not all(isinstance(word, str) for word in keywords):
+                    raise ValueError("'keywords' must be a list of strings")
+                keywords = list(keywords)
+                file_version = data.get("version")
+                # "version": 2 처럼 숫자로 적힌 버전도 문자열로 보관한다. (/health 응답 형식)
+                file_version = str(file_version) if file_version is not None else None
+            except Exception as exc:  # pylint: disable=broad-except
+                if not initial:
+                    logger.warning(
+                        "Failed to reload keywords file (keeping version %d): %s",
+                        self._snapshot.version,
+                        exc,
+                    )
+                    return self._snapshot
+                logger.warning("Failed to load keywords file: %s", exc)
+                keywords, file_version = self.default_keywords, None
+
+        snapshot = self._build(keywords, file_version, version=self._snapshot.version + 1)
+        # 참조 교체 한 번으로 모든 엔드포인트/파이프라인에 새 매처가 반영된다.
+        self._snapshot = snapshot
+        self._file_stamp = stamp
+        logger.info(
+            "%d keywords loaded (version %d, build %.1fms)",
+            len(snapshot.keywords),
+            snapshot.version,
+            snapshot.build_time_ms,
+        )
+        return snapshot
+
+    def _build(
+        self, keywords: List[str], file_version: Optional[str], *, version: int
+    ) -> KeywordSnapshot:
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords, normalizer=self.normalizer)
+        build_time_ms = (time.perf_counter() - start) * 1000
+        return KeywordSnapshot(
+            keywords=list(keywords),
+            matcher=matcher,
+            version=version,
+            file_version=file_version,
+            built_at=time.time(),
+            build_time_ms=build_time_ms,
+        )
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _write_defaults(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "keywords": self.default_keywords,
+                        "version": self.DEFAULT_FILE_VERSION,
+                        "updated_at": time.strftime("%Y-%m-%d"),
+                    },
+                    file,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            logger.info("default bad_words.json created")
+        except OSError as exc:
+            logger.warning("Failed to create default bad_words.json: %s", exc)
@@ -0,0 +1,258 @@
+"""
+KoELECTRA 분류기용 ONNX Runtime(int8 동적 양자화) 백엔드.
+
+최초 1회 PyTorch 모델을 ONNX로 내보내고 int8 동적 양자화를 적용해 디스크에 캐시한다.
+이후 기동 시에는 캐시된 모델만 ONNX Runtime으로 로드하므로 PyTorch 모델을 메모리에
+올리지 않으며, CPU 추론 지연과 상주 메모리가 줄어든다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 직후 torch 출력과 비교할 기본 문장
+DEFAULT_PARITY_TEXTS = [
+    "안녕하세요 오늘 날씨가 좋네요",
+    "이 게임 진짜 재밌다",
+    "너 정말 짜증나게 하네",
+    "같이 파티 하실 분 구합니다",
+]
+
+_MODEL_FILE = "model.int8.onnx"
+_META_FILE = "meta.json"
+
+
+class OnnxRuntimeNotAvailableError(ImportError):
+    """onnx 또는 onnxruntime 패키지가 설치되지 않은 경우 발생하는 예외."""
+
+
+class OnnxParityError(RuntimeError):
+    """양자화된 ONNX 모델의 출력이 torch 모델과 허용 오차 이상 다른 경우 발생하는 예외."""
+
+
+@dataclass
+class ParityReport:
+    """torch 모델 대비 ONNX 모델 출력 비교 결과."""
+
+    samples: int
+    max_abs_diff: float  # 클래스 확률 기준 최대 절대 오차
+    label_agreement: float  # 예측 라벨 일치 비율 (0.0 ~ 1.0)
+
+    def passed(self, tolerance: float) -> bool:
+        return self.label_agreement == 1.0 and self.max_abs_diff <= tolerance
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def compare_outputs(torch_probs: np.ndarray, onnx_probs: np.ndarray) -> ParityReport:
+    """
+    두 백엔드의 클래스 확률 배열 (batch, num_labels)을 비교한다.
+    """
+
+    torch_probs = np.asarray(torch_probs, dtype=np.float32)
+    onnx_probs = np.asarray(onnx_probs, dtype=np.float32)
+    if torch_probs.shape != onnx_probs.shape:
+        raise ValueError(f"출력 형상이 다릅니다: {torch_probs.shape} != {onnx_probs.shape}")
+
+    agreement = np.mean(torch_probs.argmax(axis=-1) == onnx_probs.argmax(axis=-1))
+    return ParityReport(
+        samples=int(torch_probs.shape[0]),
+        max_abs_diff=float(np.max(np.abs(torch_probs - onnx_probs))) if torch_probs.size else 0.0,
+        label_agreement=float(agreement) if torch_probs.size else 1.0,
+    )
+
+
+class OnnxClassifierBackend:
+    """
+    ONNX Runtime 세션을 감싸 토크나이저 출력(numpy)을 logits로 변환한다.
+    """
+
+    def __init__(self, session: Any, *, model_path: Optional[str] = None) -> None:
+        """
+        Args:
+            session: onnxruntime.InferenceSession (테스트용 가짜 세션 주입 가능)
+            model_path: 로드된 ONNX 모델 경로
+        """
+
+        self.session = session
+        self.model_path = model_path
+        self.input_names: List[str] = [item.name for item in session.get_inputs()]
+
+    def run(self, encoded: Dict[str, Any]) -> np.ndarray:
+        """
+        토크나이저 출력 중 모델 입력에 해당하는 항목만 int64로 전달해 logits를 반환한다.
+        """
+
+        feeds = {
+            name: np.asarray(encoded[name], dtype=np.int64)
+            for name in self.input_names
+            if name in encoded
+        }
+        logits = self.session.run(None, feeds)[0]
+        return np.asarray(logits, dtype=np.float32)
+
+    @classmethod
+    def load_or_export(
+        cls,
+        model_name: str,
+        *,
+        tokenizer: Any,
+        model_factory: Callable[[], Any],
+        cache_dir: str,
+        parity_texts: Sequence[str] = DEFAULT_PARITY_TEXTS,
+        parity_tolerance: float = 0.1,
+        intra_op_threads: int = 0,
+    ) -> "OnnxClassifierBackend":
+        """
+        캐시된 int8 ONNX 모델이 있으면 로드하고, 없으면 torch 모델을 내보내 캐시한다.
+
+        Args:
+            model_name: Hugging Face 모델 이름 (캐시 디렉터리 이름으로 사용)
+            tokenizer: 해당 모델의 토크나이저
+            model_factory: 내보내기가 필요할 때만 호출되는 torch 모델 로더
+            cache_dir: ONNX 모델 캐시 루트 디렉터리
+            parity_texts: 내보내기 직후 torch 출력과 비교할 문장
+            parity_tolerance: 허용하는 최대 확률 오차
+            intra_op_threads: ONNX Runtime 연산 내 스레드 수 (0이면 기본값)
+        """
+
+        ort = _import_onnxruntime()
+        target_dir = os.path.join(cache_dir, model_name.replace("/", "__"))
+        model_path = os.path.join(target_dir, _MODEL_FILE)
+
+        if not os.path.exists(model_path):
+            _export_quantized(
+                model_name,
+                tokenizer=tokenizer,
+                model=model_factory(),
+                target_dir=target_dir,
+                parity_texts=parity_texts,
+                parity_tolerance=parity_tolerance,
+                ort=ort,
+            )
+        else:
+            logger.info("Loading cached ONNX model: %s", model_path)
+
+        return cls(_create_session(ort, model_path, intra_op_threads), model_path=model_path)
+
+
+def _import_onnxruntime() -> Any:
+    try:
+        import onnxruntime  # type: ignore
+    except ImportError as exc:  # pragma: no cover - 실제 환경에서만 발생
+        raise OnnxRuntimeNotAvailableError(
+            "onnxruntime 패키지가 설치되어 있지 않습니다. "
+            "`pip install onnx onnxruntime` 후 다시 시도하세요."
+        ) from exc
+    return onnxruntime
+
+
+def _create_session(ort: Any, model_path: str, intra_op_threads: int) -> Any:
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if intra_op_threads > 0:
+        options.intra_op_num_threads = intra_op_threads
+    return ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def _export_quantized(
+    model_name: str,
+    *,
+    tokenizer: Any,
+    model: Any,
+    target_dir: str,
+    parity_texts: Sequence[str],
+    parity_tolerance: float,
+    ort: Any,
+) -> None:  # pragma: no cover - torch/onnxruntime 실제 환경에서만 실행
+    try:
+        import torch  # type: ignore
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+    except ImportError as exc:
+        raise OnnxRuntimeNotAvailableError(
+            "ONNX 내보내기에는 torch, onnx, onnxruntime 패키지가 필요합니다."
+        ) from exc
+
+    start = time.perf_counter()
+    model.eval()
+    sample = tokenizer(list(parity_texts), return_tensors="pt", padding="longest")
+    input_names = list(sample.keys())
+
+    class _LogitsOnly(torch.nn.Module):
+        def __init__(self, wrapped: Any) -> None:
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, *inputs: Any) -> Any:
+            return self.wrapped(**dict(zip(input_names, inputs))).logits
+
+    work_dir = tempfile.mkdtemp(prefix="onnx-export-")
+    try:
+        fp32_path = os.path.join(work_dir, "model.fp32.onnx")
+        int8_path = os.path.join(work_dir, _MODEL_FILE)
+
+        logger.info("Exporting %s to ONNX...", model_name)
+        torch.onnx.export(
+            _LogitsOnly(model),
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes={
+                **{name: {0: "batch", 1: "sequence"} for name in input_names},
+                "logits": {0: "batch"},
+            },
+            opset_version=14,
+        )
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+
+        with torch.no_grad():
+            torch_probs = torch.softmax(model(**sample).logits, dim=-1).numpy()
+        backend = OnnxClassifierBackend(_create_session(ort, int8_path, 0), model_path=int8_path)
+        onnx_probs = softmax(backend.run({key: value.numpy() for key, value in sample.items()}))
+        report = compare_outputs(torch_probs, onnx_probs)
+        logger.info(
+            "ONNX parity: max_abs_diff=%.4f, label_agreement=%.2f (%d samples)",
+            report.max_abs_diff,
+            report.label_agreement,
+            report.samples,
+        )
+        if not report.passed(parity_tolerance):
+            raise OnnxParityError(
+                f"양자화 모델 출력이 torch와 다릅니다 (max_abs_diff={report.max_abs_diff:.4f}, "
+                f"label_agreement={report.label_agreement:.2f})"
+            )
+
+        os.makedirs(target_dir, exist_ok=True)
+        shutil.move(int8_path, os.path.join(target_dir, _MODEL_FILE))
+        with open(os.path.join(target_dir, _META_FILE), "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "model_name": model_name,
+                    "input_names": input_names,
+                    "quantization": "dynamic-int8",
+                    "parity": asdict(report),
+                    "export_time_sec": round(time.perf_counter() - start, 3),
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+        logger.info("✅ ONNX int8 model cached: %s", target_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
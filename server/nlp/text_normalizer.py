@@ -0,0 +1,195 @@
+"""
+우회 표기에 강한 키워드 매칭을 위한 한국어 텍스트 정규화.
+
+정규화 단계 (문자 단위 단일 패스, 사전 계산된 변환 테이블 사용):
+    1. 공백/문장부호 제거 ("시 발", "시.발" → "시발")
+    2. 한글 음절을 초성/중성/종성 자모로 분해 ("ㅅ발"이 초성 약어 "ㅅㅂ"와 매칭됨)
+    3. 단독 호환 자모(ㅅ, ㅂ, ㅄ 등)를 초성/중성 자모로 변환 ("ㅅㅂ" 약어 처리)
+    4. 숫자/라틴 문자 유사 글자 통일 ("시1발", "b1tch")
+    5. 연속된 동일 문자 축약
+
+정규화된 각 문자는 원본 텍스트의 인덱스를 기억하므로, 매칭 결과를 원본 위치로
+되돌려 사용자가 실제로 본 표기를 보고할 수 있다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_COUNT = 11172
+_CHOSEONG_BASE = 0x1100
+_JUNGSEONG_BASE = 0x1161
+_JONGSEONG_BASE = 0x11A7
+
+# 호환 자모 자음 → 초성 인덱스 순서
+# 단독 자음은 항상 초성으로 취급한다. 종성과 구분해야 "갓바"(ᆺ+ᄇ)가 "ㅅㅂ"로 오탐되지 않는다.
+_COMPAT_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 초성으로 쓸 수 없는 겹자음은 구성 자음열로 분해
+_COMPAT_CLUSTERS = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+# 호환 자모 모음(ㅏ~ㅣ)은 중성 자모와 같은 순서
+_COMPAT_VOWEL_START = 0x314F
+_COMPAT_VOWEL_END = 0x3163
+
+_JUNGSEONG_I = chr(_JUNGSEONG_BASE + 20)  # ㅣ
+_CHOSEONG_IEUNG = chr(_CHOSEONG_BASE + 11)  # ㅇ
+
+# 유사 글자 그룹: 그룹 내 모든 문자를 대표 문자로 치환한다.
+_LOOKALIKE_GROUPS = {
+    _JUNGSEONG_I: "1li|",
+    _CHOSEONG_IEUNG: "0o",
+    "a": "4@",
+    "e": "3",
+    "s": "5$",
+    "t": "7",
+}
+
+
+def _build_translation_table(fold_lookalikes: bool) -> Dict[str, str]:
+    table: Dict[str, str] = {}
+
+    for ch in map(chr, range(0x21, 0x7F)):
+        table[ch] = ch.lower() if ch.isalnum() or ch == "_" else ""
+
+    for index, ch in enumerate(_COMPAT_CHOSEONG):
+        table[ch] = chr(_CHOSEONG_BASE + index)
+    for ch, cluster in _COMPAT_CLUSTERS.items():
+        table[ch] = "".join(table[part] for part in cluster)
+    for code in range(_COMPAT_VOWEL_START, _COMPAT_VOWEL_END + 1):
+        table[chr(code)] = chr(_JUNGSEONG_BASE + code - _COMPAT_VOWEL_START)
+
+    for offset in range(_SYLLABLE_COUNT):
+        choseong, rest = divmod(offset, 588)
+        jungseong, jongseong = divmod(rest, 28)
+        jamo = chr(_CHOSEONG_BASE + choseong) + chr(_JUNGSEONG_BASE + jungseong)
+        if jongseong:
+            jamo += chr(_JONGSEONG_BASE + jongseong)
+        table[chr(_SYLLABLE_BASE + offset)] = jamo
+
+    if fold_lookalikes:
+        for canonical, members in _LOOKALIKE_GROUPS.items():
+            for member in members:
+                table[member] = canonical
+                table[member.upper()] = canonical
+
+    # 전각 ASCII (！ ~ ～)는 대응하는 ASCII 문자와 동일하게 처리
+    for code in range(0xFF01, 0xFF5F):
+        table[chr(code)] = table[chr(code - 0xFEE0)]
+
+    return table
+
+
+_FOLDING_TABLE = _build_translation_table(fold_lookalikes=True)
+_PLAIN_TABLE = _build_translation_table(fold_lookalikes=False)
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """정규화 결과와 원본 인덱스 매핑."""
+
+    text: str
+    offsets: List[int]  # offsets[i] = text[i]가 유래한 원본 문자 인덱스
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """정규화 텍스트의 [start, end) 구간을 원본 텍스트 구간으로 변환한다."""
+
+        return self.offsets[start], self.offsets[end - 1] + 1
+
+
+class TextNormalizer:
+    """
+    키워드 매칭용 한국어 텍스트 정규화기.
+
+    키워드와 입력 텍스트에 동일한 정규화를 적용하므로, 사전에는 기본형만 두고
+    띄어쓰기/자모 분리/유사 글자 변형은 매칭 단계에서 한 번에 처리한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        fold_lookalikes: bool = True,
+        collapse_repeats: bool = True,
+        choseong_min_syllables: int = 3,
+    ) -> None:
+        """
+        Args:
+            fold_lookalikes: 숫자/라틴 유사 글자 통일 여부
+            collapse_repeats: 연속된 동일 문자 축약 여부
+            choseong_min_syllables: 키워드의 초성 약어 변형을 만들 최소 음절 수
+                (2음절 약어는 "ㄱㅅ"(감사)처럼 오탐이 많아 기본값은 3)
+        """
+
+        if choseong_min_syllables <= 0:
+            raise ValueError("choseong_min_syllables must be positive.")
+
+        self.collapse_repeats = collapse_repeats
+        self.choseong_min_syllables = choseong_min_syllables
+
+        self._table = _FOLDING_TABLE if fold_lookalikes else _PLAIN_TABLE
+
+    def normalize(self, text: str) -> NormalizedText:
+        """
+        텍스트를 정규화하고 원본 인덱스 매핑을 함께 반환한다.
+        """
+
+        table = self._table
+        collapse = self.collapse_repeats
+        chars: List[str] = []
+        offsets: List[int] = []
+        last = ""
+
+        for index, ch in enumerate(text):
+            mapped = table.get(ch)
+            if mapped is None:
+                mapped = ch.lower() if ch.isalnum() or ch == "_" else ""
+            for out in mapped:
+                if collapse and out == last:
+                    continue
+                chars.append(out)
+                offsets.append(index)
+                last = out
+
+        return NormalizedText("".join(chars), offsets)
+
+    def keyword_variants(self, keyword: str) -> List[str]:
+        """
+        사전 키워드 하나가 색인될 정규화 형태 목록을 반환한다.
+
+        기본 정규화 형태 외에, 충분히 긴 한글 키워드는 초성 약어 형태도 포함한다.
+        """
+
+        variants: List[str] = []
+        normalized = self.normalize(keyword).text
+        if normalized:
+            variants.append(normalized)
+
+        abbreviation = self._choseong_abbreviation(keyword)
+        if abbreviation and abbreviation not in variants:
+            variants.append(abbreviation)
+
+        return variants
+
+    def _choseong_abbreviation(self, keyword: str) -> Optional[str]:
+        syllables = [ch for ch in keyword if not ch.isspace()]
+        if len(syllables) < self.choseong_min_syllables:
+            return None
+        initials = []
+        for ch in syllables:
+            offset = ord(ch) - _SYLLABLE_BASE
+            if not 0 <= offset < _SYLLABLE_COUNT:
+                return None
+            initials.append(_COMPAT_CHOSEONG[offset // 588])
+        return self.normalize("".join(initials)).text or None
@@ -0,0 +1,490 @@
+"""
+ROI 캡처 프레임 변화 감지 (변화 없는 프레임의 OCR 생략, 바뀐 영역만 다시 OCR).
+
+Electron 클라이언트는 화면 변화와 관계없이 일정 간격으로 ROI 캡처를 보내고, 정지된 채팅창이면
+대부분의 프레임이 직전 프레임과 같다. 클라이언트(client_id)별로 마지막으로 OCR한 프레임의
+지문과 OCR 결과(줄 텍스트 + 위치)를 보관해 두고, 새 프레임과 비교한다.
+
+지문은 두 단계로 비교한다.
+1. 업로드 바이트의 해시: 같은 화면을 같은 인코더로 저장한 PNG(또는 같은 무압축 픽셀 버퍼)는
+   바이트까지 같으므로 디코딩도 생략
+2. 행 프로파일: 회색조 이미지의 픽셀 행마다 block_size 폭 열 구간의 평균 밝기 (H x W/block_size)
+   block_size x block_size 블록 평균 중 하나라도 threshold 이상 바뀌면 변화로 본다.
+
+변화가 있으면 (incremental 모드) 행 프로파일로 바뀐 행 구간을 찾는다.
+- 채팅창이 위로 스크롤된 경우 행 평균 밝기를 밀어 맞춰 이동량(shift)을 찾고, 이전 줄 위치를 그만큼 옮긴다.
+- 바뀐 행(+ 스크롤로 새로 드러난 아래쪽)과 거기 걸친 이전 줄을 덮는 가로 띠만 OCR하고,
+  나머지 영역은 이전 줄을 그대로 쓴다. 바뀐 행이 max_changed_ratio를 넘으면 전체를 OCR한다.
+
+비교 기준은 직전에 받은 프레임이 아니라 마지막으로 OCR한 프레임이라, 조금씩 바뀌는 변화도 누적되면
+결국 OCR된다.
+
+reuse_boxes 모드에서는 레이아웃이 고정된 화면(자막, 채팅 입력 줄 등)을 위해, 스크롤 없이 바뀐 칸이 모두
+이전 줄의 경계 상자 안에 있으면 텍스트 검출 없이 그 상자들만 다시 인식(recognition)한다.
+인식 신뢰도가 min_confidence보다 낮은 상자가 있거나 마지막 검출 후 box_refresh_sec이 지나면 검출부터 다시 한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+Region = Tuple[int, int]  # [y0, y1) 픽셀 행 구간
+
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class OCRLine:
+    """OCR로 인식한 텍스트 줄 하나와 프레임 좌표 경계 상자 (x0, y0, x1, y1)."""
+
+    text: str
+    box: Tuple[float, float, float, float]
+    confidence: float = 0.0
+
+    def shifted(self, dy: float) -> "OCRLine":
+        x0, y0, x1, y1 = self.box
+        return OCRLine(self.text, (x0, y0 + dy, x1, y1 + dy), self.confidence)
+
+
+@dataclass
+class IncrementalPlan:
+    """이전 OCR 결과를 재사용하고 regions만 다시 OCR하는 계획."""
+
+    shift: int  # 내용이 위로 스크롤된 픽셀 수
+    regions: List[Region]
+    kept: List[OCRLine]  # 재사용할 이전 줄 (shift 반영)
+    recognize: List[OCRLine] = field(default_factory=list)  # 검출 없이 상자만 다시 인식할 이전 줄
+
+    @property
+    def rows(self) -> int:
+        return sum(y1 - y0 for y0, y1 in self.regions) + sum(
+            int(np.ceil(line.box[3] - line.box[1])) for line in self.recognize
+        )
+
+
+@dataclass
+class FrameCheck:
+    """프레임 하나의 변화 판정 결과."""
+
+    unchanged: bool
+    texts: Optional[List[str]] = None  # unchanged면 재사용할 OCR 텍스트
+    image: Optional[np.ndarray] = None  # 디코딩한 RGB 배열 (OCR에 그대로 넘김)
+    digest: bytes = b""
+    profile: Optional[np.ndarray] = None
+    score: float = 0.0  # 기준 프레임과의 최대 블록 밝기 차이 (0~255)
+    plan: Optional[IncrementalPlan] = None  # None이면 전체 OCR
+
+
+@dataclass
+class _Reference:
+    digest: bytes
+    profile: np.ndarray
+    lines: List[OCRLine]
+    updated_at: float = field(default_factory=time.monotonic)
+    detected_at: float = field(default_factory=time.monotonic)  # 마지막으로 텍스트 검출을 실행한 시각
+
+
+def row_profile(gray: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    픽셀 행마다 block_size 폭 열 구간의 평균 밝기 (H x W/block_size, 오른쪽 나머지 열은 제외).
+    """
+
+    width = gray.shape[1] // block_size * block_size
+    if width == 0:
+        return gray.astype(np.float32).mean(axis=1, keepdims=True)
+    return gray[:, :width].astype(np.float32).reshape(gray.shape[0], width // block_size, block_size).mean(axis=2)
+
+
+def _profile_blocks(profile: np.ndarray, block_size: int) -> np.ndarray:
+    height = profile.shape[0] // block_size * block_size
+    if height == 0:
+        return np.array([[profile.mean()]], dtype=np.float32)
+    return profile[:height].reshape(height // block_size, block_size, profile.shape[1]).mean(axis=1)
+
+
+def luma(rgb: np.ndarray) -> np.ndarray:
+    """
+    RGB 배열의 밝기 (PIL "L" 변환과 같은 ITU-R 601 가중치, float32). 무압축 픽셀 버퍼의 뷰에도 복사 없이 쓸 수 있다.
+    """
+
+    return rgb @ _LUMA_WEIGHTS
+
+
+def block_means(gray: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    회색조 이미지를 block_size 블록 평균으로 축소한다. (가장자리의 나머지 픽셀은 제외)
+    """
+
+    if gray.shape[0] < block_size or gray.shape[1] < block_size:
+        # ROI가 블록 하나보다 작으면 전체 평균 하나로 비교한다.
+        return np.array([[gray.mean()]], dtype=np.float32)
+    return _profile_blocks(row_profile(gray, block_size), block_size)
+
+
+def _changed_rows(previous: np.ndarray, current: np.ndarray, threshold: float, shift: int) -> np.ndarray:
+    """내용이 shift 픽셀 위로 이동했다고 볼 때 다시 읽어야 하는 행 (새로 드러난 아래쪽 포함)."""
+
+    if shift == 0:
+        return np.abs(current - previous).max(axis=1) >= threshold
+    changed = np.ones(current.shape[0], dtype=bool)
+    changed[:-shift] = np.abs(current[:-shift] - previous[shift:]).max(axis=1) >= threshold
+    return changed
+
+
+def _find_scroll(previous: np.ndarray, current: np.ndarray, threshold: float, max_shift: int) -> Tuple[int, np.ndarray]:
+    """
+    다시 읽을 행이 가장 적어지는 스크롤 이동량을 찾는다. (채팅 줄은 서로 비슷해 평균 밝기로는 구분되지 않는다)
+    """
+
+    best_shift, best = 0, _changed_rows(previous, current, threshold, 0)
+    shift = 1
+    # 이동량 자체가 새로 드러나는 행 수이므로 지금까지의 최솟값보다 크면 더 볼 필요가 없다.
+    while shift <= max_shift and shift < best.sum():
+        changed = _changed_rows(previous, current, threshold, shift)
+        if changed.sum() < best.sum():
+            best_shift, best = shift, changed
+        shift += 1
+    return best_shift, best
+
+
+def _row_ranges(changed: np.ndarray, margin: int) -> List[Region]:
+    """바뀐 행 마스크를 margin만큼 넓힌 구간들로 묶는다. (margin 이내로 떨어진 구간은 합친다)"""
+
+    height = changed.shape[0]
+    rows = np.flatnonzero(changed)
+    regions: List[Region] = []
+    for row in rows:
+        start, end = max(0, int(row) - margin), min(height, int(row) + 1 + margin)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def _merge_regions(regions: List[Region]) -> List[Region]:
+    merged: List[Region] = []
+    for start, end in sorted(regions):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def plan_incremental(
+    previous: np.ndarray,
+    current: np.ndarray,
+    lines: List[OCRLine],
+    *,
+    threshold: float,
+    margin: int = 4,
+    max_shift_ratio: float = 0.5,
+    max_changed_ratio: float = 0.6,
+) -> Optional[IncrementalPlan]:
+    """
+    이전/현재 행 프로파일을 비교해 다시 OCR할 행 구간을 정한다.
+
+    Args:
+        previous, current: 같은 크기의 행 프로파일 (row_profile)
+        lines: 이전 프레임의 OCR 줄
+        threshold: 바뀐 행으로 볼 최소 열 구간 밝기 차이
+        margin: 바뀐 행 구간 위아래로 함께 OCR할 여유 픽셀
+        max_shift_ratio: 찾아볼 최대 스크롤 이동량 (프레임 높이 비율)
+        max_changed_ratio: 다시 OCR할 행이 이 비율을 넘으면 전체 OCR (None 반환)
+
+    Returns:
+        IncrementalPlan, 또는 전체를 OCR하는 편이 나으면 None
+    """
+
+    if previous.shape != current.shape:
+        return None
+    height = current.shape[0]
+
+    # 위로 스크롤된 경우(내용이 위로 이동) 이전 줄을 옮겨 재사용한다.
+    shift, changed = _find_scroll(previous, current, threshold, int(height * max_shift_ratio))
+
+    regions = _row_ranges(changed, margin)
+    kept: List[OCRLine] = []
+    for line in lines:
+        moved = line.shifted(-shift) if shift else line
+        top, bottom = moved.box[1], moved.box[3]
+        if bottom <= 0:
+            continue  # 스크롤로 화면 밖으로 나간 줄
+        if top < 0:
+            # 위쪽에 잘린 채 남은 줄은 보이는 부분만 다시 읽는다.
+            regions.append((0, min(height, int(np.ceil(bottom)) + margin)))
+            continue
+        kept.append(moved)
+
+    # 다시 읽는 구간에 걸친 이전 줄은 버리고, 그 줄 전체가 들어가도록 구간을 넓힌다.
+    regions = _merge_regions(regions)
+    while True:
+        overlapping = [
+            line for line in kept
+            if any(line.box[1] < end and line.box[3] > start for start, end in regions)
+        ]
+        if not overlapping:
+            break
+        kept = [line for line in kept if line not in overlapping]
+        regions = _merge_regions(
+            regions
+            + [
+                (max(0, int(line.box[1]) - margin), min(height, int(np.ceil(line.box[3])) + margin))
+                for line in overlapping
+            ]
+        )
+
+    plan = IncrementalPlan(shift=shift, regions=regions, kept=kept)
+    if plan.rows > height * max_changed_ratio:
+        return None
+    return plan
+
+
+def plan_box_reuse(
+    previous: np.ndarray,
+    current: np.ndarray,
+    lines: List[OCRLine],
+    *,
+    threshold: float,
+    block_size: int,
+    margin: int = 2,
+) -> Optional[IncrementalPlan]:
+    """
+    바뀐 칸(행 x 열 구간)이 모두 이전 줄의 경계 상자 안에 있으면 그 줄들만 다시 인식하는 계획을 만든다.
+
+    상자 밖에서 바뀐 칸이 있으면(새 줄, 길어진 줄, 스크롤) 검출이 필요하므로 None.
+    """
+
+    if previous.shape != current.shape:
+        return None
+    height, bands = current.shape
+    changed = np.abs(current - previous) >= threshold
+    covered = np.zeros_like(changed)
+    targets: List[OCRLine] = []
+    for line in lines:
+        x0, y0, x1, y1 = line.box
+        rows = slice(max(0, int(y0) - margin), min(height, int(np.ceil(y1)) + margin))
+        columns = slice(max(0, int(x0) // block_size), min(bands, int(np.ceil(x1)) // block_size + 1))
+        covered[rows, columns] = True
+        if changed[rows, columns].any():
+            targets.append(line)
+    if (changed & ~covered).any():
+        return None
+    return IncrementalPlan(
+        shift=0,
+        regions=[],
+        kept=[line for line in lines if line not in targets],
+        recognize=targets,
+    )
+
+
+def crop_box(image: np.ndarray, box: Tuple[float, float, float, float], pad: int = 2) -> np.ndarray:
+    """경계 상자 영역을 pad 픽셀 여유를 두고 잘라 낸다. (인식 모델 입력)"""
+
+    x0, y0, x1, y1 = box
+    height, width = image.shape[:2]
+    return image[
+        max(0, int(y0) - pad):min(height, int(np.ceil(y1)) + pad),
+        max(0, int(x0) - pad):min(width, int(np.ceil(x1)) + pad),
+    ]
+
+
+def merge_lines(kept: List[OCRLine], recognized: List[Tuple[Region, List[OCRLine]]]) -> List[OCRLine]:
+    """
+    재사용한 줄과 구간별로 새로 인식한 줄(구간 좌표)을 프레임 좌표로 합쳐 읽기 순서(위→아래, 왼→오른)로 정렬한다.
+    """
+
+    lines = list(kept)
+    for (start, _), region_lines in recognized:
+        lines.extend(line.shifted(start) for line in region_lines)
+    return sorted(lines, key=lambda line: (line.box[1], line.box[0]))
+
+
+class FrameChangeDetector:
+    """
+    클라이언트별 기준 프레임 보관 및 변화 판정 (스레드 안전).
+    """
+
+    def __init__(
+        self,
+        *,
+        block_size: int = 16,
+        threshold: float = 6.0,
+        max_clients: int = 256,
+        ttl_sec: float = 300.0,
+        incremental: bool = True,
+        max_changed_ratio: float = 0.6,
+        reuse_boxes: bool = False,
+        box_refresh_sec: float = 10.0,
+        min_confidence: float = 0.8,
+    ) -> None:
+        """
+        Args:
+            block_size: 지문 블록 한 변의 픽셀 수
+            threshold: 변화로 볼 최소 블록 평균 밝기 차이 (0~255)
+            max_clients: 기준 프레임을 보관할 최대 클라이언트 수 (초과 시 가장 오래된 것부터 제거)
+            ttl_sec: 기준 프레임 유효 시간 (지나면 같은 프레임도 다시 OCR)
+            incremental: 바뀐 행 구간만 다시 OCR할지 여부
+            max_changed_ratio: incremental 모드에서 바뀐 행이 이 비율을 넘으면 전체 OCR
+            reuse_boxes: 바뀐 칸이 모두 이전 줄 상자 안이면 검출 없이 상자만 다시 인식할지 여부
+            box_refresh_sec: 상자를 재사용할 수 있는 마지막 검출 후 최대 시간
+            min_confidence: 상자 재인식 결과를 받아들일 최소 인식 신뢰도 (낮으면 검출부터 다시)
+        """
+
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+
+        self.block_size = block_size
+        self.threshold = threshold
+        self.max_clients = max_clients
+        self.ttl_sec = ttl_sec
+        self.incremental = incremental
+        self.max_changed_ratio = max_changed_ratio
+        self.reuse_boxes = reuse_boxes
+        self.box_refresh_sec = box_refresh_sec
+        self.min_confidence = min_confidence
+        self._lock = threading.Lock()
+        self._references: "OrderedDict[str, _Reference]" = OrderedDict()
+
+        self.frames = 0
+        self.skipped = 0
+        self.identical = 0
+        self.incremental_frames = 0
+        self.ocr_rows = 0
+        self.total_rows = 0
+        self.box_reuses = 0
+        self.box_reuse_fallbacks = 0
+
+    def check(self, client_id: str, image_data: bytes, image: Optional[np.ndarray] = None) -> FrameCheck:
+        """
+        프레임을 클라이언트의 기준 프레임과 비교한다. (디코딩을 포함하므로 작업 스레드에서 호출)
+
+        Args:
+            image_data: 업로드 바이트 (지문 해시 대상)
+            image: 이미 RGB 배열로 감싼 프레임 (무압축 픽셀 업로드). 주면 image_data를 디코딩하지 않는다.
+        """
+
+        digest = hashlib.blake2b(image_data, digest_size=16).digest()
+        reference = self._reference(client_id)
+        with self._lock:
+            self.frames += 1
+            if reference is not None and reference.digest == digest:
+                self.skipped += 1
+                self.identical += 1
+                return FrameCheck(unchanged=True, texts=[line.text for line in reference.lines], digest=digest)
+
+        if image is None:
+            decoded = Image.open(io.BytesIO(image_data)).convert("RGB")
+            image, gray = np.asarray(decoded), np.asarray(decoded.convert("L"))
+        else:
+            gray = luma(image)
+        profile = row_profile(gray, self.block_size)
+        check = FrameCheck(unchanged=False, image=image, digest=digest, profile=profile)
+        if reference is None or reference.profile.shape != profile.shape:
+            return check
+
+        check.score = float(
+            np.abs(_profile_blocks(profile, self.block_size) - _profile_blocks(reference.profile, self.block_size)).max()
+        )
+        if check.score < self.threshold:
+            with self._lock:
+                self.skipped += 1
+            check.unchanged = True
+            check.texts = [line.text for line in reference.lines]
+        elif self.incremental:
+            if self.reuse_boxes and time.monotonic() - reference.detected_at < self.box_refresh_sec:
+                check.plan = plan_box_reuse(
+                    reference.profile,
+                    profile,
+                    reference.lines,
+                    threshold=self.threshold,
+                    block_size=self.block_size,
+                )
+                if check.plan is not None:
+                    return check
+            check.plan = plan_incremental(
+                reference.profile,
+                profile,
+                reference.lines,
+                threshold=self.threshold,
+                max_changed_ratio=self.max_changed_ratio,
+            )
+        return check
+
+    def accept_recognition(self, plan: IncrementalPlan, results: List[Tuple[str, float]]) -> Optional[List[OCRLine]]:
+        """
+        상자 재인식 결과를 검증한다. 신뢰도가 낮은 상자가 있거나(줄이 바뀌거나 사라짐) 결과 수가 상자 수와
+        다르면 None을 반환하며, 호출자는 검출부터 다시 해야 한다.
+        """
+
+        if len(results) != len(plan.recognize) or any(
+            not text or confidence < self.min_confidence for text, confidence in results
+        ):
+            with self._lock:
+                self.box_reuse_fallbacks += 1
+            return None
+        recognized = [
+            OCRLine(text, line.box, confidence) for line, (text, confidence) in zip(plan.recognize, results)
+        ]
+        return merge_lines(plan.kept + recognized, [])
+
+    def update(self, client_id: str, check: FrameCheck, lines: List[OCRLine]) -> None:
+        """OCR한 프레임을 클라이언트의 새 기준 프레임으로 저장한다."""
+
+        if check.profile is None:
+            return
+        with self._lock:
+            self.total_rows += check.profile.shape[0]
+            now = time.monotonic()
+            detected_at = now
+            if check.plan is not None:
+                self.incremental_frames += 1
+                self.ocr_rows += check.plan.rows
+                if check.plan.recognize:
+                    self.box_reuses += 1
+                    previous = self._references.get(client_id)
+                    detected_at = previous.detected_at if previous is not None else now
+            else:
+                self.ocr_rows += check.profile.shape[0]
+            self._references[client_id] = _Reference(
+                check.digest, check.profile, list(lines), updated_at=now, detected_at=detected_at
+            )
+            self._references.move_to_end(client_id)
+            while len(self._references) > self.max_clients:
+                self._references.popitem(last=False)
+
+    def _reference(self, client_id: str) -> Optional[_Reference]:
+        with self._lock:
+            reference = self._references.get(client_id)
+            if reference is None:
+                return None
+            if self.ttl_sec > 0 and time.monotonic() - reference.updated_at > self.ttl_sec:
+                del self._references[client_id]
+                return None
+            self._references.move_to_end(client_id)
+            return reference
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clients": len(self._references),
+                "frames": self.frames,
+                "skipped": self.skipped,
+                "identical": self.identical,
+                "skip_ratio": round(self.skipped / self.frames, 3) if self.frames else 0.0,
+                "incremental": self.incremental_frames,
+                # OCR한 프레임에서 실제로 다시 읽은 행 비율 (1이면 항상 전체 OCR)
+                "ocr_row_ratio": round(self.ocr_rows / self.total_rows, 3) if self.total_rows else 0.0,
+                "box_reuses": self.box_reuses,
+                "box_reuse_fallbacks": self.box_reuse_fallbacks,
+            }
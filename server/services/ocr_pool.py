@@ -0,0 +1,261 @@
+"""
+PaddleOCR 작업자 풀.
+
+PaddleOCR 추론은 이미지 한 장에 수백 ms가 걸리는 CPU 연산이라 이벤트 루프에서 직접 호출하면
+그동안 /ws/audio 세션과 헬스 체크가 모두 멈춘다. OCRWorkerPool은 작업자 프로세스마다
+PaddleOCRService를 하나씩 올려(시작 시 한 번 추론해 예열) 이미지 디코딩과 OCR을 그곳에서
+실행하고, 이벤트 루프는 결과만 기다린다.
+
+동시에 받는 요청 수(실행 중 + 대기)는 max_pending으로 제한하며, 가득 차면 대기열에 쌓지 않고
+즉시 OCROverloadedError를 발생시킨다. (엔드포인트는 503 + Retry-After로 응답)
+
+workers=0이면 프로세스 대신 서버 프로세스 안의 전용 스레드 하나에서 실행한다. (개발/저메모리용)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .frame_change import OCRLine
+
+logger = logging.getLogger(__name__)
+
+OCRInput = Union[bytes, np.ndarray]
+
+# 작업자(프로세스 또는 스레드)마다 하나씩 로드되는 OCR 서비스
+_worker_service: Any = None
+
+
+class OCROverloadedError(RuntimeError):
+    """OCR 대기열이 가득 차 요청을 받을 수 없는 경우 발생하는 예외."""
+
+
+def load_paddle_ocr_service() -> Any:
+    """기본 서비스 팩토리 (작업자 안에서 paddleocr를 import한다)."""
+
+    from .paddle_ocr_service import PaddleOCRService
+
+    return PaddleOCRService()
+
+
+def _init_worker(service_factory: Callable[[], Any], ready: Any) -> None:
+    global _worker_service  # pylint: disable=global-statement
+    _worker_service = service_factory()
+    # 첫 추론에서 일어나는 지연 초기화를 요청 전에 끝내 둔다.
+    _worker_service.extract_text(np.zeros((32, 32, 3), dtype=np.uint8))
+    # 작업자마다 한 번씩 준비 완료를 알린다. (OCRWorkerPool.start가 작업자 수만큼 기다린다)
+    ready.release()
+
+
+def _ping() -> bool:
+    return _worker_service is not None
+
+
+def _decode(image: OCRInput) -> Any:
+    if isinstance(image, (bytes, bytearray)):
+        from PIL import Image
+
+        return Image.open(io.BytesIO(image))
+    # 무압축 업로드의 채널 순서 변경 뷰(음수 stride)는 cv2 전처리가 받지 못하므로 연속 배열로 바꾼다.
+    # (프로세스 모드에서는 pickle 전송 과정에서 이미 연속 배열이 된다)
+    return np.ascontiguousarray(image)
+
+
+def _run_ocr(image: OCRInput) -> Tuple[List[str], float]:
+    return _worker_service.extract_text(_decode(image))
+
+
+def _run_ocr_lines(images: Sequence[OCRInput]) -> Tuple[List[List[OCRLine]], float]:
+    results = [_worker_service.extract_lines(_decode(image)) for image in images]
+    return [lines for lines, _ in results], sum(elapsed for _, elapsed in results)
+
+
+def _run_recognize(crops: Sequence[np.ndarray]) -> Tuple[List[Tuple[str, float]], float]:
+    return _worker_service.recognize([_decode(crop) for crop in crops])
+
+
+class OCRWorkerPool:
+    """
+    예열된 PaddleOCR 작업자 N개와 상한이 있는 요청 접수.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        *,
+        max_pending: Optional[int] = None,
+        service_factory: Callable[[], Any] = load_paddle_ocr_service,
+    ) -> None:
+        """
+        Args:
+            workers: 작업자 프로세스 수 (0이면 서버 프로세스 안의 스레드 하나)
+            max_pending: 실행 중 + 대기 요청의 최대 수 (기본 작업자 수의 2배)
+            service_factory: 작업자 안에서 OCR 서비스를 만드는 함수
+                (프로세스 모드에서는 pickle 가능한 모듈 최상위 함수여야 한다)
+        """
+
+        if workers < 0:
+            raise ValueError("workers must not be negative.")
+
+        self.workers = workers
+        self.max_pending = max_pending if max_pending is not None else max(1, workers) * 2
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.service_factory = service_factory
+        self._executor: Optional[Executor] = None
+        self._ready: Any = None
+
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.restarts = 0
+        self.total_latency_sec = 0.0
+
+    @property
+    def mode(self) -> str:
+        return "process" if self.workers else "thread"
+
+    def start(self) -> "OCRWorkerPool":
+        """
+        작업자를 띄우고 모두 OCR 서비스를 로드/예열할 때까지 기다린다. (동기, 작업 스레드에서 호출)
+        """
+
+        self._executor = self._create_executor()
+        count = max(1, self.workers)
+        # 초기화 중인 작업자는 유휴 상태가 아니므로 ping N개를 보내면 작업자 N개가 모두 뜬다.
+        pings = [self._executor.submit(_ping) for _ in range(count)]
+        try:
+            ready = all(ping.result() for ping in pings)
+            # ping은 먼저 준비된 작업자 하나가 모두 받을 수도 있으므로 작업자별 준비 신호를 N개 모은다.
+            # 기다리는 동안 ping을 다시 보내 다른 작업자의 초기화 실패(BrokenProcessPool)를 감지한다.
+            for _ in range(count):
+                while ready and not self._ready.acquire(timeout=0.5):
+                    ready = self._executor.submit(_ping).result()
+        except Exception:
+            # 작업자 초기화(모델 로드) 실패 → BrokenProcessPool 등
+            self.shutdown()
+            raise
+        if not ready:
+            self.shutdown()
+            raise RuntimeError("OCR worker failed to initialize.")
+        logger.info("✅ OCR worker pool ready (%s x%d)", self.mode, max(1, self.workers))
+        return self
+
+    def _create_executor(self) -> Executor:
+        if self.workers == 0:
+            self._ready = threading.Semaphore(0)
+            return ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="ocr",
+                initializer=_init_worker,
+                initargs=(self.service_factory, self._ready),
+            )
+        # paddle의 내부 스레드 상태를 복제하지 않도록 fork 대신 spawn으로 시작한다.
+        context = multiprocessing.get_context("spawn")
+        self._ready = context.Semaphore(0)
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.service_factory, self._ready),
+        )
+
+    async def extract_text(self, image: OCRInput) -> Tuple[List[str], float]:
+        """
+        작업자에서 이미지를 디코딩하고 OCR을 실행한다.
+
+        Args:
+            image: 인코딩된 이미지 파일 바이트 또는 RGB 배열
+
+        Raises:
+            OCROverloadedError: 실행 중 + 대기 요청이 max_pending에 도달한 경우
+        """
+
+        return await self._submit(_run_ocr, image)
+
+    async def extract_lines(self, images: Sequence[OCRInput]) -> Tuple[List[List[OCRLine]], float]:
+        """
+        작업자 하나에서 이미지(전체 프레임 또는 잘라 낸 영역)들을 차례로 OCR하고 줄 위치와 함께 반환한다.
+
+        Returns:
+            (이미지별 줄 리스트, 합계 OCR 시간)
+        """
+
+        return await self._submit(_run_ocr_lines, list(images))
+
+    async def recognize(self, crops: Sequence[np.ndarray]) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        작업자에서 줄 이미지들을 검출 없이 인식 모델로만 읽는다.
+
+        Returns:
+            (입력 순서대로 (text, confidence) 리스트, OCR 시간)
+        """
+
+        return await self._submit(_run_recognize, list(crops))
+
+    async def _submit(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            raise RuntimeError("OCR worker pool is not started.")
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise OCROverloadedError(
+                f"OCR queue is full ({self.in_flight}/{self.max_pending} requests in flight)."
+            )
+
+        executor = self._executor
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(executor, function, *args)
+        except BrokenProcessPool:
+            self.failed += 1
+            if self._executor is executor:
+                self._restart()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        self.total_latency_sec += time.perf_counter() - started
+        return result
+
+    def _restart(self) -> None:
+        # 작업자 프로세스가 죽으면(메모리 부족 등) 풀 전체가 망가지므로 새로 만든다.
+        # 새 작업자는 다음 요청에서 뜨며 그 요청이 모델 로딩을 기다린다.
+        logger.error("OCR worker process died, restarting the pool")
+        broken, self._executor = self._executor, self._create_executor()
+        self.restarts += 1
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": max(1, self.workers),
+            "in_flight": self.in_flight,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "avg_latency_ms": round(self.total_latency_sec / self.completed * 1000, 1) if self.completed else 0.0,
+        }
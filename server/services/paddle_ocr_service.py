@@ -7,6 +7,8 @@ from PIL import Image
 from typing import Tuple, List
 import logging
 
+from .frame_change import OCRLine
+
 logger = logging.getLogger(__name__)
 
 class PaddleOCRService:
@@ -46,6 +48,19 @@ class PaddleOCRService:
         Returns:
             (texts, processing_time): 추출된 텍스트 리스트와 처리 시간(초)
         """
+        lines, processing_time = self.extract_lines(image)
+        return [line.text for line in lines], processing_time
+
+    def extract_lines(self, image: Image.Image) -> Tuple[List[OCRLine], float]:
+        """
+        이미지에서 텍스트 줄과 위치(경계 상자) 추출
+
+        Args:
+            image: PIL.Image 객체 또는 RGB numpy 배열
+
+        Returns:
+            (lines, processing_time): 추출된 줄 리스트와 처리 시간(초)
+        """
         try:
             # PIL 이미지를 numpy array로 변환
             if hasattr(image, "convert"):
@@ -60,20 +75,49 @@ class PaddleOCRService:
             processing_time = end_time - start_time
             
             # 결과 파싱
-            texts = []
-            if result and len(result) > 0:
+            lines = []
+            if result and len(result) > 0 and result[0]:
                 for line in result[0]:  # result[0]이 첫 번째 페이지
                     if line and len(line) > 1:
-                        text = line[1][0]  # (text, confidence)에서 text만 추출
-                        texts.append(text)
+                        points, (text, confidence) = line[0], line[1]  # ([[x, y] x 4], (text, confidence))
+                        xs = [float(point[0]) for point in points]
+                        ys = [float(point[1]) for point in points]
+                        lines.append(
+                            OCRLine(text, (min(xs), min(ys), max(xs), max(ys)), float(confidence))
+                        )
             
-            logger.info(f"OCR 완료: {len(texts)}개 텍스트, {processing_time:.3f}초")
-            return texts, processing_time
+            logger.info(f"OCR 완료: {len(lines)}개 텍스트, {processing_time:.3f}초")
+            return lines, processing_time
             
         except Exception as e:
             logger.error(f"OCR 처리 중 오류: {e}")
             return [], 0.0
 
+    def recognize(self, crops: List[np.ndarray]) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        텍스트 검출/방향 분류 없이 잘라 낸 줄 이미지들만 인식 (가로 텍스트 줄 전용)
+        
+        Args:
+            crops: 줄 하나씩 잘라 낸 RGB numpy 배열 리스트
+            
+        Returns:
+            (results, processing_time): 입력 순서대로 (text, confidence) 리스트와 처리 시간(초)
+        """
+        try:
+            start_time = time.time()
+            # ocr()에 리스트를 주면 이미지마다 따로 처리(여러 페이지)하고 page_num도 바뀌므로,
+            # 인식 모델을 직접 호출해 줄 이미지들을 한 배치로 읽는다.
+            result, _ = self.ocr.text_recognizer(list(crops))
+            processing_time = time.time() - start_time
+            
+            results = [(text, float(confidence)) for text, confidence in result]
+            logger.info(f"OCR 재인식 완료: {len(results)}개 줄, {processing_time:.3f}초")
+            return results, processing_time
+            
+        except Exception as e:
+            logger.error(f"OCR 재인식 중 오류: {e}")
+            return [("", 0.0)] * len(crops), 0.0
+
 # 전역 싱글톤 인스턴스
 _ocr_service_instance = None
 
@@ -0,0 +1,68 @@
+"""
+무압축 픽셀 버퍼 업로드 형식 (PNG 인코딩/디코딩 생략).
+
+Electron의 NativeImage.toBitmap()이 주는 BGRA 버퍼를 그대로 받아 np.frombuffer로 감싸고,
+행 stride/알파 채널 제거/채널 순서 변경을 모두 뷰로 처리해 복사 없이 RGB 배열로 만든다.
+큰 ROI에서는 PNG 압축/해제 왕복이 인식 시간과 맞먹으므로 같은 PC의 서버에는 이 형식을 쓰고,
+업로드 크기가 중요한 원격 서버에는 PNG를 쓴다.
+
+형식은 multipart 파일 파트의 Content-Type으로, 크기는 요청 헤더로 전달한다.
+    Content-Type: image/x-raw-bgra | image/x-raw-rgba | image/x-raw-rgb
+    X-Image-Width, X-Image-Height: 픽셀 단위 크기
+    X-Image-Stride: (선택) 한 행의 바이트 수, 기본 width x 채널 수
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Content-Type → (채널 수, RGB 채널 순서를 만드는 슬라이스)
+_RAW_FORMATS: Dict[str, Tuple[int, slice]] = {
+    "image/x-raw-bgra": (4, slice(2, None, -1)),
+    "image/x-raw-rgba": (4, slice(0, 3)),
+    "image/x-raw-rgb": (3, slice(0, 3)),
+}
+RAW_CONTENT_TYPES = tuple(_RAW_FORMATS)
+
+
+class RawImageError(ValueError):
+    """무압축 픽셀 버퍼의 형식/크기 정보가 잘못된 경우 발생하는 예외."""
+
+
+def is_raw_content_type(content_type: Optional[str]) -> bool:
+    return (content_type or "").split(";")[0].strip().lower() in _RAW_FORMATS
+
+
+def decode_raw(
+    data: bytes,
+    content_type: str,
+    width: Optional[int],
+    height: Optional[int],
+    stride: Optional[int] = None,
+) -> np.ndarray:
+    """
+    픽셀 버퍼를 복사 없이 (height, width, 3) RGB uint8 뷰로 감싼다. (읽기 전용)
+
+    Raises:
+        RawImageError: 형식을 모르거나 크기 정보가 없거나 버퍼 길이와 맞지 않는 경우
+    """
+
+    channels, rgb = _RAW_FORMATS.get(content_type.split(";")[0].strip().lower(), (0, slice(0)))
+    if not channels:
+        raise RawImageError(f"지원하지 않는 픽셀 형식입니다: {content_type} (지원: {', '.join(RAW_CONTENT_TYPES)})")
+    if not width or not height or width <= 0 or height <= 0:
+        raise RawImageError("X-Image-Width / X-Image-Height 헤더가 필요합니다.")
+    row_bytes = width * channels
+    stride = stride or row_bytes
+    if stride < row_bytes:
+        raise RawImageError(f"X-Image-Stride({stride})가 한 행의 픽셀 바이트 수({row_bytes})보다 작습니다.")
+    # 마지막 행은 stride 여백 없이 끝날 수 있다.
+    expected = stride * (height - 1) + row_bytes
+    if len(data) < expected:
+        raise RawImageError(f"픽셀 버퍼 길이({len(data)})가 {width}x{height} 이미지에 필요한 {expected}바이트보다 짧습니다.")
+
+    buffer = np.frombuffer(data, dtype=np.uint8, count=expected)
+    rows = np.lib.stride_tricks.as_strided(buffer, shape=(height, row_bytes), strides=(stride, 1), writeable=False)
+    return rows.reshape(height, width, channels)[:, :, rgb]
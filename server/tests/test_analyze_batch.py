@@ -0,0 +1,121 @@
+"""
+POST /analyze/batch 엔드포인트 테스트 (모델 로더를 가짜 분류기로 교체한 TestClient 사용).
+"""
+
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from nlp.harmful_classifier import ClassificationResult
+from nlp.keyword_store import KeywordStore
+from utils.readiness import ComponentRegistry
+from utils.result_cache import ResultCache
+
+
+class StubClassifier:
+    """'!'가 포함된 텍스트를 유해로 판정하고, predict_batch로 받은 입력을 기록한다."""
+
+    model_name = "stub"
+    backend = "torch"
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self.batch_sizes: List[int] = []
+
+    def predict(self, text: str) -> ClassificationResult:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts, *, batch_size=None) -> List[ClassificationResult]:
+        self.calls.append(list(texts))
+        self.batch_sizes.append(batch_size)
+        return [
+            ClassificationResult(is_harmful="!" in text, confidence=0.9 if "!" in text else 0.8, text=text)
+            for text in texts
+        ]
+
+
+class StubOCRPool:
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    classifier = StubClassifier()
+    monkeypatch.setattr(main, "KEYWORD_STORE", KeywordStore(str(tmp_path / "bad_words.json"), ["시발", "병신"]))
+    monkeypatch.setattr(main, "KEYWORDS_RELOAD_INTERVAL_SEC", 0)
+    monkeypatch.setattr(main, "RESULT_CACHE", ResultCache())
+    monkeypatch.setattr(main, "MODELS", ComponentRegistry())
+    monkeypatch.setattr(main, "STT_SERVICE", None)
+    monkeypatch.setattr(main, "CLASSIFIER", None)
+    monkeypatch.setattr(main, "CLASSIFIER_SCHEDULER", None)
+    monkeypatch.setattr(main, "_load_stt_service", lambda: object())
+    monkeypatch.setattr(main, "_load_classifier", lambda: classifier)
+    monkeypatch.setattr(main, "_load_ocr_pool", StubOCRPool)
+    with TestClient(main.app) as client:
+        yield client, classifier
+
+
+def test_batch_validates_input(api) -> None:
+    client, classifier = api
+
+    empty = client.post("/analyze/batch", json={"texts": []})
+    assert empty.status_code == 200
+    assert empty.json()["count"] == 0 and empty.json()["results"] == []
+
+    too_many = client.post("/analyze/batch", json={"texts": ["안녕"] * (main.ANALYZE_BATCH_MAX_ITEMS + 1)})
+    assert too_many.status_code == 400
+
+    assert client.post("/analyze/batch", json={"texts": ["안녕", 3]}).status_code == 422
+    assert client.post("/analyze/batch", json={"texts": ["안녕", None]}).status_code == 422
+    assert client.post("/analyze/batch", json={"texts": "안녕"}).status_code == 422
+    assert client.post("/analyze/batch", json={"texts": ["안녕"], "batch_size": 0}).status_code == 400
+    assert classifier.calls == []
+
+
+def test_batch_keyword_results_and_timing(api) -> None:
+    client, classifier = api
+
+    response = client.post("/analyze/batch", json={"texts": ["아 시발 진짜", "   ", "좋은 아침"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 3
+    assert body["keywords_version"] == 1
+    assert [(item["method"], item["has_violation"], item["matched_keywords"]) for item in body["results"]] == [
+        ("keyword", True, ["시발"]),
+        ("no_text", False, []),
+        ("keyword", False, []),
+    ]
+    timing = body["processing_time"]
+    assert set(timing) == {"keyword", "classifier", "total", "items_per_sec"}
+    assert timing["classifier"] == 0.0
+    assert 0.0 <= timing["keyword"] <= timing["total"]
+    assert timing["items_per_sec"] > 0
+    assert classifier.calls == []
+
+
+def test_batch_classifier_skips_keyword_hits_and_keeps_order(api) -> None:
+    client, classifier = api
+    texts = ["이 병신", "이건 나빠!", "", "평범한 문장", "시발", "또 나쁜 말!"]
+
+    response = client.post("/analyze/batch", json={"texts": texts, "use_ai": True, "batch_size": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    # 키워드로 판정된 항목과 빈 항목은 분류기로 보내지 않는다.
+    assert classifier.calls == [["이건 나빠!", "평범한 문장", "또 나쁜 말!"]]
+    assert classifier.batch_sizes == [2]
+    assert [(item["method"], item["has_violation"]) for item in body["results"]] == [
+        ("keyword", True),
+        ("ai", True),
+        ("no_text", False),
+        ("ai", False),
+        ("keyword", True),
+        ("ai", True),
+    ]
+    assert body["results"][1]["confidence"] == pytest.approx(0.9)
+    assert body["results"][3]["confidence"] == pytest.approx(0.8)
+    assert body["processing_time"]["classifier"] > 0.0
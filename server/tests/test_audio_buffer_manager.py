@@ -64,3 +64,88 @@ def test_invalid_parameters_raise_error() -> None:
     with pytest.raises(ValueError):
         AudioBufferManager(sample_rate=16_000, chunk_duration_sec=0.0)
 
+
+
+def test_chunks_preserve_order_across_wraparound() -> None:
+    """
+    링 버퍼 끝을 넘어가며 기록/읽기해도 샘플 순서와 값이 유지되어야 한다.
+    """
+
+    manager = AudioBufferManager(sample_rate=10, chunk_duration_sec=0.4, max_buffer_sec=1.0)
+    samples = np.arange(1, 25, dtype=np.int16)
+
+    collected = []
+    for start in range(0, len(samples), 3):
+        manager.add_chunk(samples[start:start + 3].tobytes())
+        chunk = manager.get_processed_chunk()
+        if chunk is not None:
+            collected.extend(np.round(chunk * 32768.0).astype(np.int16).tolist())
+
+    assert collected == samples[: len(collected)].tolist()
+    assert len(collected) == 24
+
+
+def test_overflow_drop_oldest_keeps_latest_samples() -> None:
+    manager = AudioBufferManager(sample_rate=10, chunk_duration_sec=0.4, max_buffer_sec=1.0)
+
+    manager.add_chunk(np.arange(0, 8, dtype=np.int16).tobytes())
+    written = manager.add_chunk(np.arange(8, 14, dtype=np.int16).tobytes())
+
+    assert written == 6
+    assert manager.available == 10
+    assert manager.dropped_samples == 4
+    chunk = manager.get_processed_chunk()
+    assert np.round(chunk * 32768.0).astype(np.int16).tolist() == [4, 5, 6, 7]
+
+
+def test_overflow_reject_discards_incoming_data() -> None:
+    manager = AudioBufferManager(
+        sample_rate=10, chunk_duration_sec=0.4, max_buffer_sec=1.0, overflow_policy="reject"
+    )
+
+    manager.add_chunk(np.arange(0, 8, dtype=np.int16).tobytes())
+    written = manager.add_chunk(np.arange(8, 14, dtype=np.int16).tobytes())
+
+    assert written == 0
+    assert manager.available == 8
+    assert manager.rejected_samples == 6
+    chunk = manager.get_processed_chunk()
+    assert np.round(chunk * 32768.0).astype(np.int16).tolist() == [0, 1, 2, 3]
+
+
+def test_buffer_capacity_must_hold_one_chunk() -> None:
+    with pytest.raises(ValueError):
+        AudioBufferManager(sample_rate=16_000, chunk_duration_sec=2.0, max_buffer_sec=1.0)
+
+    with pytest.raises(ValueError):
+        AudioBufferManager(overflow_policy="block")
+
+
+def test_sliding_windows_overlap_as_views() -> None:
+    """
+    hop이 윈도우보다 짧으면 겹치는 윈도우를 링 버퍼의 뷰로 반환해야 한다.
+    """
+
+    manager = AudioBufferManager(
+        sample_rate=10, chunk_duration_sec=0.4, hop_duration_sec=0.2, max_buffer_sec=1.0
+    )
+    samples = np.arange(1, 31, dtype=np.int16)
+
+    windows = []
+    for start in range(0, len(samples), 2):
+        manager.add_chunk(samples[start:start + 2].tobytes())
+        window = manager.get_processed_chunk()
+        if window is not None:
+            assert np.shares_memory(window, manager._ring)
+            windows.append(np.round(window * 32768.0).astype(np.int16).tolist())
+
+    assert windows[0] == [1, 2, 3, 4]
+    assert windows[1] == [3, 4, 5, 6]
+    # 링 버퍼 끝을 넘어가는 윈도우도 연속된 값이어야 한다.
+    assert windows[-1] == [27, 28, 29, 30]
+    assert len(windows) == 14
+
+
+def test_hop_longer_than_window_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        AudioBufferManager(sample_rate=16_000, chunk_duration_sec=1.0, hop_duration_sec=1.5)
@@ -0,0 +1,94 @@
+"""
+/ws/audio 수신 오디오 인코딩(G.711 μ-law / A-law) 단위 테스트.
+"""
+
+import numpy as np
+import pytest
+
+from audio.buffer_manager import AudioBufferManager
+from audio.codecs import ALAW_TABLE, MULAW_TABLE, encode_alaw, encode_mulaw, get_encoding
+from audio.pipeline import AudioProcessingPipeline
+from audio.stream_session import AudioStreamSession
+
+
+def _sine(count: int) -> np.ndarray:
+    return (np.sin(np.arange(count) * 0.05) * 20_000).astype(np.int16)
+
+
+def test_decode_tables_match_g711_reference_values() -> None:
+    # 무음 코드와 양/음 최댓값 (ITU-T G.711)
+    assert MULAW_TABLE[0xFF] == 0
+    assert MULAW_TABLE[0x80] == 32124
+    assert MULAW_TABLE[0x00] == -32124
+    assert ALAW_TABLE[0xD5] == 8
+    assert ALAW_TABLE[0x55] == -8
+    assert ALAW_TABLE[0xAA] == 32256
+
+
+@pytest.mark.parametrize(
+    "encode, table",
+    [(encode_mulaw, MULAW_TABLE), (encode_alaw, ALAW_TABLE)],
+)
+def test_round_trip_error_is_within_quantization_step(encode, table) -> None:
+    samples = np.arange(-32768, 32768, 7, dtype=np.int16)
+
+    decoded = table[encode(samples)].astype(np.int32)
+
+    error = np.abs(decoded - samples)
+    # 로그 양자화: 큰 신호는 최대 구간 간격(1024) 이내, 작은 신호는 훨씬 정밀하다.
+    amplitude = np.abs(samples.astype(np.int32))
+    assert error.max() <= 1024
+    assert error[amplitude < 256].max() <= 16
+    # 인코딩 → 디코딩 → 인코딩은 같은 코드를 돌려준다.
+    codes = encode(samples)
+    assert np.array_equal(encode(table[codes]), codes)
+
+
+@pytest.mark.parametrize("hop_duration_sec", [None, 0.5])
+def test_buffer_decodes_codes_directly_into_ring(hop_duration_sec) -> None:
+    manager = AudioBufferManager(
+        sample_rate=1_000,
+        chunk_duration_sec=1.0,
+        hop_duration_sec=hop_duration_sec,
+        max_buffer_sec=1.5,
+        encoding="mulaw",
+    )
+    codes = encode_mulaw(_sine(2_000))
+    expected = MULAW_TABLE[codes].astype(np.float32) / 32768.0
+    hop = manager.hop_size
+
+    assert manager.add_chunk(codes[:1_200].tobytes()) == 1_200
+    first = manager.get_processed_chunk()
+    assert np.allclose(first, expected[:1_000], atol=1e-6)
+
+    # 링 버퍼 끝을 넘어가도록 추가
+    manager.add_chunk(codes[1_200:2_000].tobytes())
+    second = manager.get_processed_chunk()
+    assert np.allclose(second, expected[hop:hop + 1_000], atol=1e-6)
+    assert manager.bytes_per_sample == 1
+    assert manager.stats()["encoding"] == "mulaw"
+
+
+def test_unknown_encoding_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_encoding("opus")
+    with pytest.raises(ValueError):
+        AudioBufferManager(encoding="flac")
+
+
+def test_session_lag_counts_one_byte_per_sample() -> None:
+    class NullSTT:
+        def transcribe(self, audio: np.ndarray) -> str:
+            return ""
+
+    pipeline = AudioProcessingPipeline(
+        NullSTT(), None, sample_rate=1_000, chunk_duration_sec=1.0, encoding="alaw"
+    )
+
+    async def send(payload):
+        pass
+
+    session = AudioStreamSession(pipeline, send, serialize=lambda result: {})
+    session._queued_bytes = 2_000
+
+    assert session.lag_sec == pytest.approx(2.0)
@@ -0,0 +1,90 @@
+"""
+ClassifierBatchScheduler 마이크로 배칭 단위 테스트.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from nlp.batch_scheduler import ClassifierBatchScheduler
+from nlp.harmful_classifier import ClassificationResult
+
+
+class RecordingClassifier:
+    """predict_batch 호출 배치 크기를 기록하는 가짜 분류기."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def predict_batch(self, texts, *, batch_size=None):
+        self.batches.append(list(texts))
+        return [
+            ClassificationResult(is_harmful="!" in text, confidence=0.9, text=text)
+            for text in texts
+        ]
+
+
+def test_concurrent_requests_are_batched_and_routed_back() -> None:
+    """
+    동시에 들어온 요청은 하나의 배치로 묶이고, 결과는 각 호출자에게 돌아가야 한다.
+    """
+
+    async def scenario():
+        classifier = RecordingClassifier()
+        scheduler = ClassifierBatchScheduler(classifier, max_batch_size=8, max_wait_ms=20)
+        await scheduler.start()
+        try:
+            texts = [f"문장{i}" + ("!" if i % 2 else "") for i in range(5)]
+            results = await asyncio.gather(*(scheduler.predict(text) for text in texts))
+        finally:
+            await scheduler.stop()
+        return classifier, scheduler, texts, results
+
+    classifier, scheduler, texts, results = asyncio.run(scenario())
+
+    assert len(classifier.batches) == 1
+    assert [result.text for result in results] == texts
+    assert [result.is_harmful for result in results] == [False, True, False, True, False]
+    stats = scheduler.stats()
+    assert stats["batches"] == 1
+    assert stats["avg_batch_size"] == 5
+
+
+def test_batch_size_limit_splits_batches() -> None:
+    """
+    max_batch_size를 넘는 요청은 여러 배치로 나뉘어야 한다.
+    """
+
+    async def scenario():
+        classifier = RecordingClassifier()
+        scheduler = ClassifierBatchScheduler(classifier, max_batch_size=2, max_wait_ms=5)
+        await scheduler.start()
+        try:
+            await asyncio.gather(*(scheduler.predict(f"문장{i}") for i in range(5)))
+        finally:
+            await scheduler.stop()
+        return classifier
+
+    classifier = asyncio.run(scenario())
+
+    assert [len(batch) for batch in classifier.batches] == [2, 2, 1]
+
+
+def test_errors_propagate_and_unstarted_scheduler_rejects() -> None:
+    class FailingClassifier:
+        def predict_batch(self, texts, *, batch_size=None):
+            raise RuntimeError("boom")
+
+    async def scenario():
+        scheduler = ClassifierBatchScheduler(FailingClassifier(), max_wait_ms=0)
+        with pytest.raises(RuntimeError, match="시작되지"):
+            await scheduler.predict("문장")
+        await scheduler.start()
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await scheduler.predict("문장")
+        finally:
+            await scheduler.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,309 @@
+"""
+Deepgram live 스트리밍 STT 세션 테스트 (live API를 흉내 내는 로컬 WebSocket 서버 사용).
+"""
+
+import asyncio
+import contextlib
+import json
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pytest
+
+pytest.importorskip("websockets")
+from websockets.asyncio.server import serve  # noqa: E402
+
+from audio.deepgram_live import DeepgramLiveSession  # noqa: E402
+from audio.pipeline import AudioProcessingPipeline  # noqa: E402
+from audio.result_protocol import decode_result  # noqa: E402
+from audio.stream_session import AudioStreamSession  # noqa: E402
+
+BYTES_PER_SEC = 16_000 * 2
+
+
+def _results(text: str, start: float, duration: float, *, is_final: bool) -> str:
+    return json.dumps(
+        {
+            "type": "Results",
+            "channel": {"alternatives": [{"transcript": text, "confidence": 0.9}]},
+            "start": start,
+            "duration": duration,
+            "is_final": is_final,
+            "speech_final": is_final,
+        }
+    )
+
+
+@contextlib.asynccontextmanager
+async def _stand_in_live_api():
+    """
+    받은 오디오 1초마다 확정 결과를, 메시지마다 (interim_results=true면) 중간 결과를 보내고
+    CloseStream을 받으면 남은 구간의 확정 결과를 보낸 뒤 연결을 닫는 live API 대역.
+    """
+
+    state = {"requests": [], "control": [], "audio_bytes": 0}
+
+    async def handler(connection):
+        state["requests"].append((connection.request.path, connection.request.headers.get("Authorization")))
+        query = parse_qs(urlparse(connection.request.path).query)
+        interim = query.get("interim_results") == ["true"]
+        received = 0
+        finalized = 0
+        async for message in connection:
+            if isinstance(message, bytes):
+                received += len(message)
+                state["audio_bytes"] += len(message)
+                if interim:
+                    await connection.send(
+                        _results("야", finalized / BYTES_PER_SEC, (received - finalized) / BYTES_PER_SEC, is_final=False)
+                    )
+                if received - finalized >= BYTES_PER_SEC:
+                    await connection.send(
+                        _results("야 시발 뭐해", finalized / BYTES_PER_SEC, (received - finalized) / BYTES_PER_SEC, is_final=True)
+                    )
+                    finalized = received
+                continue
+            control = json.loads(message)
+            state["control"].append(control["type"])
+            if control["type"] == "CloseStream":
+                if received > finalized:
+                    await connection.send(
+                        _results("마지막", finalized / BYTES_PER_SEC, (received - finalized) / BYTES_PER_SEC, is_final=True)
+                    )
+                await connection.close()
+                return
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://127.0.0.1:{port}/v1/listen", state
+
+
+class FailingSTT:
+    def transcribe(self, audio: np.ndarray) -> str:
+        raise AssertionError("live 모드에서는 구간 단위 STT를 호출하지 않는다.")
+
+
+class CountingSTT:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        self.calls += 1
+        return "구간 결과"
+
+
+def _tenth_of_second() -> bytes:
+    return np.full(1_600, 1_000, dtype=np.int16).tobytes()
+
+
+def test_live_session_streams_audio_and_receives_transcripts() -> None:
+    async def scenario():
+        async with _stand_in_live_api() as (url, state):
+            live = DeepgramLiveSession("test-key", url=url, interim_results=True)
+            await live.start()
+            await live.send_audio(b"\xff" * 8_000)
+            interim = await asyncio.wait_for(live.receive(), 1.0)
+            await live.finish()
+            final = await live.receive()
+            end = await live.receive()
+            return state, live, interim, final, end
+
+    state, live, interim, final, end = asyncio.run(scenario())
+
+    path, authorization = state["requests"][0]
+    query = parse_qs(urlparse(path).query)
+    assert authorization == "Token test-key"
+    assert query["encoding"] == ["linear16"]
+    assert query["sample_rate"] == ["16000"]
+    assert query["interim_results"] == ["true"]
+    assert state["audio_bytes"] == 8_000
+    assert state["control"] == ["CloseStream"]
+
+    assert interim.text == "야" and not interim.is_final
+    assert final.text == "마지막" and final.is_final
+    assert final.end_sec == pytest.approx(0.25)
+    assert end is None
+    assert live.stats()["sent_sec"] == pytest.approx(0.25)
+
+
+def test_negotiated_encoding_is_forwarded_to_live_api() -> None:
+    live = DeepgramLiveSession("test-key", encoding="mulaw", url="ws://127.0.0.1/v1/listen")
+
+    assert parse_qs(urlparse(live.url).query)["encoding"] == ["mulaw"]
+    with pytest.raises(ValueError):
+        DeepgramLiveSession("test-key", encoding="opus")
+
+
+def test_keepalive_is_sent_while_idle() -> None:
+    async def scenario():
+        async with _stand_in_live_api() as (url, state):
+            live = DeepgramLiveSession("test-key", url=url, keepalive_sec=0.05)
+            await live.start()
+            await asyncio.sleep(0.2)
+            await live.close()
+            return state
+
+    state = asyncio.run(scenario())
+
+    assert "KeepAlive" in state["control"]
+
+
+def test_stream_session_relays_live_transcripts() -> None:
+    pipeline = AudioProcessingPipeline(FailingSTT(), None, keywords=["시발"])
+    frames = []
+
+    async def scenario():
+        async with _stand_in_live_api() as (url, state):
+            async def send(payload):
+                pass
+
+            async def send_bytes(data):
+                frames.append(decode_result(data))
+
+            session = AudioStreamSession(
+                pipeline,
+                send,
+                serialize=lambda result: {},
+                protocol="binary",
+                send_bytes=send_bytes,
+                live=DeepgramLiveSession("test-key", url=url, interim_results=False),
+            )
+            session.start()
+            for _ in range(10):
+                await session.put(_tenth_of_second())
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if frames:
+                    break
+            stats = session.stats()
+            await session.close()
+            return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["stt_mode"] == "live"
+    assert len(frames) == 1
+    frame = frames[0]
+    assert frame.text == "야 시발 뭐해" and frame.is_harmful and frame.is_final
+    assert (frame.start_sample, frame.end_sample) == (0, 16_000)
+    assert (frame.first_frame, frame.last_frame) == (0, 9)
+    # live 모드에서는 오디오를 로컬 버퍼에 쌓지 않는다.
+    assert pipeline.buffer_manager.available == 0
+
+
+def test_stream_session_falls_back_to_chunked_stt_when_live_is_unavailable() -> None:
+    stt = CountingSTT()
+    pipeline = AudioProcessingPipeline(stt, None)
+    sent = []
+
+    async def scenario():
+        async def send(payload):
+            sent.append(payload)
+
+        # 아무도 듣지 않는 포트 → 연결 실패
+        live = DeepgramLiveSession("test-key", url="ws://127.0.0.1:9/v1/listen", connect_timeout_sec=1.0)
+        session = AudioStreamSession(pipeline, send, serialize=lambda result: {"status": "ok"}, live=live)
+        session.start()
+        for _ in range(10):
+            await session.put(_tenth_of_second())
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if stt.calls:
+                break
+        await asyncio.sleep(0.05)
+        stats = session.stats()
+        await session.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["stt_mode"] == "chunked"
+    assert stats["live_fallbacks"] == 1
+    assert stt.calls == 1
+    assert any(payload.get("status") == "ok" for payload in sent)
+
+
+def test_stream_session_close_sends_close_stream_and_relays_last_result() -> None:
+    pipeline = AudioProcessingPipeline(FailingSTT(), None, keywords=["시발"])
+    frames = []
+
+    async def scenario():
+        async with _stand_in_live_api() as (url, state):
+            async def send(payload):
+                pass
+
+            async def send_bytes(data):
+                frames.append(decode_result(data))
+
+            session = AudioStreamSession(
+                pipeline,
+                send,
+                serialize=lambda result: {},
+                protocol="binary",
+                send_bytes=send_bytes,
+                live=DeepgramLiveSession("test-key", url=url, interim_results=False),
+            )
+            session.start()
+            for _ in range(5):
+                await session.put(_tenth_of_second())
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if state["audio_bytes"] == 5 * 3_200:
+                    break
+            await session.close()
+            return state
+
+    state = asyncio.run(scenario())
+
+    # 1초가 차지 않은 오디오의 확정 결과는 CloseStream 응답으로만 받는다.
+    assert state["control"] == ["CloseStream"]
+    assert [frame.text for frame in frames] == ["마지막"]
+
+
+def test_stream_session_relays_received_results_when_live_connection_drops() -> None:
+    pipeline = AudioProcessingPipeline(CountingSTT(), None, keywords=["시발"])
+    frames = []
+
+    async def handler(connection):
+        # 첫 오디오를 받으면 확정 결과 두 개를 보내고 바로 끊는다.
+        await connection.recv()
+        for index in range(2):
+            await connection.send(_results(f"시발 {index}", index * 0.1, 0.1, is_final=True))
+        await connection.close()
+
+    async def scenario():
+        async with serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+
+            async def send(payload):
+                pass
+
+            async def send_bytes(data):
+                # 결과 전송이 느려 끊김을 감지한 시점에 아직 전달하지 못한 결과가 남는다.
+                await asyncio.sleep(0.05)
+                frames.append(decode_result(data))
+
+            session = AudioStreamSession(
+                pipeline,
+                send,
+                serialize=lambda result: {},
+                protocol="binary",
+                send_bytes=send_bytes,
+                live=DeepgramLiveSession("test-key", url=f"ws://127.0.0.1:{port}/v1/listen", interim_results=False),
+            )
+            session.start()
+            for _ in range(10):
+                await session.put(_tenth_of_second())
+                await asyncio.sleep(0.01)
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if session.live is None:
+                    break
+            stats = session.stats()
+            await session.close()
+            return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["live_fallbacks"] == 1
+    assert [frame.text for frame in frames[:2]] == ["시발 0", "시발 1"]
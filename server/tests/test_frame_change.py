@@ -0,0 +1,232 @@
+"""
+FrameChangeDetector (ROI 프레임 변화 감지) 테스트.
+"""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from services.frame_change import (
+    FrameChangeDetector,
+    OCRLine,
+    block_means,
+    crop_box,
+    merge_lines,
+    plan_box_reuse,
+    plan_incremental,
+    row_profile,
+)
+
+
+def _png(image: Image.Image) -> bytes:
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+def _chat(lines: int, first: int = 0) -> Image.Image:
+    image = Image.new("RGB", (320, 160), (30, 30, 30))
+    draw = ImageDraw.Draw(image)
+    for index in range(lines):
+        draw.text((8, 8 + index * 16), f"user{first + index}: hello world", fill=(230, 230, 230))
+    return image
+
+
+def _chat_lines(lines: int, first: int = 0):
+    """_chat이 그린 줄들의 OCR 결과 (줄 높이 16px, 글자 높이 약 11px)."""
+
+    return [
+        OCRLine(f"user{first + index}: hello world", (8.0, 8.0 + index * 16, 140.0, 19.0 + index * 16))
+        for index in range(lines)
+    ]
+
+
+def _profile(image: Image.Image):
+    return row_profile(np.asarray(image.convert("L")), 16)
+
+
+def test_block_means_downsamples_and_handles_tiny_rois() -> None:
+    gray = np.arange(32 * 48, dtype=np.uint8).reshape(32, 48)
+
+    blocks = block_means(gray, 16)
+
+    assert blocks.shape == (2, 3)
+    assert blocks[0, 0] == gray[:16, :16].mean()
+    assert block_means(gray[:4, :4], 16).shape == (1, 1)
+
+
+def test_identical_and_near_identical_frames_reuse_previous_texts() -> None:
+    detector = FrameChangeDetector(threshold=6.0)
+    frame = _chat(3)
+
+    first = detector.check("client", _png(frame))
+    assert not first.unchanged and first.image.shape == (160, 320, 3)
+    detector.update("client", first, _chat_lines(1))
+
+    same = detector.check("client", _png(frame))
+    assert same.unchanged and same.texts == ["user0: hello world"]
+    assert same.image is None  # 바이트가 같으면 디코딩하지 않는다.
+
+    # 픽셀 몇 개만 바뀐 프레임 (커서 깜빡임 등)
+    noisy = np.array(frame)
+    noisy[150, 300:304] = 255
+    near = detector.check("client", _png(Image.fromarray(noisy)))
+    assert near.unchanged and 0 < near.score < 6.0
+
+    stats = detector.stats()
+    assert stats["frames"] == 3 and stats["skipped"] == 2 and stats["identical"] == 1
+    assert stats["skip_ratio"] == round(2 / 3, 3)
+
+
+def test_new_chat_line_or_resized_roi_triggers_ocr() -> None:
+    detector = FrameChangeDetector()
+    first = detector.check("client", _png(_chat(3)))
+    detector.update("client", first, _chat_lines(3))
+
+    assert not detector.check("client", _png(_chat(4))).unchanged
+    assert not detector.check("client", _png(_chat(3).resize((300, 160)))).unchanged
+    # 다른 클라이언트의 기준 프레임과는 비교하지 않는다.
+    assert not detector.check("other", _png(_chat(3))).unchanged
+
+
+def test_reference_is_last_ocr_frame_and_clients_are_bounded() -> None:
+    detector = FrameChangeDetector(max_clients=1)
+    first = detector.check("a", _png(_chat(1)))
+    detector.update("a", first, _chat_lines(1))
+
+    # 건너뛴 프레임은 기준 프레임을 바꾸지 않는다.
+    assert detector.check("a", _png(_chat(1))).unchanged
+    assert not detector.check("a", _png(_chat(2))).unchanged
+
+    second = detector.check("b", _png(_chat(1)))
+    detector.update("b", second, _chat_lines(1))
+    assert detector.stats()["clients"] == 1
+    assert not detector.check("a", _png(_chat(1))).unchanged
+
+
+def test_new_line_plans_ocr_of_the_new_strip_only() -> None:
+    previous, current = _chat(3), _chat(4)
+
+    plan = plan_incremental(_profile(previous), _profile(current), _chat_lines(3), threshold=6.0)
+
+    assert plan is not None and plan.shift == 0
+    # 새 줄(y=56~67)만 다시 읽고, 기존 세 줄은 재사용한다.
+    assert len(plan.regions) == 1
+    start, end = plan.regions[0]
+    assert 48 <= start <= 56 and 67 <= end <= 80
+    assert [line.text for line in plan.kept] == [line.text for line in _chat_lines(3)]
+
+
+def test_scrolled_chat_reuses_shifted_lines() -> None:
+    # 한 줄(16px)만큼 위로 스크롤되고 아래에 새 줄이 나타난 화면
+    previous, current = _chat(9), _chat(9, first=1)
+
+    plan = plan_incremental(_profile(previous), _profile(current), _chat_lines(9), threshold=6.0)
+
+    assert plan is not None and plan.shift == 16
+    assert plan.rows < 160 * 0.3
+    # 화면 밖으로 나간 user0은 버리고, 나머지 줄은 16px 위로 옮겨 재사용한다.
+    assert [line.text for line in plan.kept] == [f"user{index}: hello world" for index in range(1, 9)]
+    assert plan.kept[0].box[1] == 8.0
+    # 새로 드러난 아래쪽 줄(user9, y=136~147)을 다시 읽는다.
+    assert any(start <= 136 and end >= 147 for start, end in plan.regions)
+
+
+def test_overlapping_previous_lines_are_reread_and_large_changes_fall_back() -> None:
+    previous = _chat(3)
+    edited = np.array(previous)
+    edited[30:33, 100:140] = 255  # 두 번째 줄 안쪽만 바뀜
+
+    plan = plan_incremental(_profile(previous), _profile(Image.fromarray(edited)), _chat_lines(3), threshold=6.0)
+
+    assert plan is not None
+    assert [line.text for line in plan.kept] == ["user0: hello world", "user2: hello world"]
+    # 다시 읽는 띠는 바뀐 행이 아니라 두 번째 줄 전체를 덮는다.
+    assert plan.regions[0][0] <= 24 and plan.regions[0][1] >= 35
+
+    inverted = Image.fromarray(255 - np.array(previous))
+    assert plan_incremental(_profile(previous), _profile(inverted), _chat_lines(3), threshold=6.0) is None
+
+
+def test_merge_lines_maps_region_results_to_frame_coordinates() -> None:
+    kept = [OCRLine("top", (8.0, 8.0, 50.0, 19.0)), OCRLine("bottom", (8.0, 120.0, 50.0, 131.0))]
+    recognized = [((50, 80), [OCRLine("middle", (8.0, 6.0, 60.0, 17.0))])]
+
+    merged = merge_lines(kept, recognized)
+
+    assert [line.text for line in merged] == ["top", "middle", "bottom"]
+    assert merged[1].box == (8.0, 56.0, 60.0, 67.0)
+
+
+def test_detector_attaches_incremental_plan_and_reports_row_ratio() -> None:
+    detector = FrameChangeDetector()
+    first = detector.check("client", _png(_chat(3)))
+    assert first.plan is None
+    detector.update("client", first, _chat_lines(3))
+
+    second = detector.check("client", _png(_chat(4)))
+    assert not second.unchanged and second.plan is not None
+    detector.update("client", second, merge_lines(second.plan.kept, []))
+
+    stats = detector.stats()
+    assert stats["incremental"] == 1
+    assert 0.5 < stats["ocr_row_ratio"] < 0.6
+
+
+def _subtitle(text: str) -> Image.Image:
+    image = Image.new("RGB", (320, 96), (0, 0, 0))
+    ImageDraw.Draw(image).text((40, 60), text, fill=(255, 255, 255))
+    return image
+
+
+SUBTITLE_LINE = OCRLine("hello there", (40.0, 60.0, 200.0, 72.0), 0.95)
+
+
+def test_box_reuse_plans_recognition_of_changed_boxes_only() -> None:
+    previous = _profile(_subtitle("hello there"))
+
+    plan = plan_box_reuse(previous, _profile(_subtitle("bye there")), [SUBTITLE_LINE], threshold=6.0, block_size=16)
+    assert plan is not None
+    assert plan.recognize == [SUBTITLE_LINE] and plan.kept == [] and plan.regions == []
+
+    # 상자 밖으로 길어진 줄이나 새 위치의 텍스트는 검출이 필요하다.
+    longer = _profile(_subtitle("hello there, this line is now much longer"))
+    assert plan_box_reuse(previous, longer, [SUBTITLE_LINE], threshold=6.0, block_size=16) is None
+    moved = _subtitle("hello there")
+    ImageDraw.Draw(moved).text((40, 10), "new line", fill=(255, 255, 255))
+    assert plan_box_reuse(previous, _profile(moved), [SUBTITLE_LINE], threshold=6.0, block_size=16) is None
+
+
+def test_crop_box_pads_and_clamps() -> None:
+    image = np.zeros((96, 320, 3), dtype=np.uint8)
+
+    assert crop_box(image, (40.0, 60.0, 200.0, 72.0)).shape == (16, 164, 3)
+    assert crop_box(image, (0.0, 90.0, 330.0, 100.0)).shape == (8, 320, 3)
+
+
+def test_detector_reuses_boxes_until_refresh_and_validates_recognition() -> None:
+    detector = FrameChangeDetector(reuse_boxes=True, min_confidence=0.8)
+    first = detector.check("tv", _png(_subtitle("hello there")))
+    detector.update("tv", first, [SUBTITLE_LINE])
+
+    second = detector.check("tv", _png(_subtitle("bye there")))
+    assert second.plan is not None and second.plan.recognize == [SUBTITLE_LINE]
+    # 신뢰도가 낮으면 받아들이지 않는다. (호출자가 검출부터 다시)
+    assert detector.accept_recognition(second.plan, [("bye tnere", 0.4)]) is None
+    # 결과 수가 상자 수와 다르면 빠진 줄이 생기므로 받아들이지 않는다.
+    assert detector.accept_recognition(second.plan, []) is None
+    assert detector.accept_recognition(second.plan, [("bye there", 0.93), ("extra", 0.95)]) is None
+    lines = detector.accept_recognition(second.plan, [("bye there", 0.93)])
+    assert [(line.text, line.box) for line in lines] == [("bye there", SUBTITLE_LINE.box)]
+    detector.update("tv", second, lines)
+
+    stats = detector.stats()
+    assert stats["box_reuses"] == 1 and stats["box_reuse_fallbacks"] == 3
+
+    # 마지막 검출 후 box_refresh_sec이 지나면 상자를 재사용하지 않는다.
+    detector.box_refresh_sec = 0.0
+    third = detector.check("tv", _png(_subtitle("hello there")))
+    assert third.plan is None or not third.plan.recognize
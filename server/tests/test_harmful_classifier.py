@@ -0,0 +1,121 @@
+"""
+HarmfulTextClassifier 배치 추론 단위 테스트 (가짜 tokenizer/model/torch 주입).
+"""
+
+import contextlib
+import types
+from typing import List
+
+import numpy as np
+import pytest
+
+from nlp.harmful_classifier import HarmfulTextClassifier
+
+HARMFUL_MARK = ord("!")
+
+
+def _fake_torch():
+    def softmax(logits, dim=-1):
+        exp = np.exp(logits - logits.max(axis=dim, keepdims=True))
+        return exp / exp.sum(axis=dim, keepdims=True)
+
+    return types.SimpleNamespace(
+        tensor=np.asarray,
+        no_grad=contextlib.nullcontext,
+        max=lambda probs, dim=-1: (probs.max(axis=dim), probs.argmax(axis=dim)),
+        nn=types.SimpleNamespace(functional=types.SimpleNamespace(softmax=softmax)),
+    )
+
+
+class FakeTokenizer:
+    """문자 코드를 토큰으로 사용하며, 배치별 패딩 길이를 기록한다."""
+
+    def __init__(self) -> None:
+        self.padded_lengths: List[int] = []
+
+    def __call__(self, texts, *, return_tensors, padding, truncation, max_length):
+        assert padding == "longest"
+        rows = [[ord(ch) for ch in text][:max_length] for text in texts]
+        longest = max(len(row) for row in rows)
+        self.padded_lengths.append(longest)
+        return {"input_ids": [row + [0] * (longest - len(row)) for row in rows]}
+
+
+class FakeModel:
+    """'!'가 포함된 입력을 유해로 판정한다."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: List[int] = []
+
+    def __call__(self, input_ids):
+        self.batch_sizes.append(len(input_ids))
+        harmful = (input_ids == HARMFUL_MARK).any(axis=1)
+        logits = np.where(harmful[:, None], [[0.0, 3.0]], [[3.0, 0.0]])
+        return types.SimpleNamespace(logits=logits)
+
+
+def _classifier(**kwargs):
+    tokenizer, model = FakeTokenizer(), FakeModel()
+    classifier = HarmfulTextClassifier(
+        tokenizer_loader=lambda _: tokenizer,
+        model_loader=lambda _: model,
+        torch_module=_fake_torch(),
+        **kwargs,
+    )
+    return classifier, tokenizer, model
+
+
+def test_predict_batch_preserves_input_order() -> None:
+    """
+    길이순 버킷팅 후에도 결과는 입력 순서대로 반환되어야 한다.
+    """
+
+    classifier, _, _ = _classifier()
+    texts = ["아주 긴 정상 문장입니다", "나빠!", "", "안녕", "이것도 나쁜 말!"]
+
+    results = classifier.predict_batch(texts)
+
+    assert [result.is_harmful for result in results] == [False, True, False, False, True]
+    assert [result.text for result in results] == ["아주 긴 정상 문장입니다", "나빠!", "", "안녕", "이것도 나쁜 말!"]
+    assert results[2].confidence == 0.0
+    assert all(0.5 < result.confidence <= 1.0 for i, result in enumerate(results) if i != 2)
+
+
+def test_predict_batch_buckets_by_length_and_pads_dynamically() -> None:
+    """
+    비슷한 길이끼리 배치를 구성하고, 배치 내 최장 길이까지만 패딩해야 한다.
+    """
+
+    classifier, tokenizer, model = _classifier(batch_size=2, max_length=256)
+    texts = ["a" * 40, "b", "c" * 41, "dd"]
+
+    classifier.predict_batch(texts)
+
+    assert model.batch_sizes == [2, 2]
+    assert tokenizer.padded_lengths == [2, 41]
+
+
+def test_predict_delegates_to_batch_and_validates_batch_size() -> None:
+    classifier, _, model = _classifier()
+
+    assert classifier.predict("정상").is_harmful is False
+    assert classifier.predict("   ").confidence == 0.0
+    assert model.batch_sizes == [1]
+
+    with pytest.raises(ValueError):
+        classifier.predict_batch(["text"], batch_size=-1)
+
+
+def test_predict_batch_keeps_order_across_mini_batches() -> None:
+    """
+    여러 미니배치로 나뉘어도 결과는 입력 순서대로 돌아와야 한다.
+    """
+
+    classifier, _, model = _classifier(batch_size=2)
+    texts = ["긴 정상 문장입니다", "!", "중간 길이!", "", "짧음", "아주 아주 긴 나쁜 문장!"]
+
+    results = classifier.predict_batch(texts)
+
+    assert model.batch_sizes == [2, 2, 1]
+    assert [result.text for result in results] == texts
+    assert [result.is_harmful for result in results] == [False, True, True, False, False, True]
@@ -0,0 +1,154 @@
+"""
+/health/live, /health/ready 및 모델 미준비 시 503 응답 테스트 (모델 로더를 교체한 TestClient 사용).
+"""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from nlp.harmful_classifier import ClassificationResult
+from nlp.keyword_store import KeywordStore
+from utils.readiness import ComponentRegistry
+from utils.result_cache import ResultCache
+
+
+class StubClassifier:
+    model_name = "stub"
+    backend = "torch"
+
+    def predict(self, text: str) -> ClassificationResult:
+        return ClassificationResult(is_harmful=False, confidence=0.8, text=text)
+
+    def predict_batch(self, texts, *, batch_size=None):
+        return [self.predict(text) for text in texts]
+
+
+class StubOCRPool:
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def patch_main(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "KEYWORD_STORE", KeywordStore(str(tmp_path / "bad_words.json"), ["시발", "병신"]))
+    monkeypatch.setattr(main, "KEYWORDS_RELOAD_INTERVAL_SEC", 0)
+    monkeypatch.setattr(main, "RESULT_CACHE", ResultCache())
+    monkeypatch.setattr(main, "MODELS", ComponentRegistry())
+    monkeypatch.setattr(main, "MODEL_READY_TIMEOUT_SEC", 0.05)
+    monkeypatch.setattr(main, "STT_SERVICE", None)
+    monkeypatch.setattr(main, "CLASSIFIER", None)
+    monkeypatch.setattr(main, "CLASSIFIER_SCHEDULER", None)
+    monkeypatch.setattr(main, "_load_stt_service", lambda: object())
+    monkeypatch.setattr(main, "_load_classifier", StubClassifier)
+    monkeypatch.setattr(main, "_load_ocr_pool", StubOCRPool)
+    return monkeypatch
+
+
+def _wait_ready(client: TestClient) -> None:
+    for _ in range(100):
+        if client.get("/health/ready").status_code == 200:
+            return
+        threading.Event().wait(0.02)
+    raise AssertionError("components did not become ready")
+
+
+def test_health_ready_when_all_components_loaded(patch_main) -> None:
+    with TestClient(main.app) as client:
+        _wait_ready(client)
+        assert client.get("/health/live").json() == {"status": "ok"}
+        body = client.get("/health/ready").json()
+        assert body["ready"] is True
+        assert {name: state["status"] for name, state in body["components"].items()} == {
+            "stt": "ready",
+            "classifier": "ready",
+            "ocr": "ready",
+        }
+        response = client.post("/analyze", json={"text": "평범한 문장", "use_ai": True})
+        assert response.status_code == 200
+        assert response.json()["method"] == "ai"
+
+
+def test_classifier_loading_returns_503(patch_main) -> None:
+    release = threading.Event()
+
+    def slow_classifier():
+        release.wait(5)
+        return StubClassifier()
+
+    patch_main.setattr(main, "_load_classifier", slow_classifier)
+    try:
+        with TestClient(main.app) as client:
+            assert client.get("/health/live").status_code == 200
+            ready = client.get("/health/ready")
+            assert ready.status_code == 503
+            assert ready.json()["ready"] is False
+            assert ready.json()["components"]["classifier"]["status"] == "loading"
+
+            response = client.post("/analyze", json={"text": "평범한 문장", "use_ai": True})
+            assert response.status_code == 503
+            assert response.json()["detail"]["component"] == "classifier"
+            assert response.json()["detail"]["status"] == "loading"
+
+            # 키워드 판정은 모델 로딩과 무관하게 동작한다.
+            keyword = client.post("/analyze", json={"text": "아 시발 진짜", "use_ai": True})
+            assert keyword.status_code == 200 and keyword.json()["has_violation"] is True
+            release.set()
+    finally:
+        release.set()
+
+
+def test_classifier_failure_returns_503(patch_main) -> None:
+    def broken_classifier():
+        raise RuntimeError("model missing")
+
+    patch_main.setattr(main, "_load_classifier", broken_classifier)
+    with TestClient(main.app) as client:
+        assert client.get("/health/live").status_code == 200
+        for _ in range(100):
+            state = client.get("/health/ready").json()["components"]["classifier"]
+            if state["status"] != "loading":
+                break
+            threading.Event().wait(0.02)
+        assert state["status"] == "failed" and state["error"] == "model missing"
+        assert client.get("/health/ready").status_code == 503
+
+        response = client.post("/analyze", json={"text": "평범한 문장", "use_ai": True})
+        assert response.status_code == 503
+        assert response.json()["detail"]["status"] == "failed"
+
+
+def test_scheduler_start_failure_leaves_classifier_unset(patch_main) -> None:
+    async def broken_start(self) -> None:
+        raise RuntimeError("scheduler failed")
+
+    patch_main.setattr(main.ClassifierBatchScheduler, "start", broken_start)
+    with TestClient(main.app) as client:
+        assert client.post("/analyze", json={"text": "평범한 문장", "use_ai": True}).status_code == 503
+        assert main.MODELS.state("classifier").status == "failed"
+        assert main.CLASSIFIER is None and main.CLASSIFIER_SCHEDULER is None
+
+
+def test_shutdown_while_ocr_loading_disposes_pool(patch_main) -> None:
+    release = threading.Event()
+    pools = []
+
+    class SlowOCRPool(StubOCRPool):
+        def __init__(self) -> None:
+            release.wait(5)
+            self.closed = False
+            pools.append(self)
+
+        def shutdown(self) -> None:
+            self.closed = True
+
+    patch_main.setattr(main, "_load_ocr_pool", SlowOCRPool)
+    try:
+        with TestClient(main.app) as client:
+            assert client.get("/health/ready").json()["components"]["ocr"]["status"] == "loading"
+            threading.Timer(0.1, release.set).start()
+    finally:
+        release.set()
+
+    assert len(pools) == 1 and pools[0].closed
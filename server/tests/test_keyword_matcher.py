@@ -0,0 +1,110 @@
+"""
+KeywordMatcher(Aho-Corasick) 단위 테스트.
+"""
+
+import re
+from typing import List
+
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.text_normalizer import TextNormalizer
+
+
+KEYWORDS = ["시발", "시 발", "ㅅㅂ", "병신", "미친", "미친놈", "미친 놈", "Bad"]
+
+
+def _regex_check(text: str, keywords: List[str]) -> List[str]:
+    """기존 check_keywords의 정규식 구현 (동작 비교용)."""
+
+    text_lower = text.lower()
+    matched = []
+    for bad_word in keywords:
+        bad_word_lower = bad_word.lower().strip()
+        if not bad_word_lower:
+            continue
+        pattern = r"(^|[\s\W])" + re.escape(bad_word_lower) + r"([\s\W]|$)"
+        if re.search(pattern, text_lower) or bad_word_lower == text_lower.strip():
+            matched.append(bad_word)
+    return matched
+
+
+def test_matches_regex_boundary_semantics() -> None:
+    """
+    단어 경계 모드의 결과가 기존 정규식 구현과 동일해야 한다.
+    """
+
+    matcher = KeywordMatcher(KEYWORDS)
+    samples = [
+        "시발",
+        "아 시발 진짜",
+        "시발놈아",
+        "너 미친놈이냐",
+        "미친 놈!",
+        "ㅅㅂ...병신",
+        "BAD word",
+        "badminton",
+        "  미친  ",
+        "평범한 문장입니다",
+    ]
+
+    for text in samples:
+        detected = {match.keyword for match in matcher.iter_matches(text)}
+        assert detected == set(_regex_check(text, KEYWORDS)), text
+
+
+def test_substring_mode_and_offsets() -> None:
+    """
+    whole_word=False이면 부분 문자열도 매칭하며, 원본 텍스트 기준 위치를 보고한다.
+    """
+
+    matcher = KeywordMatcher(KEYWORDS)
+    text = "이 미친놈아"
+
+    assert matcher.find_all(text) == []
+    assert matcher.find_all(text, whole_word=False) == ["미친", "미친놈"]
+
+    spans = [(m.keyword, text[m.start:m.end]) for m in matcher.iter_matches(text, whole_word=False)]
+    assert ("미친놈", "미친놈") in spans
+
+
+def test_empty_dictionary_and_text() -> None:
+    """
+    빈 사전/빈 텍스트에서는 아무것도 매칭하지 않는다.
+    """
+
+    assert KeywordMatcher([]).find_all("시발") == []
+    assert KeywordMatcher(["", "  "]).find_all("아무 말") == []
+    assert KeywordMatcher(KEYWORDS).find_all("") == []
+
+
+def test_normalized_matching_reports_surface_form() -> None:
+    """
+    정규화 모드에서는 기본형만으로 변형 표기를 잡고, 실제 표기를 보고한다.
+    """
+
+    matcher = KeywordMatcher(["시발", "개새끼", "ㅅㅂ"], normalizer=TextNormalizer())
+
+    assert matcher.find_all("아 시 발 진짜") == ["시 발"]
+    assert matcher.find_all("시.1.발") == ["시.1.발"]
+    assert matcher.find_all("ㄱㅅㄲ야") == []
+    assert matcher.find_all("ㄱ ㅅ ㄲ") == ["ㄱ ㅅ ㄲ"]
+    assert matcher.find_all("ㅄ") == []
+    # 경계 조건은 원본 텍스트 기준으로 유지된다 ("시발점"은 정상 단어)
+    assert matcher.find_all("시발점에서 출발") == []
+    assert matcher.find_all("시발점에서 출발", whole_word=False) == ["시발"]
+
+
+def test_normalized_matching_does_not_split_syllables() -> None:
+    """
+    자모 단위 매칭이 원본 음절의 일부에서 시작하거나 끝나면 매칭으로 보지 않는다.
+    """
+
+    matcher = KeywordMatcher(["간나", "시발", "ㅅㅂ"], normalizer=TextNormalizer())
+
+    # "간나"는 "간난"의 앞 자모 "ㄱㅏㄴㄴㅏ"와 겹치지만 마지막 음절 "난"의 종성이 남는다.
+    assert matcher.find_all("간난") == []
+    assert matcher.find_all("간난", whole_word=False) == []
+    # 음절 중간(중성)에서 시작하는 매칭도 제외한다. ("ㅏ시발"의 "ㅏ"는 "가"의 일부)
+    assert KeywordMatcher(["ㅏ시발"], normalizer=TextNormalizer()).find_all("가시발", whole_word=False) == []
+    # 원본 음절 전체를 덮는 매칭과 초성 약어 매칭은 그대로 유지된다.
+    assert matcher.find_all("간나 새끼") == ["간나"]
+    assert matcher.find_all("ㅅ발") == ["ㅅ발"]
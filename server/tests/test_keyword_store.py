@@ -0,0 +1,100 @@
+"""
+KeywordStore 핫 리로드 단위 테스트.
+"""
+
+import json
+import os
+
+import pytest
+
+from nlp.keyword_store import KeywordStore
+
+
+def _write(path, keywords, version="1.0") -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"keywords": keywords, "version": version}, file, ensure_ascii=False)
+
+
+def test_missing_file_creates_defaults(tmp_path) -> None:
+    """
+    파일이 없으면 기본 키워드로 파일을 만들고 버전 1 스냅샷을 로드한다.
+    """
+
+    path = tmp_path / "data" / "bad_words.json"
+    store = KeywordStore(str(path), ["시발"])
+
+    snapshot = store.load()
+
+    assert path.exists()
+    assert snapshot.version == 1
+    assert store.matcher.find_all("아 시발") == ["시발"]
+
+
+def test_reload_swaps_matcher_only_when_file_changes(tmp_path) -> None:
+    """
+    파일이 바뀐 경우에만 새 매처로 교체하고 버전을 올린다.
+    """
+
+    path = tmp_path / "bad_words.json"
+    _write(path, ["시발"])
+    store = KeywordStore(str(path), [])
+    store.load()
+    old_matcher = store.matcher
+
+    assert store.reload_if_changed() is False
+
+    _write(path, ["시발", "병신"], version="2.0")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert store.reload_if_changed() is True
+    assert store.matcher is not old_matcher
+    assert store.snapshot.version == 2
+    assert store.snapshot.file_version == "2.0"
+    assert store.matcher.find_all("병신") == ["병신"]
+
+
+def test_invalid_file_keeps_previous_snapshot(tmp_path) -> None:
+    """
+    리로드 중 JSON 파싱에 실패하면 기존 스냅샷을 유지한다.
+    """
+
+    path = tmp_path / "bad_words.json"
+    _write(path, ["시발"])
+    store = KeywordStore(str(path), [])
+    previous = store.load()
+
+    path.write_text("{ broken", encoding="utf-8")
+
+    assert store.load() is previous
+    assert store.matcher.find_all("시발") == ["시발"]
+
+
+@pytest.mark.parametrize("keywords", ["시발", ["시발", 3], {"시발": 1}, None])
+def test_malformed_keywords_keep_previous_snapshot(tmp_path, keywords) -> None:
+    """
+    keywords가 문자열 리스트가 아니면 리로드를 실패로 보고 기존 스냅샷을 유지한다.
+    """
+
+    path = tmp_path / "bad_words.json"
+    _write(path, ["병신"])
+    store = KeywordStore(str(path), [])
+    previous = store.load()
+
+    _write(path, keywords, version="2.0")
+
+    assert store.load() is previous
+    assert store.matcher.find_all("병신") == ["병신"]
+    assert store.matcher.find_all("시") == []
+
+
+def test_numeric_file_version_is_stored_as_string(tmp_path) -> None:
+    """
+    파일의 version이 숫자여도 문자열로 보관한다. (/health의 keywords_file_version)
+    """
+
+    path = tmp_path / "bad_words.json"
+    _write(path, ["시발"], version=2)
+    store = KeywordStore(str(path), [])
+
+    assert store.load().file_version == "2"
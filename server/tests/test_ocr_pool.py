@@ -0,0 +1,190 @@
+"""
+OCRWorkerPool (작업자 풀 + 상한이 있는 요청 접수) 테스트.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from services.frame_change import OCRLine
+from services.ocr_pool import OCROverloadedError, OCRWorkerPool
+
+
+class FakeOCRService:
+    """이미지 크기와 실행 위치(프로세스/스레드)를 텍스트로 돌려주는 OCR 서비스 대역."""
+
+    def __init__(self, delay_sec: float = 0.0) -> None:
+        self.delay_sec = delay_sec
+
+    def extract_text(self, image):
+        array = np.array(image.convert("RGB")) if hasattr(image, "convert") else image
+        time.sleep(self.delay_sec)
+        return [f"{array.shape[1]}x{array.shape[0]}", str(os.getpid()), threading.current_thread().name], self.delay_sec
+
+
+    def extract_lines(self, image):
+        array = np.array(image.convert("RGB")) if hasattr(image, "convert") else image
+        height, width = array.shape[:2]
+        return [OCRLine(f"{width}x{height}", (0.0, 0.0, float(width), float(height)))], 0.01
+
+
+    def recognize(self, crops):
+        return [(f"{crop.shape[1]}x{crop.shape[0]}", 0.9) for crop in crops], 0.005
+
+
+def make_fake_service() -> FakeOCRService:
+    return FakeOCRService()
+
+
+def make_staggered_service() -> FakeOCRService:
+    """처음 뜬 작업자만 바로 로드되고 나머지는 1초 늦게 로드되는 서비스 팩토리."""
+
+    try:
+        os.close(os.open(os.path.join(os.environ["OCR_POOL_TEST_DIR"], "first"), os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        time.sleep(1.0)
+    return FakeOCRService()
+
+
+def _png(width: int, height: int) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_thread_mode_decodes_and_runs_off_the_event_loop() -> None:
+    pool = OCRWorkerPool(0, service_factory=FakeOCRService).start()
+
+    async def scenario():
+        return await pool.extract_text(_png(64, 32))
+
+    try:
+        (size, pid, thread), _ = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert size == "64x32"
+    assert pid == str(os.getpid())
+    assert thread.startswith("ocr")
+    assert pool.stats()["completed"] == 1
+
+
+def test_full_queue_is_rejected_immediately() -> None:
+    pool = OCRWorkerPool(0, max_pending=2, service_factory=lambda: FakeOCRService(delay_sec=0.05)).start()
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    async def scenario():
+        accepted = [asyncio.ensure_future(pool.extract_text(image)) for _ in range(2)]
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        with pytest.raises(OCROverloadedError):
+            await pool.extract_text(image)
+        rejected_in = time.perf_counter() - started
+        await asyncio.gather(*accepted)
+        return rejected_in
+
+    try:
+        rejected_in = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert rejected_in < 0.01
+    stats = pool.stats()
+    assert stats["completed"] == 2 and stats["rejected"] == 1 and stats["in_flight"] == 0
+
+
+def test_process_mode_runs_ocr_in_worker_process() -> None:
+    pool = OCRWorkerPool(1, service_factory=make_fake_service).start()
+
+    async def scenario():
+        return await pool.extract_text(_png(16, 16))
+
+    try:
+        (size, pid, _), _ = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert size == "16x16"
+    assert pid != str(os.getpid())
+    assert pool.stats()["mode"] == "process"
+
+
+def test_start_waits_for_every_worker_to_load(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("OCR_POOL_TEST_DIR", str(tmp_path))
+    pool = OCRWorkerPool(2, service_factory=make_staggered_service)
+
+    started = time.monotonic()
+    try:
+        pool.start()
+        elapsed = time.monotonic() - started
+    finally:
+        pool.shutdown()
+
+    # 먼저 준비된 작업자가 ping을 모두 받아도 늦게 로드되는 작업자까지 기다린다.
+    assert elapsed >= 1.0
+
+
+def test_extract_lines_runs_all_regions_in_one_request() -> None:
+    pool = OCRWorkerPool(0, service_factory=FakeOCRService).start()
+    frame = np.zeros((100, 40, 3), dtype=np.uint8)
+
+    async def scenario():
+        return await pool.extract_lines([frame[0:20], frame[50:80]])
+
+    try:
+        lines, elapsed = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert [[line.text for line in region] for region in lines] == [["40x20"], ["40x30"]]
+    assert elapsed == pytest.approx(0.02)
+    assert pool.stats()["completed"] == 1
+
+
+def test_recognize_reads_crops_without_detection() -> None:
+    pool = OCRWorkerPool(0, service_factory=FakeOCRService).start()
+    crops = [np.zeros((16, 100, 3), dtype=np.uint8), np.zeros((12, 40, 3), dtype=np.uint8)]
+
+    async def scenario():
+        return await pool.recognize(crops)
+
+    try:
+        results, _ = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert results == [("100x16", 0.9), ("40x12", 0.9)]
+
+
+class ContiguityCheckingOCRService(FakeOCRService):
+    """cv2 전처리처럼 연속 배열만 받는 OCR 서비스 대역."""
+
+    def recognize(self, crops):
+        assert all(crop.flags.c_contiguous for crop in crops)
+        return super().recognize(crops)
+
+
+def test_thread_mode_makes_raw_upload_crops_contiguous() -> None:
+    pool = OCRWorkerPool(0, service_factory=ContiguityCheckingOCRService).start()
+    # 무압축 BGRA 업로드의 RGB 뷰(음수 stride, 읽기 전용)에서 잘라 낸 상자
+    bgra = np.zeros((32, 100, 4), dtype=np.uint8)
+    bgra.flags.writeable = False
+    crops = [bgra[:, :, 2::-1][4:20, 10:90]]
+
+    async def scenario():
+        return await pool.recognize(crops)
+
+    try:
+        results, _ = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert results == [("80x16", 0.9)]
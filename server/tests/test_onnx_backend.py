@@ -0,0 +1,95 @@
+"""
+ONNX Runtime 백엔드 단위 테스트 (가짜 세션 주입).
+"""
+
+import types
+
+import numpy as np
+import pytest
+
+from nlp import harmful_classifier
+from nlp.onnx_backend import OnnxClassifierBackend, compare_outputs, softmax
+
+
+class FakeSession:
+    """input_ids에 '!'(33)가 있으면 유해 logits를 반환하는 가짜 InferenceSession."""
+
+    def __init__(self) -> None:
+        self.feeds = []
+
+    def get_inputs(self):
+        return [types.SimpleNamespace(name="input_ids"), types.SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, feeds):
+        self.feeds.append(feeds)
+        harmful = (feeds["input_ids"] == 33).any(axis=1)
+        return [np.where(harmful[:, None], [[0.0, 4.0]], [[4.0, 0.0]])]
+
+
+def test_backend_feeds_only_model_inputs_as_int64() -> None:
+    session = FakeSession()
+    backend = OnnxClassifierBackend(session)
+
+    logits = backend.run(
+        {"input_ids": [[1, 33], [1, 2]], "attention_mask": [[1, 1], [1, 1]], "token_type_ids": [[0, 0], [0, 0]]}
+    )
+
+    assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+    assert session.feeds[0]["input_ids"].dtype == np.int64
+    assert softmax(logits).argmax(axis=-1).tolist() == [1, 0]
+
+
+def test_compare_outputs_reports_diff_and_agreement() -> None:
+    torch_probs = np.array([[0.9, 0.1], [0.2, 0.8]])
+
+    same = compare_outputs(torch_probs, torch_probs + np.array([[0.02, -0.02], [0.0, 0.0]]))
+    assert same.passed(tolerance=0.05)
+    assert same.max_abs_diff == pytest.approx(0.02, abs=1e-6)
+
+    flipped = compare_outputs(torch_probs, np.array([[0.4, 0.6], [0.2, 0.8]]))
+    assert flipped.label_agreement == 0.5
+    assert not flipped.passed(tolerance=1.0)
+
+    with pytest.raises(ValueError):
+        compare_outputs(torch_probs, torch_probs[:1])
+
+
+def test_classifier_onnx_backend_skips_torch_model(monkeypatch) -> None:
+    """
+    backend="onnx"이고 캐시된 모델이 있으면 torch 모델을 로드하지 않고 ONNX로 추론한다.
+    """
+
+    session = FakeSession()
+    monkeypatch.setattr(
+        harmful_classifier.OnnxClassifierBackend,
+        "load_or_export",
+        classmethod(lambda cls, *args, **kwargs: cls(session, model_path="cached.onnx")),
+    )
+
+    def tokenizer(texts, *, return_tensors, padding, truncation, max_length):
+        assert return_tensors == "np"
+        rows = [[ord(ch) for ch in text] for text in texts]
+        longest = max(len(row) for row in rows)
+        return {
+            "input_ids": np.array([row + [0] * (longest - len(row)) for row in rows]),
+            "attention_mask": np.array([[1] * len(row) + [0] * (longest - len(row)) for row in rows]),
+        }
+
+    def model_loader(_name):
+        raise AssertionError("torch 모델을 로드하면 안 됩니다.")
+
+    classifier = harmful_classifier.HarmfulTextClassifier(
+        backend="onnx",
+        tokenizer_loader=lambda _: tokenizer,
+        model_loader=model_loader,
+        torch_module=types.SimpleNamespace(),
+    )
+
+    results = classifier.predict_batch(["정상 문장", "나빠!"])
+
+    assert classifier.model is None
+    assert [result.is_harmful for result in results] == [False, True]
+    assert results[1].confidence > 0.9
+
+    with pytest.raises(ValueError):
+        harmful_classifier.HarmfulTextClassifier(backend="tensorrt", torch_module=types.SimpleNamespace())
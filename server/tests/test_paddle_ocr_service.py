@@ -0,0 +1,75 @@
+"""
+PaddleOCRService 결과 파싱 테스트 (paddleocr 2.7의 반환 형식을 흉내 내는 대역 사용).
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+
+class StubPaddleOCR:
+    """
+    paddleocr 2.7 PaddleOCR의 반환 형식 대역.
+
+    ocr()는 리스트 입력을 페이지 목록으로 보고 이미지마다 결과 리스트를 하나씩 돌려주며,
+    처음 받은 페이지 수로 page_num을 고정한다. text_recognizer는 이미지 리스트를 한 배치로 읽는다.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.page_num = 0
+        self.recognizer_batches = []
+
+    def text_recognizer(self, img_list):
+        self.recognizer_batches.append(len(img_list))
+        return [(f"{img.shape[1]}x{img.shape[0]}", 0.9) for img in img_list], 0.01
+
+    def ocr(self, img, det=True, rec=True, cls=True):
+        if isinstance(img, list):
+            if self.page_num > len(img) or self.page_num == 0:
+                self.page_num = len(img)
+            images = img[: self.page_num]
+        else:
+            images = [img]
+        if not det:
+            return [self.text_recognizer([image])[0] for image in images]
+        results = []
+        for image in images:
+            height, width = image.shape[:2]
+            box = [[0, 0], [width, 0], [width, height], [0, height]]
+            results.append([[box, (f"{width}x{height}", 0.95)]])
+        return results
+
+
+@pytest.fixture
+def service(monkeypatch):
+    module = types.ModuleType("paddleocr")
+    module.PaddleOCR = StubPaddleOCR
+    monkeypatch.setitem(sys.modules, "paddleocr", module)
+    sys.modules.pop("services.paddle_ocr_service", None)
+    try:
+        yield importlib.import_module("services.paddle_ocr_service").PaddleOCRService()
+    finally:
+        sys.modules.pop("services.paddle_ocr_service", None)
+
+
+def test_recognize_returns_one_result_per_crop_in_one_batch(service) -> None:
+    crops = [np.zeros((16, 100, 3), dtype=np.uint8), np.zeros((12, 40, 3), dtype=np.uint8)]
+
+    results, _ = service.recognize(crops)
+
+    assert results == [("100x16", 0.9), ("40x12", 0.9)]
+    assert service.ocr.recognizer_batches == [2]
+
+
+def test_recognize_does_not_change_full_frame_ocr(service) -> None:
+    service.recognize([np.zeros((16, 100, 3), dtype=np.uint8)])
+
+    lines, _ = service.extract_lines(np.zeros((60, 80, 3), dtype=np.uint8))
+
+    assert service.ocr.page_num == 0
+    assert [(line.text, line.box) for line in lines] == [("80x60", (0.0, 0.0, 80.0, 60.0))]
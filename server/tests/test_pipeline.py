@@ -0,0 +1,66 @@
+"""
+AudioProcessingPipeline 유해성 판단 테스트.
+"""
+
+import asyncio
+
+from audio.deepgram_live import LiveTranscript
+from audio.pipeline import AudioProcessingPipeline
+from nlp.harmful_classifier import ClassificationResult
+from utils.result_cache import ResultCache
+
+
+class NoSTT:
+    def transcribe(self, audio) -> str:
+        return ""
+
+
+class FixedClassifier:
+    model_name = "beomi/KcELECTRA-base"
+
+    def __init__(self, backend: str, confidence: float) -> None:
+        self.backend = backend
+        self.confidence = confidence
+        self.calls = 0
+
+    def predict(self, text: str) -> ClassificationResult:
+        self.calls += 1
+        return ClassificationResult(is_harmful=False, confidence=self.confidence, text=text)
+
+
+def test_pipeline_keyword_matching_respects_word_boundaries() -> None:
+    """
+    음성 인식 결과도 단어 경계 기준으로 매칭한다. 정규화가 공백을 지워도 단어 사이에 걸친
+    일반 문장은 유해로 판정하지 않는다.
+    """
+
+    pipeline = AudioProcessingPipeline(NoSTT(), None, keywords=["시발", "개새", "미친"])
+
+    async def harmful(text):
+        output = await pipeline.process_transcript(LiveTranscript(text, True, 0.0, 1.0))
+        return output.classification.is_harmful
+
+    async def scenario():
+        texts = ("시 발표 준비했어", "개 새로운 집이야", "미친구 만나러 가", "아 시 발 진짜", "이 미친 사람")
+        return [await harmful(text) for text in texts]
+
+    assert asyncio.run(scenario()) == [False, False, False, True, True]
+
+
+def test_classifier_cache_is_separated_by_backend() -> None:
+    """같은 모델이라도 onnx와 torch 결과는 캐시를 공유하지 않는다."""
+
+    cache = ResultCache(max_size=16)
+    onnx = FixedClassifier("onnx", 0.7)
+    torch = FixedClassifier("torch", 0.9)
+
+    async def confidence(classifier):
+        pipeline = AudioProcessingPipeline(NoSTT(), classifier, keywords=[], result_cache=cache)
+        output = await pipeline.process_transcript(LiveTranscript("평범한 문장", True, 0.0, 1.0))
+        return output.classification.confidence
+
+    async def scenario():
+        return [await confidence(classifier) for classifier in (onnx, torch, onnx, torch)]
+
+    assert asyncio.run(scenario()) == [0.7, 0.9, 0.7, 0.9]
+    assert (onnx.calls, torch.calls) == (1, 1)
@@ -0,0 +1,94 @@
+"""
+무압축 픽셀 버퍼 업로드(services/raw_image.py) 테스트.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from services.frame_change import FrameChangeDetector, OCRLine
+from services.raw_image import RawImageError, decode_raw, is_raw_content_type
+
+
+def _bgra(rgb: np.ndarray, padding: int = 0) -> bytes:
+    """RGB 배열을 행마다 padding 바이트 여백이 붙은 BGRA 버퍼로 만든다."""
+
+    height, width = rgb.shape[:2]
+    bgra = np.dstack([rgb[:, :, ::-1], np.full((height, width), 255, dtype=np.uint8)])
+    rows = np.zeros((height, width * 4 + padding), dtype=np.uint8)
+    rows[:, : width * 4] = bgra.reshape(height, width * 4)
+    return rows.tobytes()
+
+
+def _rgb(seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, size=(5, 7, 3), dtype=np.uint8)
+
+
+def test_bgra_buffer_is_wrapped_without_copy() -> None:
+    rgb = _rgb()
+    data = _bgra(rgb, padding=4)
+
+    image = decode_raw(data, "image/x-raw-bgra", 7, 5, 7 * 4 + 4)
+
+    assert image.shape == (5, 7, 3)
+    np.testing.assert_array_equal(image, rgb)
+    assert np.shares_memory(image, np.frombuffer(data, dtype=np.uint8))
+    assert not image.flags.writeable
+
+
+def test_rgb_and_rgba_formats_default_stride() -> None:
+    rgb = _rgb(1)
+    rgba = np.dstack([rgb, np.zeros(rgb.shape[:2], dtype=np.uint8)])
+
+    np.testing.assert_array_equal(decode_raw(rgb.tobytes(), "image/x-raw-rgb", 7, 5), rgb)
+    np.testing.assert_array_equal(decode_raw(rgba.tobytes(), "Image/X-Raw-RGBA; charset=binary", 7, 5), rgb)
+    assert is_raw_content_type("image/x-raw-bgra")
+    assert not is_raw_content_type("image/png")
+    assert not is_raw_content_type(None)
+
+
+@pytest.mark.parametrize(
+    "content_type, width, height, stride, length",
+    [
+        ("image/x-raw-yuv", 7, 5, None, 140),  # 모르는 형식
+        ("image/x-raw-bgra", None, 5, None, 140),  # 크기 헤더 없음
+        ("image/x-raw-bgra", 7, 5, 20, 140),  # stride < width x 4
+        ("image/x-raw-bgra", 7, 5, None, 139),  # 버퍼가 짧음
+    ],
+)
+def test_invalid_raw_upload_is_rejected(content_type, width, height, stride, length) -> None:
+    with pytest.raises(RawImageError):
+        decode_raw(bytes(length), content_type, width, height, stride)
+
+
+def test_frame_change_accepts_raw_frames() -> None:
+    image = Image.new("RGB", (320, 160), (30, 30, 30))
+    draw = ImageDraw.Draw(image)
+    for index in range(6):
+        draw.text((8, 8 + index * 16), f"user{index}: hello world", fill=(230, 230, 230))
+    first = np.asarray(image)
+    detector = FrameChangeDetector(block_size=16, threshold=6.0)
+
+    data = _bgra(first)
+    check = detector.check("roi", data, decode_raw(data, "image/x-raw-bgra", 320, 160))
+    assert not check.unchanged
+    np.testing.assert_array_equal(check.image, first)
+    detector.update("roi", check, [OCRLine("user0: hello world", (8.0, 8.0, 140.0, 19.0))])
+
+    # 같은 버퍼는 해시로, 픽셀 몇 개만 다른 버퍼는 행 프로파일로 변화 없음 판정
+    assert detector.check("roi", data, decode_raw(data, "image/x-raw-bgra", 320, 160)).unchanged
+    noisy = first.copy()
+    noisy[150, 300] = 255
+    noisy_data = _bgra(noisy)
+    check = detector.check("roi", noisy_data, decode_raw(noisy_data, "image/x-raw-bgra", 320, 160))
+    assert check.unchanged and check.texts == ["user0: hello world"]
+
+    # 마지막 줄이 바뀐 프레임은 그 줄의 행 구간만 다시 OCR한다.
+    draw.text((8, 8 + 7 * 16), "user7: new message", fill=(230, 230, 230))
+    changed_data = _bgra(np.asarray(image))
+    check = detector.check("roi", changed_data, decode_raw(changed_data, "image/x-raw-bgra", 320, 160))
+    assert not check.unchanged
+    assert check.plan is not None and check.plan.regions
+    assert all(start >= 8 + 6 * 16 - 16 for start, _ in check.plan.regions)
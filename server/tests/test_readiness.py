@@ -0,0 +1,88 @@
+"""
+ComponentRegistry 병렬 로딩/준비 상태 단위 테스트.
+"""
+
+import asyncio
+import threading
+import time
+
+from utils.readiness import ComponentRegistry
+
+
+def test_components_load_concurrently_and_report_status() -> None:
+    """
+    여러 로더가 병렬로 실행되고, 컴포넌트별 상태와 로딩 시간이 기록되어야 한다.
+    """
+
+    barrier = threading.Barrier(2, timeout=2)
+    ready_values = []
+
+    def slow_loader(value):
+        def load():
+            barrier.wait()  # 두 로더가 동시에 실행 중이어야 통과
+            return value
+        return load
+
+    def failing_loader():
+        raise RuntimeError("model missing")
+
+    async def on_ready(value):
+        ready_values.append(value)
+
+    async def scenario():
+        registry = ComponentRegistry()
+        registry.start("a", slow_loader("A"), on_ready=on_ready)
+        registry.start("b", slow_loader("B"))
+        registry.start("broken", failing_loader)
+
+        assert await registry.wait("a", timeout=3) == "A"
+        assert await registry.wait("b", timeout=3) == "B"
+        assert await registry.wait("broken", timeout=3) is None
+        assert await registry.wait("unknown") is None
+        return registry
+
+    registry = asyncio.run(scenario())
+
+    status = registry.status()
+    assert status["a"]["status"] == "ready"
+    assert status["broken"]["status"] == "failed"
+    assert status["broken"]["error"] == "model missing"
+    assert status["a"]["load_time_ms"] is not None
+    assert ready_values == ["A"]
+    assert not registry.all_ready()
+
+
+def test_wait_times_out_while_loading() -> None:
+    release = threading.Event()
+
+    async def scenario():
+        registry = ComponentRegistry()
+        registry.start("slow", lambda: release.wait(2) and "done")
+        value = await registry.wait("slow", timeout=0.05)
+        state = registry.state("slow").status
+        release.set()
+        final = await registry.wait("slow", timeout=2)
+        return value, state, final
+
+    value, state, final = asyncio.run(scenario())
+
+    assert value is None
+    assert state == "loading"
+    assert final == "done"
+
+
+def test_shutdown_disposes_component_that_finishes_loading_after_cancel() -> None:
+    release = threading.Event()
+    disposed = []
+
+    async def scenario():
+        registry = ComponentRegistry()
+        registry.start("pool", lambda: release.wait(2) and "pool", dispose=disposed.append)
+        await asyncio.sleep(0.05)
+        # 로딩 중 종료: 작업 스레드가 끝난 뒤 만들어진 값이 정리되어야 한다.
+        threading.Timer(0.05, release.set).start()
+        await registry.shutdown(timeout=2)
+        return registry.get("pool")
+
+    assert asyncio.run(scenario()) is None
+    assert disposed == ["pool"]
@@ -0,0 +1,109 @@
+"""
+ResultCache(LRU + TTL) 단위 테스트.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from audio.deepgram_live import LiveTranscript
+from audio.pipeline import AudioProcessingPipeline
+from nlp.keyword_store import KeywordStore
+from utils.result_cache import ResultCache, cache_text_key
+
+
+class NoSTT:
+    def transcribe(self, audio) -> str:
+        return ""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_and_counters() -> None:
+    """
+    max_size를 넘으면 가장 오래 사용되지 않은 항목이 제거되고 카운터가 증가한다.
+    """
+
+    cache = ResultCache(max_size=2, ttl_sec=0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.put("c", 3)  # b 제거
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_ttl_expiration() -> None:
+    """
+    ttl_sec이 지난 항목은 조회 시 만료 처리된다.
+    """
+
+    clock = FakeClock()
+    cache = ResultCache(max_size=10, ttl_sec=5.0, clock=clock)
+    cache.put("key", ("시발",))
+
+    clock.now = 4.0
+    assert cache.get("key") == ("시발",)
+
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_disabled_cache_and_validation() -> None:
+    """
+    max_size=0이면 아무것도 저장하지 않으며, 음수 크기는 거부한다.
+    """
+
+    cache = ResultCache(max_size=0)
+    cache.put("key", 1)
+    assert cache.get("key") is None
+
+    with pytest.raises(ValueError):
+        ResultCache(max_size=-1)
+
+
+def test_cache_text_key_collapses_whitespace() -> None:
+    assert cache_text_key("  아  시 발 \n") == "아 시 발"
+
+
+def test_pipeline_keeps_original_text_and_surface_forms(tmp_path) -> None:
+    """
+    공백만 다른 텍스트도 응답 텍스트와 감지 표기는 원본 그대로이다. (캐시 키로만 정규화)
+    """
+
+    path = tmp_path / "bad_words.json"
+    path.write_text(json.dumps({"keywords": ["시발"]}), encoding="utf-8")
+    store = KeywordStore(str(path), [])
+    store.load()
+    pipeline = AudioProcessingPipeline(
+        NoSTT(), None, keyword_store=store, result_cache=ResultCache(max_size=16)
+    )
+
+    async def scenario():
+        outputs = []
+        for text in ("아 시 발", "아 시  발", "아 시  발"):
+            outputs.append(await pipeline.process_transcript(LiveTranscript(text, True, 0.0, 1.0)))
+        return outputs
+
+    outputs = asyncio.run(scenario())
+
+    assert [output.text for output in outputs] == ["아 시 발", "아 시  발", "아 시  발"]
+    assert [pipeline._match_keywords(output.text) for output in outputs] == [["시 발"], ["시  발"], ["시  발"]]
+    assert all(output.classification.is_harmful for output in outputs)
@@ -0,0 +1,97 @@
+"""
+/ws/audio 바이너리 결과 프로토콜 단위 테스트.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from audio.pipeline import AudioProcessingPipeline
+from audio.result_protocol import HEADER_SIZE, ResultFrame, decode_result, encode_result
+from audio.stream_session import AudioStreamSession
+
+
+def _frame(**overrides) -> ResultFrame:
+    values = dict(
+        seq=7,
+        text="야 시발 뭐해",
+        is_harmful=True,
+        confidence=0.75,
+        processing_time_ms=120.5,
+        start_sample=16_000,
+        end_sample=32_000,
+        first_frame=10,
+        last_frame=19,
+        lag_sec=0.25,
+    )
+    values.update(overrides)
+    return ResultFrame(**values)
+
+
+def test_result_frame_round_trip() -> None:
+    frame = _frame()
+
+    data = encode_result(frame)
+
+    assert len(data) == HEADER_SIZE + len(frame.text.encode("utf-8"))
+    assert decode_result(data) == frame
+
+
+def test_long_text_is_truncated_on_character_boundary() -> None:
+    data = encode_result(_frame(text="가" * 30_000, is_harmful=False))
+
+    decoded = decode_result(data)
+
+    assert decoded.text == "가" * (0xFFFF // 3)
+    assert decoded.is_harmful is False
+
+
+def test_unknown_version_is_rejected() -> None:
+    data = bytearray(encode_result(_frame()))
+    data[0] = 99
+
+    with pytest.raises(ValueError):
+        decode_result(bytes(data))
+
+
+def test_binary_session_sends_results_without_acks() -> None:
+    class FakeSTT:
+        def transcribe(self, audio: np.ndarray) -> str:
+            return "문장"
+
+    pipeline = AudioProcessingPipeline(FakeSTT(), None, sample_rate=1_000, chunk_duration_sec=1.0)
+    json_messages, binary_frames = [], []
+
+    async def send(payload):
+        json_messages.append(payload)
+
+    async def send_bytes(data):
+        binary_frames.append(data)
+
+    async def scenario():
+        session = AudioStreamSession(
+            pipeline,
+            send,
+            send_bytes=send_bytes,
+            serialize=lambda result: {},
+            protocol="binary",
+        )
+        session.start()
+        # 0.5초 메시지 4개 → 1초 청크 2개
+        for _ in range(4):
+            await session.put(np.ones(500, dtype=np.int16).tobytes())
+            await asyncio.sleep(0.01)
+        for _ in range(100):
+            if len(binary_frames) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await session.close()
+
+    asyncio.run(scenario())
+
+    assert json_messages == []  # buffering 응답 없음
+    frames = [decode_result(data) for data in binary_frames]
+    assert [frame.seq for frame in frames] == [0, 1]
+    assert [(frame.start_sample, frame.end_sample) for frame in frames] == [(0, 1_000), (1_000, 2_000)]
+    assert [(frame.first_frame, frame.last_frame) for frame in frames] == [(0, 1), (2, 3)]
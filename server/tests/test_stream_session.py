@@ -0,0 +1,124 @@
+"""
+/ws/audio 수신/처리 분리 세션 단위 테스트.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from audio.pipeline import AudioProcessingPipeline
+from audio.stream_session import AudioStreamSession
+
+SAMPLE_RATE = 1_000  # 테스트용 작은 샘플레이트 (1초 = 2,000바이트)
+
+
+class SlowSTT:
+    def __init__(self, delay_sec: float) -> None:
+        self.delay_sec = delay_sec
+        self.lengths = []
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        time.sleep(self.delay_sec)
+        self.lengths.append(len(audio))
+        return f"문장 {len(self.lengths)}"
+
+
+def _second_of_audio() -> bytes:
+    return np.ones(SAMPLE_RATE, dtype=np.int16).tobytes()
+
+
+def _run_session(stt: SlowSTT, messages: int, **session_kwargs):
+    pipeline = AudioProcessingPipeline(stt, None, sample_rate=SAMPLE_RATE, chunk_duration_sec=1.0)
+    sent = []
+
+    async def send(payload):
+        sent.append(payload)
+
+    async def scenario():
+        session = AudioStreamSession(
+            pipeline, send, serialize=lambda result: {"status": "ok", "text": result.text}, **session_kwargs
+        )
+        session.start()
+        # STT가 처리하는 속도보다 빠르게 한꺼번에 수신
+        for _ in range(messages):
+            await session.put(_second_of_audio())
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if session.lag_sec < 1.0 and session._queue.empty():
+                break
+        await asyncio.sleep(stt.delay_sec * 4)  # 마지막 STT 호출 완료 대기
+        stats = session.stats()
+        await session.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+    return sent, stats
+
+
+def test_processing_task_drains_every_ready_chunk() -> None:
+    stt = SlowSTT(delay_sec=0.01)
+
+    sent, stats = _run_session(stt, messages=5, max_lag_sec=100)
+
+    results = [payload for payload in sent if payload["status"] == "ok"]
+    assert len(results) == 5
+    assert all("lag_sec" in payload for payload in results)
+    assert stats["processed_segments"] == 5
+    assert stats["lag_events"] == 0
+
+
+def test_coalesce_merges_backlog_into_one_stt_call() -> None:
+    stt = SlowSTT(delay_sec=0.05)
+
+    sent, stats = _run_session(stt, messages=8, lag_policy="coalesce", max_lag_sec=2.0)
+
+    assert stats["coalesced_segments"] >= 1
+    assert len(stt.lengths) < 8
+    # 합쳐서 처리해도 오디오는 버리지 않는다.
+    assert sum(stt.lengths) == 8 * SAMPLE_RATE
+
+
+def test_skip_to_live_drops_backlog() -> None:
+    stt = SlowSTT(delay_sec=0.05)
+
+    sent, stats = _run_session(stt, messages=8, lag_policy="skip_to_live", max_lag_sec=2.0)
+
+    assert stats["dropped_sec"] >= 5.0
+    assert len(stt.lengths) <= 3
+    assert stats["max_lag_sec"] >= 7.0
+
+
+def test_drop_oldest_keeps_lag_bounded() -> None:
+    stt = SlowSTT(delay_sec=0.05)
+
+    sent, stats = _run_session(stt, messages=8, lag_policy="drop_oldest", max_lag_sec=3.0)
+
+    assert 4.0 <= stats["dropped_sec"] <= 5.0
+    assert len(stt.lengths) == 8 - round(stats["dropped_sec"])
+
+
+def test_async_stt_is_awaited_on_the_event_loop() -> None:
+    class AsyncSTT:
+        def __init__(self) -> None:
+            self.threads = []
+
+        def transcribe(self, audio: np.ndarray) -> str:
+            raise AssertionError("transcribe_async가 있으면 동기 transcribe는 호출하지 않는다.")
+
+        async def transcribe_async(self, audio: np.ndarray) -> str:
+            self.threads.append(threading.current_thread())
+            await asyncio.sleep(0)
+            return "문장"
+
+    stt = AsyncSTT()
+    pipeline = AudioProcessingPipeline(stt, None, sample_rate=SAMPLE_RATE, chunk_duration_sec=1.0)
+
+    async def scenario():
+        return [await pipeline.process_audio(_second_of_audio()) for _ in range(3)]
+
+    results = asyncio.run(scenario())
+
+    assert [result.text for result in results] == ["문장"] * 3
+    assert stt.threads == [threading.main_thread()] * 3
@@ -0,0 +1,55 @@
+"""
+TextNormalizer 단위 테스트.
+"""
+
+import pytest
+
+from nlp.text_normalizer import TextNormalizer
+
+
+def test_spacing_punctuation_and_jamo_variants_normalize_equally() -> None:
+    """
+    띄어쓰기/문장부호/자모 분리/전각 문자 변형이 같은 정규화 결과를 가져야 한다.
+    """
+
+    normalizer = TextNormalizer()
+    expected = normalizer.normalize("시발").text
+
+    for variant in ["시 발", "시.발", "시1발", "시  발!!"]:
+        assert normalizer.normalize(variant).text == expected, variant
+
+    assert normalizer.normalize("ＢＡＤ").text == normalizer.normalize("bad").text
+    assert normalizer.normalize("b1tch").text == normalizer.normalize("bitch").text
+    # 단독 자음은 초성으로만 취급하여 종성+초성 조합과 구분한다.
+    assert normalizer.normalize("ㅅㅂ").text not in normalizer.normalize("갓바").text
+    assert normalizer.normalize("ㅅㅂ").text in normalizer.normalize("ㅅ발").text
+
+
+def test_offsets_map_back_to_original_text() -> None:
+    """
+    정규화 텍스트의 구간이 원본 텍스트의 구간으로 되돌려져야 한다.
+    """
+
+    normalizer = TextNormalizer()
+    text = "아 시 발"
+    normalized = normalizer.normalize(text)
+    target = normalizer.normalize("시발").text
+
+    start = normalized.text.index(target)
+    begin, end = normalized.span(start, start + len(target))
+    assert text[begin:end] == "시 발"
+
+
+def test_choseong_abbreviation_variants() -> None:
+    """
+    3음절 이상 한글 키워드만 초성 약어 변형을 색인한다.
+    """
+
+    normalizer = TextNormalizer()
+
+    assert normalizer.keyword_variants("개새끼")[1] == normalizer.normalize("ㄱㅅㄲ").text
+    assert len(normalizer.keyword_variants("시발")) == 1
+    assert len(TextNormalizer(choseong_min_syllables=2).keyword_variants("시발")) == 2
+
+    with pytest.raises(ValueError):
+        TextNormalizer(choseong_min_syllables=0)
@@ -0,0 +1,31 @@
+"""
+겹치는 윈도우 STT 결과 중복 제거 단위 테스트.
+"""
+
+from audio.transcript_dedup import TranscriptDeduplicator
+
+
+def test_overlapping_prefix_is_removed() -> None:
+    dedup = TranscriptDeduplicator()
+
+    assert dedup.merge("오늘 게임 진짜") == "오늘 게임 진짜"
+    assert dedup.merge("게임 진짜 재밌다") == "재밌다"
+    assert dedup.merge("진짜 재밌다.") == ""
+
+
+def test_leading_fragment_from_window_cut_is_skipped() -> None:
+    dedup = TranscriptDeduplicator()
+
+    dedup.merge("같이 파티 하실 분")
+    # 윈도우 시작에서 잘린 '이' 조각 + 겹친 '파티 하실 분'
+    assert dedup.merge("이 파티 하실 분 구합니다") == "구합니다"
+
+
+def test_unrelated_text_is_kept() -> None:
+    dedup = TranscriptDeduplicator()
+
+    dedup.merge("안녕하세요")
+    assert dedup.merge("반갑습니다 여러분") == "반갑습니다 여러분"
+
+    dedup.reset()
+    assert dedup.merge("반갑습니다") == "반갑습니다"
@@ -0,0 +1,104 @@
+"""
+VAD/발화 단위 분할 단위 테스트.
+"""
+
+import asyncio
+
+import numpy as np
+
+from audio.pipeline import AudioProcessingPipeline
+from audio.vad import UtteranceSegmenter, VADConfig, frame_features
+
+SAMPLE_RATE = 16_000
+
+
+def _tone(seconds: float, amplitude: float = 0.3, freq: float = 220.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.float32)
+
+
+def _frame_aligned(audio: np.ndarray, frame_size: int) -> np.ndarray:
+    return audio[: len(audio) // frame_size * frame_size]
+
+
+def test_frame_features_separate_tone_noise_and_silence() -> None:
+    rng = np.random.default_rng(0)
+    audio = np.concatenate(
+        [_tone(0.03), _silence(0.03), rng.uniform(-0.3, 0.3, 480).astype(np.float32)]
+    )
+
+    energy_db, zcr = frame_features(audio, 480)
+
+    assert energy_db[0] > -15 and energy_db[1] < -150
+    assert zcr[0] < 0.1 and zcr[2] > 0.4
+
+
+def test_speech_between_silence_becomes_one_utterance() -> None:
+    segmenter = UtteranceSegmenter(sample_rate=SAMPLE_RATE)
+    audio = _frame_aligned(
+        np.concatenate([_silence(1.0), _tone(0.6), _silence(0.6)]), segmenter.frame_size
+    )
+
+    utterances = segmenter.process(audio)
+
+    assert len(utterances) == 1
+    duration = len(utterances[0].audio) / SAMPLE_RATE
+    # 음성 0.6초 + 프리롤 0.15초, 끝 무음은 잘라낸다.
+    assert 0.6 <= duration <= 0.8
+    # 절대 위치는 음성 시작(1.0초) 직전 프리롤부터
+    assert 0.8 * SAMPLE_RATE <= utterances[0].start_sample <= SAMPLE_RATE
+    assert utterances[0].end_sample == utterances[0].start_sample + len(utterances[0].audio)
+    assert segmenter.stats()["utterances"] == 1
+
+
+def test_silence_and_short_clicks_are_dropped() -> None:
+    segmenter = UtteranceSegmenter(sample_rate=SAMPLE_RATE)
+    click = _tone(0.03, amplitude=0.8)
+    audio = _frame_aligned(
+        np.concatenate([_silence(1.0), click, _silence(1.0)]), segmenter.frame_size
+    )
+
+    assert segmenter.process(audio) == []
+    assert segmenter.flush() == []
+
+
+def test_long_speech_is_split_at_max_length() -> None:
+    segmenter = UtteranceSegmenter(VADConfig(max_utterance_sec=1.0), sample_rate=SAMPLE_RATE)
+    audio = _frame_aligned(_tone(2.5), segmenter.frame_size)
+
+    utterances = segmenter.process(audio) + segmenter.flush()
+
+    assert len(utterances) == 3
+    assert all(len(u.audio) <= SAMPLE_RATE for u in utterances)
+    # 최대 길이로 잘린 발화는 끊김 없이 이어진다.
+    assert utterances[1].start_sample == utterances[0].end_sample
+
+
+def test_pipeline_only_transcribes_speech() -> None:
+    calls = []
+
+    class FakeSTT:
+        def transcribe(self, audio: np.ndarray) -> str:
+            calls.append(len(audio))
+            return "안녕하세요"
+
+    pipeline = AudioProcessingPipeline(FakeSTT(), None, vad_config=VADConfig())
+    stream = np.concatenate([_silence(2.0), _tone(0.8), _silence(2.0)])
+    pcm = (stream * 32767).astype(np.int16)
+
+    async def run():
+        outputs = []
+        for start in range(0, len(pcm), 1600):  # 100ms 단위 전송
+            result = await pipeline.process_audio(pcm[start:start + 1600].tobytes())
+            if result is not None:
+                outputs.append(result)
+        return outputs
+
+    outputs = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert len(outputs) == 1 and outputs[0].text == "안녕하세요"
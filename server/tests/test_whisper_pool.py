@@ -0,0 +1,181 @@
+"""
+WhisperReplicaPool (복제본 풀 + 세션별 라운드 로빈 대기열) 테스트.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+
+from audio.whisper_pool import WhisperReplicaPool
+from audio.whisper_service import WhisperSTTService
+
+
+class SlowModel:
+    """입력 첫 샘플 값을 텍스트로 돌려주고, 실행 순서를 기록하는 모델."""
+
+    def __init__(self, log, lock) -> None:
+        self.log = log
+        self.lock = lock
+
+    def transcribe(self, audio, *, language, fp16):
+        with self.lock:
+            self.log.append(int(audio[0]))
+        time.sleep(0.02)
+        return {"text": str(int(audio[0]))}
+
+
+def _pool(count: int):
+    log = []
+    lock = threading.Lock()
+    pool = WhisperReplicaPool.load(
+        count,
+        lambda: WhisperSTTService(
+            model_name="base", decode_mode="transcribe", model_loader=lambda _: SlowModel(log, lock)
+        ),
+    )
+    return pool, log
+
+
+def _audio(value: int) -> np.ndarray:
+    return np.full(16, value, dtype=np.float32)
+
+
+def test_busy_pool_serves_waiting_sessions_round_robin() -> None:
+    pool, log = _pool(1)
+    noisy = pool.for_session("noisy")
+    quiet = pool.for_session("quiet")
+
+    async def scenario():
+        # noisy 세션이 먼저 요청 3개를 몰아서 보낸 뒤 quiet 세션이 하나를 보낸다.
+        tasks = [asyncio.create_task(noisy.transcribe_async(_audio(value))) for value in (1, 2, 3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(quiet.transcribe_async(_audio(9))))
+        results = await asyncio.gather(*tasks)
+        await pool.aclose()
+        return results
+
+    assert asyncio.run(scenario()) == ["1", "2", "3", "9"]
+    # quiet 세션의 요청은 noisy 세션의 밀린 요청들 뒤가 아니라 사이에 배정된다.
+    assert log == [1, 2, 9, 3]
+    stats = pool.stats()
+    assert stats["requests"] == 4
+    assert stats["queued"] == 0 and stats["busy_replicas"] == 0
+    assert stats["max_wait_ms"] > 0
+
+
+def test_replicas_decode_concurrently() -> None:
+    pool, log = _pool(2)
+
+    async def scenario():
+        observed = []
+        tasks = [
+            asyncio.create_task(pool.for_session(index).transcribe_async(_audio(index)))
+            for index in range(4)
+        ]
+        await asyncio.sleep(0)
+        observed.append(pool.stats())
+        await asyncio.gather(*tasks)
+        await pool.aclose()
+        return observed[0]
+
+    started = time.monotonic()
+    busy = asyncio.run(scenario())
+    elapsed = time.monotonic() - started
+
+    assert busy["replicas"] == 2
+    assert busy["busy_replicas"] == 2 and busy["queued"] == 2
+    assert sorted(log) == [0, 1, 2, 3]
+    # 복제본마다 요청 2개씩 → 직렬 실행(4 × 20ms)보다 빨리 끝난다.
+    assert elapsed < 0.08 + 0.05
+    assert [replica.requests for replica in pool.replicas] == [2, 2]
+
+
+def test_cancelled_request_is_not_dispatched() -> None:
+    pool, log = _pool(1)
+
+    async def scenario():
+        first = asyncio.create_task(pool.transcribe_async(_audio(1), session="a"))
+        dropped = asyncio.create_task(pool.transcribe_async(_audio(2), session="b"))
+        await asyncio.sleep(0)
+        # 대기 중인 세션이 끊긴 경우
+        dropped.cancel()
+        result = await first
+        await asyncio.sleep(0.05)
+        await pool.aclose()
+        return result
+
+    assert asyncio.run(scenario()) == "1"
+    assert log == [1]
+    assert pool.stats()["queued"] == 0
+
+
+class BatchRecordingReplica:
+    """transcribe_batch_async로 받은 배치 구성을 기록하는 복제본 대역."""
+
+    model_name = "base"
+    decode_mode = "fast"
+    busy_sec = 0.0
+    audio_sec = 0.0
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def transcribe_async(self, audio):
+        return (await self.transcribe_batch_async([audio]))[0]
+
+    async def transcribe_batch_async(self, audios):
+        self.batches.append([int(audio[0]) for audio in audios])
+        await asyncio.sleep(0.02)
+        return [str(int(audio[0])) for audio in audios]
+
+    async def aclose(self) -> None:
+        pass
+
+
+def test_requests_from_sessions_are_batched_within_window() -> None:
+    replica = BatchRecordingReplica()
+    pool = WhisperReplicaPool([replica], max_batch=3, batch_window_ms=30)
+
+    async def scenario():
+        first = asyncio.create_task(pool.transcribe_async(_audio(1), session="a"))
+        await asyncio.sleep(0.005)
+        # 창 안에 도착한 다른 세션의 발화는 같은 배치로 묶인다.
+        rest = [
+            asyncio.create_task(pool.transcribe_async(_audio(value), session=session))
+            for value, session in ((2, "a"), (3, "b"), (4, "c"))
+        ]
+        results = await asyncio.gather(first, *rest)
+        await pool.aclose()
+        return results
+
+    assert asyncio.run(scenario()) == ["1", "2", "3", "4"]
+    # 요청 3개가 모이면 창을 기다리지 않고 바로 보내며, 세션 사이에서는 라운드 로빈으로 고른다.
+    assert replica.batches == [[1, 3, 2], [4]]
+    stats = pool.stats()
+    assert stats["avg_batch"] == 2.0
+    assert stats["max_wait_ms"] < 30 + 25
+
+
+def test_threads_per_replica_applies_only_to_inference_threads(monkeypatch) -> None:
+    calls = []
+    fake_torch = types.ModuleType("torch")
+    fake_torch.set_num_threads = lambda count: calls.append((threading.current_thread().name, count))
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    pool = WhisperReplicaPool.load(
+        2,
+        lambda: WhisperSTTService(model_name="base", decode_mode="transcribe", model_loader=lambda _: object()),
+        threads_per_replica=3,
+    )
+    asyncio.run(pool.aclose())
+
+    # 로더를 호출한 스레드(분류기 등과 공유)가 아니라 복제본마다 전용 추론 스레드에서 설정된다.
+    assert [count for _, count in calls] == [3, 3]
+    assert all(name.startswith("whisper-base") for name, _ in calls)
+    assert threading.current_thread().name not in {name for name, _ in calls}
@@ -4,8 +4,11 @@ Phase 2: WhisperSTTService 단위 테스트.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import sys
+import threading
+import time
 import types
 from typing import Any, Dict
 
@@ -83,3 +86,138 @@ def test_whisper_service_custom_loader(monkeypatch):
     output = service.transcribe(np.ones(4, dtype=np.float32))
     assert output == "테스트"
 
+
+def test_transcribe_async_runs_on_dedicated_inference_thread():
+    """
+    transcribe_async는 서비스 전용 스레드에서 한 번에 하나씩 디코딩한다.
+    """
+
+    class RecordingModel:
+        def __init__(self) -> None:
+            self.threads = set()
+            self.running = 0
+            self.max_running = 0
+
+        def transcribe(self, audio, *, language, fp16):
+            self.threads.add(threading.current_thread().name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            time.sleep(0.01)
+            self.running -= 1
+            return {"text": "테스트"}
+
+    model = RecordingModel()
+    module = importlib.import_module("audio.whisper_service")
+    importlib.reload(module)
+    service = module.WhisperSTTService(model_name="base", model_loader=lambda _: model)
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(service.transcribe_async(np.ones(4, dtype=np.float32)) for _ in range(3))
+        )
+        await service.aclose()
+        return results
+
+    assert asyncio.run(scenario()) == ["테스트"] * 3
+    assert model.max_running == 1
+    assert len(model.threads) == 1 and next(iter(model.threads)).startswith("whisper-base")
+    assert service.stats()["requests"] == 3
+    assert service.stats()["pending"] == 0
+
+
+def _install_fake_fast_whisper(monkeypatch, *, no_speech_prob: float = 0.0):
+    """
+    fast 디코딩에 필요한 whisper.decode / log_mel_spectrogram / DecodingOptions 를 가진 가짜 모듈.
+    """
+
+    calls = {"mel_inputs": [], "options": [], "transcribe": 0}
+
+    class FakeModel:
+        dims = types.SimpleNamespace(n_mels=80)
+        device = "cpu"
+
+        def transcribe(self, audio, *, language, fp16):
+            calls["transcribe"] += 1
+            return {"text": "긴 오디오"}
+
+    def log_mel_spectrogram(audio, n_mels, device=None):
+        calls["mel_inputs"].append(np.array(audio))
+        return ("mel", n_mels)
+
+    def decode(model, mel, options):
+        calls["options"].append(options)
+        return types.SimpleNamespace(text=" 짧은 발화 ", no_speech_prob=no_speech_prob, avg_logprob=-1.5)
+
+    fake_module = types.SimpleNamespace(
+        load_model=lambda name: FakeModel(),
+        log_mel_spectrogram=log_mel_spectrogram,
+        DecodingOptions=lambda **kwargs: types.SimpleNamespace(**kwargs),
+        decode=decode,
+    )
+    monkeypatch.setitem(sys.modules, "whisper", fake_module)
+    module = importlib.import_module("audio.whisper_service")
+    importlib.reload(module)
+    return module, calls
+
+
+def test_fast_decode_uses_single_greedy_decode_and_reports_rtf(monkeypatch):
+    module, calls = _install_fake_fast_whisper(monkeypatch)
+    service = module.WhisperSTTService(model_name="base")
+
+    assert service.decode_mode == "fast"
+    assert service.transcribe(np.full(32_000, 0.5, dtype=np.float32)) == "짧은 발화"
+    assert service.transcribe(np.full(16_000, 0.25, dtype=np.float32)) == "짧은 발화"
+
+    assert calls["transcribe"] == 0
+    first, second = calls["mel_inputs"]
+    # 항상 30초 창으로 패딩하고, 이전 호출의 꼬리는 0으로 지운다.
+    assert first.shape == second.shape == (480_000,)
+    assert np.all(second[:16_000] == 0.25) and np.all(second[16_000:] == 0.0)
+    options = calls["options"][1]
+    assert options.temperature == 0.0 and options.without_timestamps
+    assert options.sample_len == 16 + 15
+    stats = service.stats()
+    assert stats["requests"] == 2
+    assert stats["audio_sec"] == pytest.approx(3.0)
+    assert stats["rtf"] is not None and stats["last_rtf"] is not None
+
+
+def test_fast_decode_drops_no_speech_and_falls_back_for_long_audio(monkeypatch):
+    module, calls = _install_fake_fast_whisper(monkeypatch, no_speech_prob=0.9)
+    service = module.WhisperSTTService(model_name="base")
+
+    assert service.transcribe(np.full(16_000, 0.1, dtype=np.float32)) == ""
+    # 30초를 넘는 오디오는 model.transcribe의 구간 탐색을 그대로 사용한다.
+    assert service.transcribe(np.full(31 * 16_000, 0.1, dtype=np.float32)) == "긴 오디오"
+    assert calls["transcribe"] == 1
+
+
+def test_fast_batch_decode_stacks_mels_into_one_decode(monkeypatch):
+    module, calls = _install_fake_fast_whisper(monkeypatch)
+    monkeypatch.setitem(sys.modules, "torch", types.SimpleNamespace(stack=lambda mels: list(mels)))
+    batches = []
+
+    def decode(model, mels, options):
+        batches.append((mels, options))
+        return [
+            types.SimpleNamespace(text=f" 발화{index} ", no_speech_prob=0.9 if index == 1 else 0.0, avg_logprob=-1.5)
+            for index in range(len(mels))
+        ]
+
+    sys.modules["whisper"].decode = decode
+    service = module.WhisperSTTService(model_name="base")
+
+    audios = [np.full(16_000, 0.1, dtype=np.float32), np.zeros(8_000, dtype=np.float32), np.full(48_000, 0.2, dtype=np.float32)]
+    assert service.transcribe_batch(audios) == ["발화0", "", "발화2"]
+
+    assert len(batches) == 1
+    mels, options = batches[0]
+    assert len(mels) == 3
+    # 최대 토큰 수는 가장 긴 발화(3초) 기준
+    assert options.sample_len == 16 + 45
+    # 발화마다 같은 패딩 버퍼에서 앞부분만 덮어쓰고 나머지는 0으로 지운다.
+    assert all(mel.shape == (480_000,) for mel in calls["mel_inputs"])
+    assert np.all(calls["mel_inputs"][1] == 0.0)
+    stats = service.stats()
+    assert stats["requests"] == 3 and stats["batches"] == 1
+    assert stats["audio_sec"] == pytest.approx(4.5)
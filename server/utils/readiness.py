@@ -0,0 +1,177 @@
+"""
+모델 컴포넌트 병렬 지연 로딩 및 준비 상태 관리.
+
+STT/분류기/OCR 모델을 서버 기동과 동시에 각각의 작업 스레드에서 병렬로 로드하고,
+엔드포인트는 필요한 컴포넌트만 기다리거나(wait) 준비 상태를 확인한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_LOADING = "loading"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class ComponentState:
+    """컴포넌트 하나의 로딩 상태."""
+
+    name: str
+    status: str = STATUS_PENDING
+    load_time_ms: Optional[float] = None
+    error: Optional[str] = None
+    value: Any = None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "load_time_ms": round(self.load_time_ms, 1) if self.load_time_ms is not None else None,
+            "error": self.error,
+        }
+
+
+class ComponentRegistry:
+    """
+    이름별 컴포넌트 로더를 병렬 실행하고 준비 상태를 추적한다.
+    """
+
+    def __init__(self) -> None:
+        self._states: Dict[str, ComponentState] = {}
+        self._done: Dict[str, asyncio.Event] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # 종료로 취소되었지만 작업 스레드에서 아직 로딩 중인 (이름, 로딩 future, dispose)
+        self._abandoned: List[Tuple[str, "asyncio.Future[Any]", Callable[[Any], Any]]] = []
+
+    def start(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        *,
+        on_ready: Optional[Callable[[Any], Awaitable[None]]] = None,
+        dispose: Optional[Callable[[Any], Any]] = None,
+    ) -> asyncio.Task:
+        """
+        loader를 작업 스레드에서 실행하는 백그라운드 태스크를 시작한다.
+
+        Args:
+            name: 컴포넌트 이름
+            loader: 동기 로더 (실패 시 예외 발생)
+            on_ready: 로드 성공 후 이벤트 루프에서 호출할 콜백 (전역 변수 설정 등)
+            dispose: 로딩 중에 종료된 경우, 로딩이 끝나 만들어진 값을 정리하는 함수 (작업자 프로세스 종료 등)
+        """
+
+        state = ComponentState(name=name)
+        self._states[name] = state
+        self._done[name] = asyncio.Event()
+        task = asyncio.create_task(self._load(state, loader, on_ready, dispose))
+        self._tasks[name] = task
+        return task
+
+    async def _load(
+        self,
+        state: ComponentState,
+        loader: Callable[[], Any],
+        on_ready: Optional[Callable[[Any], Awaitable[None]]],
+        dispose: Optional[Callable[[Any], Any]],
+    ) -> None:
+        state.status = STATUS_LOADING
+        start = time.perf_counter()
+        # 작업 스레드는 취소할 수 없으므로 로딩 future는 태스크 취소와 분리해 둔다.
+        load = asyncio.ensure_future(asyncio.to_thread(loader))
+        try:
+            value = await asyncio.shield(load)
+            if on_ready is not None:
+                await on_ready(value)
+        except asyncio.CancelledError:
+            if dispose is not None:
+                self._abandoned.append((state.name, load, dispose))
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            state.status = STATUS_FAILED
+            state.error = str(exc)
+            logger.error("Component '%s' failed to load: %s", state.name, exc, exc_info=True)
+        else:
+            state.value = value
+            state.status = STATUS_READY
+            logger.info("✅ Component '%s' ready", state.name)
+        finally:
+            state.load_time_ms = (time.perf_counter() - start) * 1000
+            logger.info("Component '%s' load finished in %.1fms", state.name, state.load_time_ms)
+            self._done[state.name].set()
+
+    def get(self, name: str) -> Any:
+        """준비된 컴포넌트 값을 반환한다. (준비되지 않았으면 None)"""
+
+        state = self._states.get(name)
+        return state.value if state is not None and state.status == STATUS_READY else None
+
+    def is_ready(self, name: str) -> bool:
+        state = self._states.get(name)
+        return state is not None and state.status == STATUS_READY
+
+    def state(self, name: str) -> Optional[ComponentState]:
+        return self._states.get(name)
+
+    async def wait(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        컴포넌트 로딩이 끝날 때까지 최대 timeout초 기다린다.
+
+        Returns:
+            준비된 값. 로딩 실패, 미등록, 타임아웃이면 None
+        """
+
+        event = self._done.get(name)
+        if event is None:
+            return None
+        if not event.is_set():
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.get(name)
+
+    def all_ready(self) -> bool:
+        return bool(self._states) and all(
+            state.status == STATUS_READY for state in self._states.values()
+        )
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {name: state.describe() for name, state in self._states.items()}
+
+    async def shutdown(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        종료 시 아직 진행 중인 로딩 태스크를 취소한다.
+
+        작업 스레드 자체는 중단되지 않으므로, dispose가 지정된 컴포넌트는 로딩이 끝날 때까지
+        최대 timeout초 기다린 뒤 만들어진 값을 dispose로 정리한다.
+        """
+
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+        abandoned, self._abandoned = self._abandoned, []
+        for name, load, dispose in abandoned:
+            try:
+                value = await asyncio.wait_for(load, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Component '%s' still loading after %.1fs at shutdown; not disposed", name, timeout)
+                continue
+            except Exception:  # pylint: disable=broad-except
+                continue  # 로딩 실패 → 정리할 값이 없다.
+            try:
+                dispose(value)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("Failed to dispose component '%s': %s", name, exc)
+            else:
+                logger.info("Component '%s' disposed after loading during shutdown", name)
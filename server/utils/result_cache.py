@@ -0,0 +1,122 @@
+"""
+텍스트 분석 결과용 크기/TTL 제한 LRU 캐시.
+
+OCR은 프레임마다 같은 채팅 줄을, STT는 짧은 문구를 반복해서 돌려주므로
+키워드 매칭/분류기 결과를 (정규화 텍스트, 사전/모델 버전) 키로 재사용한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def cache_text_key(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화 (양끝 공백 제거 + 연속 공백 축약).
+
+    공백 수에 결과가 달라지지 않는 분석(분류기: 토크나이저가 공백으로 단어를 나눈다)의 키에만 쓰고,
+    분석 자체는 원본 텍스트로 한다. 키워드 매칭은 원본에 나타난 실제 표기("시  발" 등)를
+    돌려주므로 원본 텍스트를 그대로 키로 쓴다.
+    """
+
+    return " ".join(text.split())
+
+
+class ResultCache:
+    """
+    스레드 안전한 LRU + TTL 캐시.
+
+    max_size를 넘으면 가장 오래 사용되지 않은 항목을, ttl_sec이 지난 항목은 조회 시 제거한다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl_sec: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_size: 최대 항목 수 (0이면 캐시 비활성화)
+            ttl_sec: 항목 유효 시간 (초, 0 이하이면 만료 없음)
+            clock: 시간 함수 (테스트용 주입 가능)
+        """
+
+        if max_size < 0:
+            raise ValueError("max_size must not be negative.")
+
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값을 반환한다. 없거나 만료되었으면 None을 반환한다.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl_sec > 0 and self._clock() - stored_at > self.ttl_sec:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        값을 저장한다. None은 '없음'과 구분할 수 없으므로 저장하지 않는다.
+        """
+
+        if value is None or self.max_size == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 크기 조정을 위한 카운터를 반환한다.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }